@@ -0,0 +1,31 @@
+"""
+Helpers shared by the benchmark scripts.
+
+Importing this module puts src/ on sys.path, so the pipeline modules can be
+imported after it.
+"""
+
+import os
+import sys
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+
+def best_of(func, repeat):
+    """
+    Args:
+        func (callable): Function to time, called without arguments.
+        repeat (int): Number of timed calls.
+
+    Returns:
+        float: The fastest call, in seconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
@@ -0,0 +1,113 @@
+"""
+Benchmarks per-cell clean_text calls against the vectorized clean_column,
+first on single columns, then on whole fixture stats tables (the old per-row
+record building loop vs get_data._clean_table).
+
+Usage:
+    python benchmarks/bench_clean.py [--rows 1000 100000] [--scale 1 10] [--repeat 3]
+"""
+
+import argparse
+import random
+
+from _common import best_of
+
+import pandas as pd
+from pandas.testing import assert_frame_equal
+from clean_data import clean_column, clean_text
+from fixtures import build_pages
+from get_data import _clean_table
+from page_schema import PAGE_SCHEMAS, apply_schema, resolve_columns
+from table_extract import extract_table
+
+
+def raw_values(rows, data_type, seed=0):
+    """
+    Generates raw cell strings like those on the stats pages: thousands
+    separators, footnote annotations, blanks and the occasional junk cell.
+    """
+    rng = random.Random(seed)
+    values = []
+    for _ in range(rows):
+        roll = rng.random()
+        if roll < 0.05:
+            values.append("")
+        elif roll < 0.07:
+            values.append("--")
+        elif data_type is float:
+            values.append(f"{rng.uniform(0, 120):.1f}")
+        else:
+            number = f"{rng.randint(-50, 6000):,}"
+            values.append(f"{number}[1]" if roll > 0.97 else number)
+    return values
+
+
+def clean_rows(table, page_type):
+    """
+    The per-row path _clean_table replaced: one clean_text call per cell and
+    one record dict per row.
+    """
+    index = resolve_columns(page_type, table)
+    last_column = max(index.values(), default=-1)
+    records = []
+    for i, width in enumerate(table.widths):
+        if width <= last_column:
+            continue
+        record = {}
+        for field in PAGE_SCHEMAS[page_type]:
+            value = table.columns[index[field.name]][i] if field.name in index else None
+            value = clean_text(value, field.dtype) if value is not None else None
+            record[field.name] = field.default if value is None else value
+        records.append(record)
+    return pd.DataFrame(records)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 100000])
+    parser.add_argument("--scale", type=int, nargs="+", default=[1, 10])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'type':<8}{'rows':>10}{'clean_text ms':>16}{'clean_column ms':>18}{'speedup':>10}")
+    for rows in args.rows:
+        for data_type in (int, float):
+            values = raw_values(rows, data_type)
+
+            # Same null semantics: missing exactly where clean_text returns None
+            expected = pd.Series([clean_text(v, data_type) for v in values], dtype="object")
+            actual = pd.Series(clean_column(values, data_type), dtype="object")
+            assert (expected.isna() == actual.isna()).all()
+            assert (expected[expected.notna()] == actual[actual.notna()]).all()
+
+            per_cell = best_of(lambda: [clean_text(v, data_type) for v in values], args.repeat)
+            vectorized = best_of(lambda: clean_column(values, data_type), args.repeat)
+            print(
+                f"{data_type.__name__:<8}{rows:>10}{per_cell * 1000:>16.2f}"
+                f"{vectorized * 1000:>18.2f}{per_cell / vectorized:>9.1f}x"
+            )
+
+    print()
+    print(f"{'page':<28}{'scale':>6}{'rows':>8}{'per-row ms':>13}{'columnar ms':>14}{'speedup':>10}")
+    for scale in args.scale:
+        for path, html in build_pages(scale=scale).items():
+            page_type = path.rsplit("/", 1)[-1].replace(".htm", "")
+            if page_type not in PAGE_SCHEMAS:
+                continue
+            table = extract_table(html, table_class="stats_table")
+
+            # Both sides in the storage types (e.g. Float32 ratings), compared to float32 precision
+            expected = apply_schema(clean_rows(table, page_type))
+            actual = _clean_table(table, page_type, path)[list(expected.columns)]
+            assert_frame_equal(expected, actual, check_exact=False, rtol=1e-6)
+
+            per_row = best_of(lambda: clean_rows(table, page_type), args.repeat)
+            columnar = best_of(lambda: _clean_table(table, page_type, path), args.repeat)
+            print(
+                f"{path:<28}{scale:>6}{len(table):>8}{per_row * 1000:>13.2f}"
+                f"{columnar * 1000:>14.2f}{per_row / columnar:>9.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
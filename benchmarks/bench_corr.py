@@ -0,0 +1,85 @@
+"""
+Compares the per-year mask + select_dtypes + DataFrame.corr loop with
+analyze_data.grouped_correlation on synthetic multi-season datasets.
+
+Usage:
+    python benchmarks/bench_corr.py [--seasons 10 50 200] [--rows 40] [--missing 0.05] [--repeat 3]
+"""
+
+import argparse
+
+from _common import best_of
+
+import numpy as np
+import pandas as pd
+from analyze_data import correlation_analysis
+
+METRICS = [
+    "Games Played",
+    "Passing Yards",
+    "Passing TDs",
+    "Interceptions",
+    "Rating",
+    "4QC",
+    "GWD",
+    "Rushing Yards",
+    "Rushing TDs",
+    "Total Yards",
+    "Total TDs",
+    "Passing TD to INT Ratio",
+]
+
+
+def synthetic_data(seasons, rows, missing=0.05, seed=0):
+    """
+    Builds a combined-stats-like DataFrame with `rows` QBs per season and a
+    fraction of missing values in the float metrics.
+    """
+    rng = np.random.default_rng(seed)
+    n = seasons * rows
+    data = pd.DataFrame(rng.normal(size=(n, len(METRICS))), columns=METRICS)
+    data[METRICS[:7]] = data[METRICS[:7]].mask(rng.random((n, 7)) < missing)
+    data.insert(0, "Name", [f"QB {i}" for i in range(n)])
+    data["Year"] = np.repeat(np.arange(2024 - seasons, 2024), rows)
+    data["Playoff Status"] = rng.choice(["Playoff", "Eliminated"], n)
+    return data.sample(frac=1, random_state=seed).reset_index(drop=True)
+
+
+def loop_correlation(data, method="pearson"):
+    correlation_by_year = {}
+    for year in data["Year"].unique():
+        yearly_data = data[data["Year"] == year].select_dtypes(include=["float", "int"])
+        if not yearly_data.empty:
+            correlation_by_year[year] = yearly_data.corr(method=method)
+    return correlation_by_year
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seasons", type=int, nargs="+", default=[10, 50, 200])
+    parser.add_argument("--rows", type=int, default=40)
+    parser.add_argument("--missing", type=float, default=0.05, help="Fraction of missing values")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'method':<10}{'seasons':>8}{'rows':>8}{'loop ms':>10}{'grouped ms':>12}{'speedup':>10}")
+    for method in ("pearson", "spearman"):
+        for seasons in args.seasons:
+            data = synthetic_data(seasons, args.rows, args.missing)
+
+            expected = loop_correlation(data, method)
+            actual = correlation_analysis(data, method)
+            assert list(expected) == list(actual)
+            for year in expected:
+                pd.testing.assert_frame_equal(expected[year], actual[year], rtol=1e-10, atol=1e-12)
+
+            loop = best_of(lambda: loop_correlation(data, method), args.repeat)
+            grouped = best_of(lambda: correlation_analysis(data, method), args.repeat)
+            print(
+                f"{method:<10}{seasons:>8}{len(data):>8}{loop * 1000:>10.2f}"
+                f"{grouped * 1000:>12.2f}{loop / grouped:>9.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Write time, read time and file size of the combined QB stats in every
+export_csv format, on a multi-season dataset built by repeating the snapshot
+seasons.
+
+Usage:
+    python benchmarks/bench_export.py [--seasons 3 500] [--repeat 3]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+
+from _common import best_of
+
+import pandas as pd
+from bench_memory import multi_season
+from export_csv import FORMATS, export_frame, read_frame
+from page_schema import apply_schema
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seasons", type=int, nargs="+", default=[3, 500])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for seasons in args.seasons:
+        df = apply_schema(multi_season(seasons))
+        print(f"{seasons} seasons, {len(df)} rows")
+        print(f"{'format':>10}{'write ms':>10}{'read ms':>10}{'KiB':>9}")
+        with tempfile.TemporaryDirectory() as tmp:
+            expected = None
+            for fmt, extension in FORMATS.items():
+                path = os.path.join(tmp, "combined" + extension)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    write = best_of(lambda: export_frame(df, path, manifest=None), args.repeat)
+                # Read only this format, as read_frame would when it is the newest
+                for other in FORMATS.values():
+                    if other != extension and os.path.exists(os.path.join(tmp, "combined" + other)):
+                        os.remove(os.path.join(tmp, "combined" + other))
+                loaded = read_frame(path, manifest=None)
+                if expected is None:
+                    expected = loaded
+                pd.testing.assert_frame_equal(loaded, expected)
+                read = best_of(lambda: read_frame(path, manifest=None), args.repeat)
+                size = os.path.getsize(path) / 1024
+                print(f"{fmt:>10}{write * 1000:>10.1f}{read * 1000:>10.1f}{size:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
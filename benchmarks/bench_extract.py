@@ -0,0 +1,61 @@
+"""
+Compares the table extraction backends on fixture season pages.
+
+Usage:
+    python benchmarks/bench_extract.py [--scale 1 10] [--repeat 5]
+"""
+
+import argparse
+
+from _common import best_of
+
+from fixtures import build_pages
+from table_extract import BACKENDS, extract_table
+
+TARGETS = {
+    "passing": {"table_class": "stats_table"},
+    "rushing": {"table_class": "stats_table"},
+    "standings": {"table_id": "AFC"},
+}
+
+
+def _page_type(path):
+    if path.endswith("passing.htm"):
+        return "passing"
+    if path.endswith("rushing.htm"):
+        return "rushing"
+    return "standings"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", type=int, nargs="+", default=[1, 10])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'page':<28}{'scale':>6}{'KB':>8}" + "".join(f"{b + ' ms':>12}" for b in BACKENDS) + f"{'speedup':>10}")
+    for scale in args.scale:
+        pages = build_pages(scale=scale)
+        for path, html in pages.items():
+            content = html.encode("utf-8")
+            target = TARGETS[_page_type(path)]
+
+            # Every backend must produce the same columns as the reference bs4 path
+            reference = extract_table(content, backend="bs4", **target)
+            timings = {}
+            for backend in BACKENDS:
+                table = extract_table(content, backend=backend, **target)
+                assert table.columns == reference.columns, f"{backend} differs on {path}"
+                assert table.th == reference.th, f"{backend} differs on {path}"
+                timings[backend] = best_of(
+                    lambda: extract_table(content, backend=backend, **target), args.repeat
+                )
+            print(
+                f"{path:<28}{scale:>6}{len(content) / 1024:>8.0f}"
+                + "".join(f"{timings[b] * 1000:>12.2f}" for b in BACKENDS)
+                + f"{timings['bs4'] / timings['stream']:>9.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Scaling benchmark for the rushing-stage QB filter: the old list membership
+test against get_data.filter_rush_to_passers on synthetic tables.
+
+Usage:
+    python benchmarks/bench_filter.py [--rows 1000 5000 20000 100000] [--repeat 3]
+"""
+
+import argparse
+import random
+
+from _common import best_of
+
+import pandas as pd
+from get_data import filter_rush_to_passers
+
+# The list scan is quadratic; larger tables only run the set filter
+LIST_SCAN_MAX_ROWS = 20000
+
+
+def synthetic_stats(rows, seed=0):
+    """
+    Builds rushing stats with `rows` players and passing stats for a tenth of
+    them. One in fifty passers shares a name with a different rusher.
+    """
+    rng = random.Random(seed)
+    ids = [f"Play{i:06d}" for i in range(rows)]
+    names = [f"Player {i}" for i in range(rows)]
+    rush = pd.DataFrame({"Name": names, "Player ID": ids})
+
+    passers = rng.sample(range(rows), max(rows // 10, 1))
+    passing = pd.DataFrame(
+        {
+            "Name": [names[i] if n % 50 else names[(i + 1) % rows] for n, i in enumerate(passers)],
+            "Player ID": [ids[i] for i in passers],
+        }
+    )
+    return rush, passing
+
+
+def list_scan(rush, passing):
+    qb_names = passing["Name"].tolist()
+    return [name in qb_names for name in rush["Name"]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 5000, 20000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8}{'passers':>9}{'list scan ms':>14}{'set filter ms':>15}{'speedup':>10}")
+    for rows in args.rows:
+        rush, passing = synthetic_stats(rows)
+
+        # Matching on player ID keeps every passer and no same-name rusher
+        mask = filter_rush_to_passers(rush, passing)
+        assert set(rush.loc[mask, "Player ID"]) == set(passing["Player ID"])
+
+        fast = best_of(lambda: filter_rush_to_passers(rush, passing), args.repeat)
+        if rows <= LIST_SCAN_MAX_ROWS:
+            slow = best_of(lambda: list_scan(rush, passing), args.repeat)
+            slow_text, speedup = f"{slow * 1000:>14.2f}", f"{slow / fast:>9.1f}x"
+        else:
+            slow_text, speedup = f"{'-':>14}", f"{'-':>10}"
+        print(f"{rows:>8}{len(passing):>9}{slow_text}{fast * 1000:>15.2f}{speedup}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Compares a per-metric Python resampling loop with the batched permutation
+and bootstrap engine in analyze_data on synthetic playoff / eliminated groups.
+
+Usage:
+    python benchmarks/bench_hypothesis.py [--rows 90 1000] [--resamples 1000 10000] [--repeat 3]
+"""
+
+import argparse
+
+from _common import best_of
+
+import numpy as np
+from analyze_data import TEST_METRICS, bootstrap_intervals, permutation_pvalues
+
+# The Python loop is only timed up to this many resamples x rows
+LOOP_MAX_WORK = 2_000_000
+
+
+def synthetic_groups(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    n_a = rows * 4 // 9
+    playoff = rng.normal(0.3, 1, size=(n_a, len(TEST_METRICS)))
+    eliminated = rng.normal(0.0, 1, size=(rows - n_a, len(TEST_METRICS)))
+    return playoff, eliminated
+
+
+def loop_resampling(playoff, eliminated, n_resamples, seed=0):
+    """
+    The straightforward version: one metric at a time, one resample at a time.
+    """
+    rng = np.random.default_rng(seed)
+    n_a = len(playoff)
+    for m in range(playoff.shape[1]):
+        a, b = playoff[:, m], eliminated[:, m]
+        pooled = np.concatenate([a, b])
+        observed = abs(a.mean() - b.mean())
+        extreme = 0
+        diffs = []
+        for _ in range(n_resamples):
+            shuffled = rng.permutation(pooled)
+            extreme += abs(shuffled[:n_a].mean() - shuffled[n_a:].mean()) >= observed
+            diffs.append(rng.choice(a, len(a)).mean() - rng.choice(b, len(b)).mean())
+        np.percentile(diffs, [2.5, 97.5])
+
+
+def batched_resampling(playoff, eliminated, n_resamples):
+    permutation_pvalues(playoff, eliminated, n_resamples, seed=0)
+    bootstrap_intervals(playoff, eliminated, n_resamples, seed=0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[90, 1000])
+    parser.add_argument("--resamples", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>6}{'resamples':>11}{'loop ms':>12}{'batched ms':>12}{'speedup':>10}")
+    for rows in args.rows:
+        playoff, eliminated = synthetic_groups(rows)
+        for n_resamples in args.resamples:
+            batched = best_of(lambda: batched_resampling(playoff, eliminated, n_resamples), args.repeat)
+            if n_resamples * rows <= LOOP_MAX_WORK:
+                loop = best_of(lambda: loop_resampling(playoff, eliminated, n_resamples), 1)
+                loop_text, speedup = f"{loop * 1000:>12.1f}", f"{loop / batched:>9.1f}x"
+            else:
+                loop_text, speedup = f"{'-':>12}", f"{'-':>10}"
+            print(f"{rows:>6}{n_resamples:>11}{loop_text}{batched * 1000:>12.1f}{speedup}")
+
+
+if __name__ == "__main__":
+    main()
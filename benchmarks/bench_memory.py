@@ -0,0 +1,56 @@
+"""
+Bytes per row of the combined QB stats with the old object/int64/float64
+columns vs page_schema.COMBINED_DTYPES, on a multi-season dataset built by
+repeating the snapshot seasons.
+
+Usage:
+    python benchmarks/bench_memory.py [--seasons 3 50 500]
+"""
+
+import argparse
+
+# Puts src/ on sys.path
+import _common  # noqa: F401
+
+import pandas as pd
+from fixtures import load_snapshot
+from page_schema import apply_schema
+
+
+def multi_season(seasons):
+    """
+    The snapshot's combined stats with its seasons repeated under new years,
+    typed the way read_csv / the old pipeline produced them.
+    """
+    base = pd.DataFrame(load_snapshot()["qb_combined_stats_with_playoff_status"])
+    base = base.apply(pd.to_numeric, errors="ignore")
+    years = sorted(base["Year"].unique())
+    frames = []
+    for i in range(seasons):
+        season = base[base["Year"] == years[i % len(years)]].copy()
+        season["Year"] = 2024 - i
+        frames.append(season)
+    return pd.concat(frames, ignore_index=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seasons", type=int, nargs="+", default=[3, 50, 500])
+    args = parser.parse_args()
+
+    print(f"{'seasons':>8}{'rows':>9}{'before B/row':>14}{'after B/row':>13}{'ratio':>8}")
+    for seasons in args.seasons:
+        before = multi_season(seasons)
+        after = apply_schema(before)
+        pd.testing.assert_frame_equal(before, after.astype(before.dtypes.to_dict()), check_exact=False, rtol=1e-6)
+
+        before_bytes = before.memory_usage(deep=True, index=False).sum() / len(before)
+        after_bytes = after.memory_usage(deep=True, index=False).sum() / len(after)
+        print(
+            f"{seasons:>8}{len(before):>9}{before_bytes:>14.1f}"
+            f"{after_bytes:>13.1f}{before_bytes / after_bytes:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
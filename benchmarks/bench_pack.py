@@ -0,0 +1,85 @@
+"""
+Reading many seasons of saved pages from the page cache vs the page pack,
+and a full re-parse of the pack.
+
+The fixture season pages are repeated under many seasons and stored both in
+a PageCache (one compressed file per page plus a JSON index) and a PagePack
+(one file plus a sidecar index). "read" loads every page's HTML; "reparse"
+runs page_pack.reparse_pack, which also parses and merges every season.
+
+Usage:
+    python benchmarks/bench_pack.py [--scale 1] [--seasons 50 200] [--workers 0 2] [--repeat 3]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+
+from _common import best_of
+
+from fixtures import SNAPSHOT_YEARS, build_pages, copy_seasons, load_snapshot
+from page_cache import PageCache
+from page_pack import PagePack, reparse_pack
+
+BASE_URL = "https://www.pro-football-reference.com"
+
+
+def read_cache(cache, urls):
+    return [cache.get(url)["content"] for url in urls]
+
+
+def read_pack(pack, entries):
+    pages = [pack.read(entry=entry) for entry in entries]
+    pack.close()
+    return pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", type=int, default=1, help="Player rows per snapshot row.")
+    parser.add_argument("--seasons", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 2])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    snapshot_pages = build_pages(load_snapshot(), SNAPSHOT_YEARS, args.scale)
+    for seasons in args.seasons:
+        pages, _ = copy_seasons(snapshot_pages, SNAPSHOT_YEARS, seasons)
+        workdir = tempfile.mkdtemp(prefix="bench_pack_")
+        start_dir = os.getcwd()
+        os.chdir(workdir)
+        try:
+            cache = PageCache(os.path.join(workdir, "page_cache"))
+            pack = PagePack(os.path.join(workdir, "pages.pack"))
+            for path, html in pages.items():
+                content = html.encode("utf-8") if isinstance(html, str) else html
+                cache.put(BASE_URL + path, content)
+                year, name = path.split("/")[2:4]
+                pack.add(int(year), {"passing.htm": "passing", "rushing.htm": "rushing"}.get(name, "standings"), content)
+
+            urls = cache.urls()
+            entries = list(pack.entries().values())
+            cached = [cache.get(url)["content"] for url in urls]
+            packed = [pack.read(entry=entry) for entry in entries]
+            assert sorted(cached) == sorted(packed), "the cache and the pack hold different pages"
+
+            cache_s = best_of(lambda: read_cache(PageCache(cache.cache_dir), urls), args.repeat)
+            pack_s = best_of(lambda: read_pack(PagePack(pack.path), entries), args.repeat)
+            print(f"\n{seasons} seasons, {len(pages)} pages, {sum(map(len, packed)) / 1024 / 1024:.1f} MiB of HTML")
+            print(f"{'page cache read':>26}{cache_s:>9.3f} s")
+            print(f"{'page pack read':>26}{pack_s:>9.3f} s")
+
+            for workers in args.workers:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    reparse_s = best_of(lambda: reparse_pack(PagePack(pack.path), workers=workers), 1)
+                print(f"{f'pack reparse, {workers} workers':>26}{reparse_s:>9.3f} s")
+        finally:
+            os.chdir(start_dir)
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
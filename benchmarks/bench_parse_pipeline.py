@@ -0,0 +1,103 @@
+"""
+Throughput of the fetch / parse / merge season pipeline by number of parse
+processes, on fixture season pages served by a local stand-in server.
+
+parse_workers=0 parses on the dispatcher thread, sharing this process's GIL
+with the fetch threads and the merge stage; larger pools parse in separate
+processes, so throughput should grow with the cores available (up to one
+worker per core). --recorded uses the pages stored in a page cache directory
+from a real run (e.g. .page_cache) instead of the snapshot fixtures.
+
+Usage:
+    python benchmarks/bench_parse_pipeline.py [--scale 10] [--years 30]
+        [--workers 0 1 2 4] [--repeat 3] [--recorded .page_cache]
+"""
+
+import argparse
+import atexit
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import time
+
+# Puts src/ on sys.path
+import _common  # noqa: F401
+from fixtures import SNAPSHOT_YEARS, build_pages, copy_seasons, load_snapshot, recorded_pages, serve_pages
+
+# The pipeline reads its directories and site URL from the environment at import
+# time, so point them at a scratch directory and the local server first.
+WORKDIR = tempfile.mkdtemp(prefix="bench_parse_pipeline_")
+atexit.register(shutil.rmtree, WORKDIR, ignore_errors=True)
+SERVER = serve_pages({})
+os.environ.update(
+    {
+        "QB_BASE_URL": SERVER.url,
+        "QB_CACHE_DIR": os.path.join(WORKDIR, "page_cache"),
+        "QB_MANIFEST_PATH": os.path.join(WORKDIR, "manifest.json"),
+    }
+)
+
+from get_data import PAGE_CACHE  # noqa: E402
+from parse_pipeline import run_season_pipeline  # noqa: E402
+from rate_limit import RATE_LIMITER  # noqa: E402
+
+
+def run(years, workers):
+    PAGE_CACHE.clear()
+    start = time.perf_counter()
+    season_stats, standings = run_season_pipeline(years, parse_workers=workers)
+    elapsed = time.perf_counter() - start
+    return elapsed, season_stats, standings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", type=int, default=10, help="Player rows per snapshot row.")
+    parser.add_argument("--years", type=int, default=30, help="Seasons per run.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 1, 2, 4])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--recorded", help="Page cache directory with recorded season pages.")
+    args = parser.parse_args()
+
+    if args.recorded:
+        pages, years = recorded_pages(os.path.abspath(args.recorded))
+        dataset = f"recorded ({len(years)} seasons)"
+    else:
+        pages, years = build_pages(load_snapshot(), SNAPSHOT_YEARS, args.scale), SNAPSHOT_YEARS
+        dataset = f"snapshot x{args.scale}"
+    SERVER.pages, years = copy_seasons(pages, years, args.years)
+    page_bytes = sum(len(html.encode()) if isinstance(html, str) else len(html) for html in SERVER.pages.values())
+
+    # No rate limit against the local server
+    RATE_LIMITER.rate = 1e6
+    os.chdir(WORKDIR)
+
+    print(f"{dataset}: {len(SERVER.pages)} pages, {page_bytes / 1024 / 1024:.1f} MiB, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8}{'s':>9}{'pages/s':>10}{'MiB/s':>9}{'speedup':>9}")
+    expected = None
+    base = None
+    for workers in args.workers:
+        timings = []
+        for _ in range(args.repeat):
+            with contextlib.redirect_stdout(io.StringIO()):
+                elapsed, season_stats, standings = run(years, workers)
+            timings.append(elapsed)
+            result = (
+                {year: [df.to_csv() for df in stats] for year, stats in season_stats.items()},
+                {year: table.to_csv() for year, table in standings.items()},
+            )
+            if expected is None:
+                expected = result
+            assert result == expected, f"parse_workers={workers} changed the parsed seasons"
+        best = min(timings)
+        base = base or best
+        print(
+            f"{workers:>8}{best:>9.3f}{len(SERVER.pages) / best:>10.1f}"
+            f"{page_bytes / 1024 / 1024 / best:>9.1f}{base / best:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+End-to-end timing of every pipeline stage on fixture season pages served by a
+local stand-in server: fetch, parse, clean, merge, playoff mapping, analysis
+and plotting.
+
+Pages are built from the data/ snapshot (see fixtures.py) and repeated 1x,
+10x and 100x; --recorded adds the pages stored in a page cache directory from
+a real run (e.g. .page_cache). Each run appends one JSON line per dataset to
+the history file. With --check, a stage that got slower than the median of its
+previous runs by more than --threshold fails the run (exit status 1).
+
+Usage:
+    python benchmarks/bench_pipeline.py [--scales 1 10 100] [--repeat 3]
+        [--recorded .page_cache] [--history benchmarks/history.jsonl]
+        [--check] [--threshold 0.25]
+"""
+
+import argparse
+import atexit
+import contextlib
+import io
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+# Puts src/ on sys.path
+import _common  # noqa: F401
+from fixtures import SNAPSHOT_YEARS, build_pages, load_snapshot, recorded_pages, serve_pages
+
+# The pipeline reads its directories and site URL from the environment at import
+# time, so point them at a scratch directory and the local server first.
+WORKDIR = tempfile.mkdtemp(prefix="bench_pipeline_")
+atexit.register(shutil.rmtree, WORKDIR, ignore_errors=True)
+SERVER = serve_pages({})
+os.environ.update(
+    {
+        "QB_BASE_URL": SERVER.url,
+        "QB_CACHE_DIR": os.path.join(WORKDIR, "page_cache"),
+        "QB_STORE_DIR": os.path.join(WORKDIR, "qb_store"),
+        "QB_MANIFEST_PATH": os.path.join(WORKDIR, "manifest.json"),
+        "MPLBACKEND": "Agg",
+    }
+)
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+from analyze_data import (  # noqa: E402
+    correlation_analysis,
+    descriptive_statistics,
+    hypothesis_tests,
+    playoff_vs_non_playoff_comparison,
+)
+from export_csv import export_frame  # noqa: E402
+from get_data import (  # noqa: E402
+    PAGE_CACHE,
+    _clean_table,
+    _merge_seasons,
+    fetch_season_pages,
+    playoff_team_status,
+    scrape_season_stats,
+)
+from page_schema import apply_schema  # noqa: E402
+from rate_limit import RATE_LIMITER  # noqa: E402
+from run_analysis_visualization import load_data  # noqa: E402
+from table_extract import extract_table  # noqa: E402
+from visualize_results import correlation_specs, playoff_comparison_specs, render_figures  # noqa: E402
+
+STAGES = ["fetch", "parse", "clean", "merge", "playoff", "analysis", "plot"]
+HISTORY = os.path.join(BENCH_DIR, "history.jsonl")
+
+
+def timed(timings, stage, func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    timings.setdefault(stage, []).append(time.perf_counter() - start)
+    return result
+
+
+def parse_pages(pages):
+    return {
+        key: extract_table(response.content, table_class="stats_table")
+        for key, response in pages.items()
+        if key[1] in ("passing", "rushing")
+    }
+
+
+def clean_tables(tables):
+    return {key: _clean_table(table, key[1], str(key)) for key, table in tables.items()}
+
+
+def analyze(data, resamples):
+    descriptive_statistics(data)
+    correlations = correlation_analysis(data)
+    playoff_vs_non_playoff_comparison(data)
+    hypothesis_tests(data, n_permutations=resamples, n_bootstrap=resamples)
+    return correlations
+
+
+def run_pipeline(years, timings, resamples):
+    """
+    Runs every stage once from a cold page cache, appending each stage's time to timings.
+
+    Returns:
+        int: Rows in the combined stats.
+    """
+    PAGE_CACHE.clear()
+    pages = timed(timings, "fetch", fetch_season_pages, years)
+    tables = timed(timings, "parse", parse_pages, pages)
+    timed(timings, "clean", clean_tables, tables)
+
+    # Filter to the exported QB rows as the scrapers do (not timed: parse + clean again)
+    season_stats = scrape_season_stats(years, pages)
+    merged = timed(timings, "merge", _merge_seasons, years, season_stats)
+    combined = timed(timings, "playoff", playoff_team_status, merged, years=years, pages=pages)
+    combined = apply_schema(combined)
+
+    export_frame(combined, "qb_combined_stats_with_playoff_status.csv", manifest=None)
+    data = load_data()
+    correlations = timed(timings, "analysis", analyze, data, resamples)
+    specs = correlation_specs(correlations) + playoff_comparison_specs(data)
+    timed(timings, "plot", render_figures, specs, workers=1, manifest=None)
+    return len(combined)
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BENCH_DIR,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def baseline(history, dataset, window):
+    """
+    Returns:
+        dict: Median time of each stage over the last `window` runs of a dataset.
+    """
+    runs = [record for record in history if record["dataset"] == dataset][-window:]
+    return {
+        stage: statistics.median(run["stages"][stage] for run in runs if stage in run["stages"])
+        for stage in STAGES
+        if any(stage in run["stages"] for run in runs)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--recorded", help="Page cache directory with recorded season pages.")
+    parser.add_argument("--resamples", type=int, default=1000, help="Permutations / bootstrap resamples per test.")
+    parser.add_argument("--history", default=HISTORY)
+    parser.add_argument("--window", type=int, default=5, help="Previous runs the baseline is the median of.")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown vs the baseline (0.25 = 25%%).")
+    parser.add_argument("--min-delta", type=float, default=0.01, help="Ignore slowdowns smaller than this many seconds.")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 if a stage regressed.")
+    args = parser.parse_args()
+
+    datasets = []
+    if args.recorded:
+        pages, years = recorded_pages(os.path.abspath(args.recorded))
+        datasets.append(("recorded", 1, years, pages))
+    snapshot = load_snapshot()
+    for scale in args.scales:
+        datasets.append((f"snapshot x{scale}", scale, SNAPSHOT_YEARS, build_pages(snapshot, SNAPSHOT_YEARS, scale)))
+
+    # No rate limit against the local server
+    RATE_LIMITER.rate = 1e6
+    start_dir = os.getcwd()
+    os.chdir(WORKDIR)
+
+    args.history = os.path.abspath(os.path.join(start_dir, args.history))
+    history = load_history(args.history)
+    commit = git_commit()
+    regressions = []
+    for dataset, scale, years, pages in datasets:
+        SERVER.pages = pages
+        timings = {}
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(args.repeat):
+                rows = run_pipeline(years, timings, args.resamples)
+        stages = {stage: round(min(timings[stage]), 6) for stage in STAGES}
+        previous = baseline(history, dataset, args.window)
+
+        print(f"\n{dataset}: {len(years)} seasons, {rows} combined rows")
+        print(f"{'stage':>10}{'ms':>10}{'baseline':>10}{'change':>9}")
+        for stage in STAGES:
+            line = f"{stage:>10}{stages[stage] * 1000:>10.1f}"
+            if stage in previous:
+                change = stages[stage] / previous[stage] - 1
+                line += f"{previous[stage] * 1000:>10.1f}{change:>+9.0%}"
+                if change > args.threshold and stages[stage] - previous[stage] > args.min_delta:
+                    regressions.append(f"{dataset} {stage}: {change:+.0%}")
+                    line += "  REGRESSION"
+            print(line)
+
+        record = {
+            "time": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": commit,
+            "python": sys.version.split()[0],
+            "dataset": dataset,
+            "scale": scale,
+            "years": years,
+            "rows": rows,
+            "repeat": args.repeat,
+            "resamples": args.resamples,
+            "stages": stages,
+        }
+        with open(args.history, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+
+    print(f"\nAppended {len(datasets)} runs to {args.history}")
+    if regressions:
+        print(f"Regressions beyond {args.threshold:.0%}: " + "; ".join(regressions))
+        if args.check:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Cold-start import time of every cli subcommand, measured in fresh
+interpreters, next to the cost of importing every pipeline module up front.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat 5]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+from _common import SRC_DIR as SRC
+
+from cli import COMMANDS
+
+# Prints the seconds spent importing cli plus a subcommand's modules, and how many modules got loaded
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import cli
+{load}
+print(time.perf_counter() - start, len(sys.modules))
+"""
+
+
+def cold_start(load, repeat):
+    """
+    Returns:
+        tuple: Best import time in seconds and the number of loaded modules.
+    """
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(load=load)],
+            cwd=SRC,
+            check=True,
+            capture_output=True,
+            text=True,
+            env={**os.environ, "MPLBACKEND": "Agg"},
+        ).stdout.split()
+        timings.append(float(output[0]))
+        modules = int(output[1])
+    return min(timings), modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    every_module = sorted({module for command in COMMANDS.values() for module in command.modules})
+    cases = [("(cli only)", "")]
+    cases += [(name, f"cli.load_command({name!r})") for name in COMMANDS]
+    cases += [("(everything)", "; ".join(f"import {module}" for module in every_module))]
+
+    print(f"{'command':>14}{'import ms':>11}{'modules':>9}")
+    for name, load in cases:
+        seconds, modules = cold_start(load, args.repeat)
+        print(f"{name:>14}{seconds * 1000:>11.1f}{modules:>9}")
+
+
+if __name__ == "__main__":
+    main()
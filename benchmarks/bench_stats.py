@@ -0,0 +1,78 @@
+"""
+Peak memory and time of descriptive_statistics on a fully loaded CSV vs
+streaming_stats.streaming_descriptive_statistics reading it in chunks.
+
+Usage:
+    python benchmarks/bench_stats.py [--rows 200000 1000000] [--chunksize 100000]
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+
+# Puts src/ on sys.path
+import _common  # noqa: F401
+
+import numpy as np
+import pandas as pd
+from analyze_data import descriptive_statistics
+from streaming_stats import DESCRIPTIVE_METRICS, streaming_descriptive_statistics
+
+
+def write_dataset(path, rows, seed=0):
+    """
+    Writes a game-level-sized combined stats CSV with 50 seasons.
+    """
+    rng = np.random.default_rng(seed)
+    data = pd.DataFrame(
+        rng.integers(0, 5000, size=(rows, len(DESCRIPTIVE_METRICS))), columns=DESCRIPTIVE_METRICS
+    )
+    data["Rating"] = rng.uniform(0, 100, rows).round(1)
+    data["Passing TD to INT Ratio"] = rng.uniform(0, 10, rows).round(2)
+    data.insert(0, "Name", [f"Player {i % 5000}" for i in range(rows)])
+    data["Year"] = rng.integers(1975, 2025, rows)
+    data["Playoff Status"] = rng.choice(["Playoff", "Eliminated"], rows)
+    data.to_csv(path, index=False)
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[200000, 1000000])
+    parser.add_argument("--chunksize", type=int, default=100000)
+    args = parser.parse_args()
+
+    print(f"{'rows':>9}{'full s':>9}{'full MB':>10}{'stream s':>10}{'stream MB':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for rows in args.rows:
+            path = os.path.join(tmp, f"combined_{rows}.csv")
+            write_dataset(path, rows)
+
+            # descriptive_statistics prints its table; keep the benchmark output readable
+            with contextlib.redirect_stdout(io.StringIO()):
+                full, full_s, full_peak = measure(lambda: descriptive_statistics(pd.read_csv(path)))
+            streamed, stream_s, stream_peak = measure(
+                lambda: streaming_descriptive_statistics(path, chunksize=args.chunksize)
+            )
+            pd.testing.assert_frame_equal(full, streamed)
+            print(
+                f"{rows:>9}{full_s:>9.2f}{full_peak / 2**20:>10.1f}"
+                f"{stream_s:>10.2f}{stream_peak / 2**20:>11.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
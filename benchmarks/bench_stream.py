@@ -0,0 +1,109 @@
+"""
+Peak memory of a multi-season scrape collected into DataFrames vs streamed
+into file and aggregate sinks, on fixture season pages served by a local
+stand-in server.
+
+Both modes run get_data.stream_season_stats, which fetches and cleans one
+season at a time; "frames" keeps every batch in FrameSinks (what
+scrape_season_stats does), "sinks" writes them to CSV and Parquet files and
+keeps per-season totals only. Peak memory is measured with tracemalloc, so it
+counts Python and NumPy allocations but not the interpreter itself.
+
+Usage:
+    python benchmarks/bench_stream.py [--scale 10] [--seasons 5 25] [--batch-rows 5000]
+"""
+
+import argparse
+import atexit
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+# Puts src/ on sys.path
+import _common  # noqa: F401
+from fixtures import SNAPSHOT_YEARS, build_pages, copy_seasons, load_snapshot, serve_pages
+
+# The scrapers read their directories and site URL from the environment at
+# import time, so point them at a scratch directory and the local server first.
+WORKDIR = tempfile.mkdtemp(prefix="bench_stream_")
+atexit.register(shutil.rmtree, WORKDIR, ignore_errors=True)
+SERVER = serve_pages({})
+os.environ.update(
+    {
+        "QB_BASE_URL": SERVER.url,
+        "QB_CACHE_DIR": os.path.join(WORKDIR, "page_cache"),
+        "QB_MANIFEST_PATH": os.path.join(WORKDIR, "manifest.json"),
+    }
+)
+
+from get_data import PAGE_CACHE, stream_season_stats  # noqa: E402
+from rate_limit import RATE_LIMITER  # noqa: E402
+from stat_sinks import AggregateSink, CsvSink, FrameSink, ParquetSink, drain  # noqa: E402
+
+
+def collect_frames(years, batch_rows):
+    results = drain(
+        stream_season_stats(years, batch_rows=batch_rows),
+        {"passing": [FrameSink()], "rushing": [FrameSink()]},
+    )
+    return sum(len(results[page][0]) for page in results)
+
+
+def stream_to_sinks(years, batch_rows):
+    results = drain(
+        stream_season_stats(years, batch_rows=batch_rows),
+        {
+            "passing": [CsvSink("qb_pass_stats.csv"), ParquetSink("qb_pass_stats.parquet"), AggregateSink()],
+            "rushing": [CsvSink("qb_rush_stats.csv"), AggregateSink()],
+        },
+    )
+    return int(sum(results[page][-1]["rows"].sum() for page in results))
+
+
+MODES = {"frames": collect_frames, "sinks": stream_to_sinks}
+
+
+def measure(func, years, batch_rows):
+    PAGE_CACHE.clear()
+    tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        rows = func(years, batch_rows)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return rows, peak, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", type=int, default=10, help="Player rows per snapshot row.")
+    parser.add_argument("--seasons", type=int, nargs="+", default=[5, 25])
+    parser.add_argument("--batch-rows", type=int, default=5000)
+    args = parser.parse_args()
+
+    pages = build_pages(load_snapshot(), SNAPSHOT_YEARS, args.scale)
+    # No rate limit against the local server
+    RATE_LIMITER.rate = 1e6
+    os.chdir(WORKDIR)
+
+    print(f"snapshot x{args.scale}, {args.batch_rows} rows per batch")
+    print(f"{'seasons':>8}{'rows':>9}" + "".join(f"{mode + ' MiB':>12}{mode + ' s':>10}" for mode in MODES))
+    for seasons in args.seasons:
+        SERVER.pages, years = copy_seasons(pages, SNAPSHOT_YEARS, seasons)
+        line = ""
+        counts = set()
+        for func in MODES.values():
+            rows, peak, elapsed = measure(func, years, args.batch_rows)
+            counts.add(rows)
+            line += f"{peak / 1024 / 1024:>12.1f}{elapsed:>10.2f}"
+        assert len(counts) == 1, "the modes scraped different rows"
+        print(f"{seasons:>8}{counts.pop():>9}{line}")
+
+
+if __name__ == "__main__":
+    main()
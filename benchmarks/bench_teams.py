@@ -0,0 +1,86 @@
+"""
+Team standardization and the playoff-status join on team-name strings vs
+TEAM_RESOLVER's integer franchise codes.
+
+"strings" maps the raw team column through config.TEAM_NAME_MAPPING and
+merges standings on (Year, team name) object keys, as the scrapers used to;
+"codes" resolves the column with team_resolver.TeamResolver.codes and merges
+on (Year, franchise ID) integer keys. Rows are drawn from every mapped team
+abbreviation over a range of seasons, with every season's standings.
+
+Usage:
+    python benchmarks/bench_teams.py [--rows 100000 1000000] [--seasons 60] [--repeat 5]
+"""
+
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from _common import best_of
+from config import TEAM_NAME_MAPPING
+from team_resolver import NO_TEAM, TEAM_RESOLVER
+
+
+def join_strings(df, standings):
+    teams = df["Team"].astype(object).map(TEAM_NAME_MAPPING).fillna("Unknown")
+    keys = pd.DataFrame({"Year": df["Year"].to_numpy(), "Standardized Team": teams.to_numpy()})
+    return keys.merge(standings, on=["Year", "Standardized Team"], how="left")["Playoff Status"]
+
+
+def join_codes(df, standings):
+    codes, _ = TEAM_RESOLVER.codes(df["Team"], df["Year"])
+    keys = pd.DataFrame({"Year": df["Year"].to_numpy(), "Franchise": codes})
+    return keys.merge(standings, on=["Year", "Franchise"], how="left")["Playoff Status"]
+
+
+def build_standings(years):
+    franchises = np.array(TEAM_RESOLVER.franchises, dtype=object)
+    status = np.where(np.arange(len(franchises)) % 3 == 0, "Playoff", "Eliminated")
+    table = pd.DataFrame(
+        {
+            "Year": np.repeat(years, len(franchises)),
+            "Standardized Team": np.tile(franchises, len(years)),
+            "Franchise": np.tile(np.arange(len(franchises), dtype="int16"), len(years)),
+            "Playoff Status": np.tile(status, len(years)),
+        }
+    )
+    return table.drop(columns="Franchise"), table.drop(columns="Standardized Team")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100000, 1000000])
+    parser.add_argument("--seasons", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    years = np.arange(2024 - args.seasons, 2024, dtype="int64")
+    by_name, by_code = build_standings(years)
+    # Season aliases change the franchise of some codes, so compare on codes without them
+    teams = [alias for alias in TEAM_NAME_MAPPING if alias not in TEAM_RESOLVER.season_aliases]
+    rng = np.random.default_rng(0)
+
+    print(f"{args.seasons} seasons, {len(teams)} team codes")
+    print(f"{'rows':>10}{'strings s':>12}{'codes s':>10}{'speedup':>9}")
+    for rows in args.rows:
+        df = pd.DataFrame(
+            {
+                "Team": pd.Categorical(rng.choice(teams, rows)),
+                "Year": rng.choice(years, rows),
+            }
+        )
+        expected = join_strings(df, by_name)
+        result = join_codes(df, by_code)
+        multi_team = TEAM_RESOLVER.codes(df["Team"])[0] == NO_TEAM
+        # Multi-team rows used to map to the string "None", which no standings row matches either
+        assert expected.equals(result), "the code join attached different playoff statuses"
+        assert result[multi_team].isna().all()
+
+        strings_s = best_of(lambda: join_strings(df, by_name), args.repeat)
+        codes_s = best_of(lambda: join_codes(df, by_code), args.repeat)
+        print(f"{rows:>10}{strings_s:>12.3f}{codes_s:>10.3f}{strings_s / codes_s:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
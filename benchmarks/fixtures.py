@@ -0,0 +1,398 @@
+"""
+Builds Pro Football Reference style season pages (passing, rushing and
+standings) from the CSV snapshot in data/QB_STATS.zip, so the scrapers can be
+benchmarked without touching the live site.
+
+Pages follow the site's markup: a `stats_table` with `data-stat` cells and
+player links, repeated header rows, a two-row rushing header, and AFC/NFC
+standings tables with `*`/`+` playoff markers. `scale` repeats the player rows
+to produce pages 10-100x larger than a real season. serve_pages serves them
+from a local stand-in server; recorded_pages loads real pages saved in a page
+cache instead.
+"""
+
+import csv
+import io
+import os
+import threading
+import zipfile
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SNAPSHOT_ZIP = os.path.join(REPO_ROOT, "data", "QB_STATS.zip")
+SNAPSHOT_YEARS = [2013, 2021, 2022]
+
+PASSING_STATS = [
+    ("player", "Player"), ("age", "Age"), ("team", "Team"), ("pos", "Pos"),
+    ("g", "G"), ("gs", "GS"), ("qb_rec", "QBrec"), ("pass_cmp", "Cmp"),
+    ("pass_att", "Att"), ("pass_cmp_pct", "Cmp%"), ("pass_yds", "Yds"),
+    ("pass_td", "TD"), ("pass_td_pct", "TD%"), ("pass_int", "Int"),
+    ("pass_int_pct", "Int%"), ("pass_first_down", "1D"),
+    ("pass_success", "Succ%"), ("pass_long", "Lng"),
+    ("pass_yds_per_att", "Y/A"), ("pass_adj_yds_per_att", "AY/A"),
+    ("pass_yds_per_cmp", "Y/C"), ("pass_yds_per_g", "Y/G"),
+    ("pass_rating", "Rate"), ("qbr", "QBR"), ("pass_sacked", "Sk"),
+    ("pass_sacked_yds", "Yds"), ("pass_sacked_pct", "Sk%"),
+    ("pass_net_yds_per_att", "NY/A"), ("pass_adj_net_yds_per_att", "ANY/A"),
+    ("comebacks", "4QC"), ("gwd", "GWD"),
+]
+RUSHING_STATS = [
+    ("player", "Player"), ("team", "Team"), ("age", "Age"), ("pos", "Pos"),
+    ("g", "G"), ("rush_att", "Att"), ("rush_yds", "Yds"), ("rush_td", "TD"),
+    ("rush_first_down", "1D"), ("rush_success", "Succ%"),
+    ("rush_long", "Lng"), ("rush_yds_per_att", "Y/A"),
+    ("rush_yds_per_g", "Y/G"), ("fumbles", "Fmb"),
+]
+
+# Standings names used by the site before later relocations/renames
+STANDINGS_NAMES = {
+    2013: {
+        "Las Vegas Raiders": "Oakland Raiders",
+        "Los Angeles Chargers": "San Diego Chargers",
+        "Los Angeles Rams": "St. Louis Rams",
+        "Washington Commanders": "Washington Redskins",
+    },
+    2021: {"Washington Commanders": "Washington Football Team"},
+}
+CONFERENCES = {
+    "AFC": [
+        "Buffalo Bills", "Miami Dolphins", "New England Patriots",
+        "New York Jets", "Baltimore Ravens", "Cincinnati Bengals",
+        "Cleveland Browns", "Pittsburgh Steelers", "Houston Texans",
+        "Indianapolis Colts", "Jacksonville Jaguars", "Tennessee Titans",
+        "Denver Broncos", "Kansas City Chiefs", "Las Vegas Raiders",
+        "Los Angeles Chargers",
+    ],
+    "NFC": [
+        "Dallas Cowboys", "New York Giants", "Philadelphia Eagles",
+        "Washington Commanders", "Chicago Bears", "Detroit Lions",
+        "Green Bay Packers", "Minnesota Vikings", "Atlanta Falcons",
+        "Carolina Panthers", "New Orleans Saints", "Tampa Bay Buccaneers",
+        "Arizona Cardinals", "Los Angeles Rams", "San Francisco 49ers",
+        "Seattle Seahawks",
+    ],
+}
+
+# Rows that every scraper must filter out
+BACKUP_PASSER = [
+    "24", "KAN", "QB", "3", "0", "", "10", "20", "50.0", "100", "1", "5.0",
+    "0", "0.0", "5", "40", "20", "5.0", "6.0", "10.0", "33.3", "80.0", "40.1",
+    "1", "5", "4.0", "4.5", "5.5", "", "",
+]
+TRICK_PLAY_PASSER = [
+    "26", "NYG", "RB", "17", "17", "", "1", "1", "100.0", "25", "1", "100",
+    "0", "0", "1", "100", "25", "25.0", "45.0", "25.0", "1.5", "158.3", "",
+    "0", "0", "0", "25.0", "45.0", "", "",
+]
+RUNNING_BACK = [
+    "DAL", "25", "RB", "16", "250", "1,100", "8", "60", "50.0", "60", "4.4",
+    "68.8", "2",
+]
+BACKUP_RUSHER = [
+    "DAL", "29", "QB", "2", "3", "12", "0", "1", "33.3", "8", "4.0", "6.0", "0",
+]
+
+
+def load_snapshot(zip_path=SNAPSHOT_ZIP):
+    """
+    Reads the pass, rush and combined CSVs from the data archive.
+
+    Args:
+        zip_path (str): Path to QB_STATS.zip.
+
+    Returns:
+        dict: Mapping of CSV name (without extension) to a list of row dicts.
+    """
+    tables = {}
+    with zipfile.ZipFile(zip_path) as archive:
+        for name in archive.namelist():
+            if name.endswith(".csv") and not name.startswith("__MACOSX"):
+                text = archive.read(name).decode("utf-8")
+                tables[name[:-4]] = list(csv.DictReader(io.StringIO(text)))
+    return tables
+
+
+def player_id(name):
+    """
+    Builds a site-style player ID (e.g. "MahoPa00") from a player's name.
+    """
+    first, last = name.split()[0], name.split()[-1]
+    return f"{(last + 'xxxx')[:4]}{(first + 'xx')[:2]}00"
+
+
+def _player_row(stats, name, values, rank=1):
+    pid = player_id(name)
+    cells = [
+        f'<td class="left" data-append-csv="{pid}" data-stat="player">'
+        f'<a href="/players/{pid[0]}/{pid}.htm">{escape(name)}</a></td>'
+    ]
+    cells += [
+        f'<td class="right" data-stat="{stat}">{value}</td>'
+        for (stat, _), value in zip(stats[1:], values)
+    ]
+    return (
+        f'<tr><th scope="row" class="right" data-stat="ranker">{rank}</th>'
+        + "".join(cells)
+        + "</tr>"
+    )
+
+
+def _header_row(stats, css_class=None):
+    cells = '<th data-stat="ranker" scope="col">Rk</th>' + "".join(
+        f'<th data-stat="{stat}" scope="col">{label}</th>' for stat, label in stats
+    )
+    attr = f' class="{css_class}"' if css_class else ""
+    return f"<tr{attr}>{cells}</tr>"
+
+
+def _page(title, body):
+    # Navigation and footer markup around the tables, as on the real site
+    filler = "".join(
+        f'<div class="filler"><p>Section {i}</p><ul><li><a href="/x{i}">link</a></li></ul></div>'
+        for i in range(200)
+    )
+    return (
+        f"<!DOCTYPE html><html><head><title>{title}</title></head><body>"
+        f'<div id="header">{filler}</div>{body}<div id="footer">{filler}</div>'
+        "</body></html>"
+    )
+
+
+def passing_page(year, pass_rows, scale=1):
+    """
+    Builds a passing.htm page for one season.
+
+    Args:
+        year (int): Season year.
+        pass_rows (list): Rows of qb_pass_stats_{year}.csv.
+        scale (int): Number of copies of the player rows.
+
+    Returns:
+        str: Page HTML.
+    """
+    rows = []
+    for copy in range(scale):
+        for rank, r in enumerate(pass_rows, start=1):
+            name = r["Name"] if copy == 0 else f"{r['Name']} {copy}"
+            values = [
+                "28", r["Team"], "QB", r["Games Played"], r["Games Played"],
+                "10-7-0", "350", "560", "62.5", f"{int(r['Passing Yards']):,}",
+                r["Passing TDs"], "5.1", r["Interceptions"], "2.0", "200",
+                "48.0", "75", "7.5", "7.9", "11.4", "250.1", "95.2",
+                r["Rating"], "30", "200", "5.0", "6.8", "7.1", r["4QC"], r["GWD"],
+            ]
+            rows.append(_player_row(PASSING_STATS, name, values, rank))
+            if rank % 20 == 0:
+                rows.append(_header_row(PASSING_STATS, "thead"))
+        rows.append(_player_row(PASSING_STATS, f"Backup Passer {copy}", BACKUP_PASSER))
+        rows.append(_player_row(PASSING_STATS, f"Trick Play {copy}", TRICK_PLAY_PASSER))
+    table = (
+        '<table class="sortable stats_table" id="passing">'
+        f"<thead>{_header_row(PASSING_STATS)}</thead>"
+        f"<tbody>{''.join(rows)}</tbody></table>"
+    )
+    return _page(f"{year} NFL Passing", table)
+
+
+def rushing_page(year, rush_rows, pass_rows, scale=1):
+    """
+    Builds a rushing.htm page for one season.
+
+    Args:
+        year (int): Season year.
+        rush_rows (list): Rows of qb_rush_stats_{year}.csv.
+        pass_rows (list): Rows of qb_pass_stats_{year}.csv (for each QB's team).
+        scale (int): Number of copies of the player rows.
+
+    Returns:
+        str: Page HTML.
+    """
+    teams = {r["Name"]: r["Team"] for r in pass_rows}
+    rows = []
+    for copy in range(scale):
+        for rank, r in enumerate(rush_rows, start=1):
+            name = r["Name"] if copy == 0 else f"{r['Name']} {copy}"
+            values = [
+                teams.get(r["Name"], "2TM"), "27", "QB", "16", "60",
+                f"{int(float(r['Rushing Yards'])):,}", r["Rushing TDs"], "20",
+                "45.0", "30", "4.5", "25.0", "5",
+            ]
+            rows.append(_player_row(RUSHING_STATS, name, values, rank))
+        for i in range(40):
+            rows.append(_player_row(RUSHING_STATS, f"Running Back{i} {copy}", RUNNING_BACK))
+        rows.append(_player_row(RUSHING_STATS, f"Backup Passer {copy}", BACKUP_RUSHER))
+    over_header = (
+        '<tr class="over_header"><th colspan="5"></th>'
+        '<th colspan="9" data-stat="header_rushing">Rushing</th></tr>'
+    )
+    table = (
+        '<table class="per_match_toggle sortable stats_table" id="rushing">'
+        f"<thead>{over_header}{_header_row(RUSHING_STATS)}</thead>"
+        f"<tbody>{''.join(rows)}</tbody></table>"
+    )
+    return _page(f"{year} NFL Rushing", table)
+
+
+def standings_page(year, combined_rows):
+    """
+    Builds the season standings page with AFC and NFC tables.
+
+    Args:
+        year (int): Season year.
+        combined_rows (list): Rows of qb_combined_stats_with_playoff_status.csv,
+            used to mark that season's playoff teams.
+
+    Returns:
+        str: Page HTML.
+    """
+    playoff_teams = {
+        r["Standardized Team"]
+        for r in combined_rows
+        if int(r["Year"]) == year and r["Playoff Status"] == "Playoff"
+    }
+    renames = STANDINGS_NAMES.get(year, {})
+    tables = []
+    for conference, teams in CONFERENCES.items():
+        rows = []
+        for i, team in enumerate(teams):
+            if i % 4 == 0:
+                rows.append(
+                    '<tr class="thead onecell"><td colspan="3" class="left" data-stat="onecell">'
+                    f"{conference} Division {i // 4 + 1}</td></tr>"
+                )
+            marker = "*" if team in playoff_teams else ""
+            rows.append(
+                '<tr><th scope="row" class="left" data-stat="team">'
+                f'<a href="/teams/x/{year}.htm">{escape(renames.get(team, team))}</a>{marker}</th>'
+                '<td class="right" data-stat="wins">9</td>'
+                '<td class="right" data-stat="losses">8</td></tr>'
+            )
+        tables.append(
+            f'<table class="sortable stats_table" id="{conference}"><thead><tr>'
+            '<th data-stat="team">Tm</th><th data-stat="wins">W</th>'
+            '<th data-stat="losses">L</th></tr></thead>'
+            f"<tbody>{''.join(rows)}</tbody></table>"
+        )
+    return _page(f"{year} NFL Standings", "".join(tables))
+
+
+def build_pages(snapshot=None, years=SNAPSHOT_YEARS, scale=1):
+    """
+    Builds every season page for the given years.
+
+    Args:
+        snapshot (dict, optional): Result of load_snapshot(). Loaded when not provided.
+        years (list): Years from the snapshot to build pages for.
+        scale (int): Number of copies of the player rows on passing/rushing pages.
+
+    Returns:
+        dict: Mapping of URL path (e.g. "/years/2022/passing.htm") to page HTML.
+    """
+    snapshot = snapshot or load_snapshot()
+    combined = snapshot["qb_combined_stats_with_playoff_status"]
+    pages = {}
+    for year in years:
+        pass_rows = snapshot[f"qb_pass_stats_{year}"]
+        rush_rows = snapshot[f"qb_rush_stats_{year}"]
+        pages[f"/years/{year}/passing.htm"] = passing_page(year, pass_rows, scale)
+        pages[f"/years/{year}/rushing.htm"] = rushing_page(year, rush_rows, pass_rows, scale)
+        pages[f"/years/{year}/"] = standings_page(year, combined)
+    return pages
+
+
+def copy_seasons(pages, years, count):
+    """
+    Repeats the season pages of `years` under `count` distinct seasons
+    (3000, 3001, ...), e.g. to keep every parse worker busy or to scrape
+    many seasons.
+
+    Args:
+        pages (dict): Mapping of URL path to page HTML.
+        years (list): Seasons of pages to copy, in turn.
+        count (int): Number of seasons to produce.
+
+    Returns:
+        tuple: (pages, years) for the synthetic seasons.
+    """
+    copies = {}
+    seasons = []
+    for i in range(count):
+        source = years[i % len(years)]
+        season = 3000 + i
+        for path, html in pages.items():
+            if path.startswith(f"/years/{source}/"):
+                copies[path.replace(f"/years/{source}/", f"/years/{season}/", 1)] = html
+        seasons.append(season)
+    return copies, seasons
+
+
+class _PageHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        body = self.server.pages.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = body.encode("utf-8") if isinstance(body, str) else body
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def serve_pages(pages, port=0):
+    """
+    Serves pages from a local HTTP server on a background thread.
+
+    Args:
+        pages (dict): Mapping of URL path to page HTML, e.g. from build_pages().
+            Assign server.pages to serve a different set.
+        port (int): Port to listen on. Any free port when 0.
+
+    Returns:
+        ThreadingHTTPServer: The running server; server.url is its base URL.
+            Call server.shutdown() to stop it.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), _PageHandler)
+    server.daemon_threads = True
+    server.pages = pages
+    server.url = f"http://127.0.0.1:{server.server_port}"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def recorded_pages(cache_dir):
+    """
+    Loads the season pages stored in a page cache directory. Needs src/ on sys.path.
+
+    Args:
+        cache_dir (str): Page cache directory of a previous run.
+
+    Returns:
+        tuple: (pages, years) with pages keyed by URL path, for the years that
+               have passing, rushing and standings pages.
+    """
+    from page_cache import PageCache
+
+    cache = PageCache(cache_dir, offline=True)
+    pages = {}
+    for url in cache.urls():
+        path = urlsplit(url).path
+        if path.startswith("/years/"):
+            pages[path] = cache.get(url)["content"]
+    years = [
+        int(year)
+        for year in {path.split("/")[2] for path in pages}
+        if year.isdigit()
+        and all(f"/years/{year}/{page}" in pages for page in ("passing.htm", "rushing.htm", ""))
+    ]
+    return pages, sorted(years)
@@ -1,11 +1,31 @@
+import numpy as np
 import pandas as pd
-from scipy.stats import ttest_ind
+from config import N_PERMUTATIONS, N_BOOTSTRAP, RESAMPLE_CHUNK, RESAMPLE_SEED
 from export_csv import export_to_csv
+from streaming_stats import DESCRIPTIVE_METRICS
+from instrumentation import INSTRUMENTATION
 
+# Metrics compared between playoff and eliminated teams
+TEST_METRICS = [
+    "Passing Yards",
+    "Passing TDs",
+    "Interceptions",
+    "Rating",
+    "Rushing Yards",
+    "Rushing TDs",
+    "Total Yards",
+    "Total TDs",
+    "Passing TD to INT Ratio",
+    "4QC",
+    "GWD",
+]
 
+
+@INSTRUMENTATION.timed()
 def descriptive_statistics(data, csv_filename=None):
     """
     Computes and prints descriptive statistics by year, and saves them to a CSV file.
+    For datasets too large to load, see streaming_stats.streaming_descriptive_statistics.
 
     Args:
         data (pd.DataFrame): The dataset to analyze.
@@ -16,17 +36,7 @@ def descriptive_statistics(data, csv_filename=None):
     """
     grouped = data.groupby("Year")
     descriptive_stats = grouped.agg(
-        {
-            "Passing Yards": ["mean", "std", "min", "max"],
-            "Passing TDs": ["mean", "std", "min", "max"],
-            "Interceptions": ["mean", "std", "min", "max"],
-            "Rating": ["mean", "std", "min", "max"],
-            "Rushing Yards": ["mean", "std", "min", "max"],
-            "Rushing TDs": ["mean", "std", "min", "max"],
-            "Total Yards": ["mean", "std", "min", "max"],
-            "Total TDs": ["mean", "std", "min", "max"],
-            "Passing TD to INT Ratio": ["mean", "std", "min", "max"],
-        }
+        {metric: ["mean", "std", "min", "max"] for metric in DESCRIPTIVE_METRICS}
     ).round(2)
 
     # Flatten multi-level column names
@@ -44,24 +54,389 @@ def descriptive_statistics(data, csv_filename=None):
     return descriptive_stats
 
 
-def correlation_analysis(data):
+def _pairwise_pearson(values, present):
+    """
+    Pearson correlation of every column pair over the rows where both are present.
+
+    Args:
+        values (np.ndarray): n x k float64 block, centered per column, with 0 where missing.
+        present (np.ndarray): n x k float64 mask, 1.0 where the value is present.
+
+    Returns:
+        np.ndarray: k x k correlation matrix (NaN where a pair has no variance).
+    """
+    # Pairwise sums as matrix products: entry [i, j] sums over rows where i and j are both present
+    count = present.T @ present
+    sum_x = values.T @ present
+    sum_xx = (values * values).T @ present
+    sum_xy = values.T @ values
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = sum_xy - sum_x * sum_x.T / count
+        var_x = sum_xx - sum_x * sum_x / count
+        corr = cov / np.sqrt(var_x * var_x.T)
+    corr[~(var_x * var_x.T > 0)] = np.nan
+    return np.clip(corr, -1, 1)
+
+
+def _group_correlation(block, method, pairwise):
+    """
+    Correlation matrix of one group's rows.
+
+    Args:
+        block (np.ndarray): n x k float64 values with NaN for missing.
+        method (str): "pearson" or "spearman".
+        pairwise (bool): Use pairwise-complete rows; otherwise drop rows with any NaN.
+
+    Returns:
+        np.ndarray: k x k correlation matrix.
+    """
+    missing = np.isnan(block)
+    if not pairwise and missing.any():
+        block = block[~missing.any(axis=1)]
+        missing = np.zeros(block.shape, dtype=bool)
+
+    if method == "spearman":
+        if missing.any():
+            # Ranks depend on which rows each pair shares; pandas' compiled pairwise ranking handles this
+            return pd.DataFrame(block).corr(method="spearman").to_numpy()
+        # scipy is imported on first use; it dominates the module's import time
+        from scipy.stats import rankdata
+
+        block = rankdata(block, axis=0)
+
+    present = (~missing).astype(np.float64)
+    with np.errstate(invalid="ignore"):
+        means = np.nanmean(block, axis=0) if missing.any() else block.mean(axis=0)
+    centered = np.where(missing, 0.0, block - means)
+    return _pairwise_pearson(centered, present)
+
+
+def grouped_correlation(data, by="Year", method="pearson", pairwise=True):
+    """
+    Computes a correlation matrix of the numeric columns for every group in one pass.
+
+    The numeric block is selected once as a float64 array and sorted by group,
+    so each group is a contiguous slice whose matrix is built from centered
+    matrix products. Missing values are handled pairwise (each pair uses the
+    rows where both values are present), like DataFrame.corr.
+
+    Args:
+        data (pd.DataFrame): The dataset to analyze.
+        by (str): Column to group by.
+        method (str): "pearson" or "spearman".
+        pairwise (bool): Pairwise-complete rows when True, rows without any NaN when False.
+
+    Returns:
+        tuple: (groups, columns, stacked) where groups is an array of the group keys
+               in order of appearance, columns the numeric column names, and stacked a
+               groups x columns x columns float64 array of correlation matrices.
+    """
+    if method not in ("pearson", "spearman"):
+        raise ValueError(f"Unsupported correlation method: {method}")
+
+    numeric = data.select_dtypes(include=["float", "int"])
+    columns = list(numeric.columns)
+    values = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+
+    # Group keys in order of appearance, like unique()
+    codes, groups = pd.factorize(data[by])
+    groups = np.asarray(groups)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(groups) + 1))
+    values = values[order]
+    if method == "spearman" and not np.isnan(values).any():
+        # Without missing values every pair shares all rows: rank all groups in one call
+        values = pd.DataFrame(values).groupby(codes[order], sort=False).rank().to_numpy()
+        method = "pearson"
+
+    stacked = np.empty((len(groups), len(columns), len(columns)))
+    for g in range(len(groups)):
+        stacked[g] = _group_correlation(values[bounds[g]:bounds[g + 1]], method, pairwise)
+    return groups, columns, stacked
+
+
+@INSTRUMENTATION.timed()
+def correlation_analysis(data, method="pearson"):
     """
     Generates correlation matrices for each year in the dataset.
 
     Args:
         data (pd.DataFrame): The dataset to analyze.
+        method (str): "pearson" or "spearman".
 
     Returns:
         dict: Dictionary of correlation matrices by year.
     """
-    correlation_by_year = {}
-    for year in data["Year"].unique():
-        yearly_data = data[data["Year"] == year].select_dtypes(include=["float", "int"])
-        if not yearly_data.empty:
-            correlation_by_year[year] = yearly_data.corr()
-    return correlation_by_year
+    years, columns, stacked = grouped_correlation(data, "Year", method)
+    if not columns:
+        return {}
+    return {
+        year: pd.DataFrame(matrix, index=columns, columns=columns)
+        for year, matrix in zip(years, stacked)
+    }
 
 
+def _split_playoff_groups(data, metrics):
+    """
+    Splits the metric columns into playoff and eliminated blocks in one pass.
+
+    Returns:
+        tuple: (playoff, eliminated) float64 arrays of shape rows x metrics, NaN for missing.
+    """
+    values = data[metrics].to_numpy(dtype=np.float64, na_value=np.nan)
+    status = data["Playoff Status"].to_numpy()
+    return values[status == "Playoff"], values[status == "Eliminated"]
+
+
+def _group_means(values):
+    """
+    Column means ignoring missing values; NaN for columns with no values (or an empty group).
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.nansum(values, axis=0) / np.sum(~np.isnan(values), axis=0)
+
+
+def _t_tests(playoff, eliminated, equal_var):
+    """
+    Two-sample t-tests of every column at once, ignoring missing values per column.
+
+    Returns:
+        tuple: (t_stat, p_value, df) arrays with one entry per column.
+    """
+    n_a = np.sum(~np.isnan(playoff), axis=0).astype(np.float64)
+    n_b = np.sum(~np.isnan(eliminated), axis=0).astype(np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_a = _group_means(playoff)
+        mean_b = _group_means(eliminated)
+        var_a = np.nansum((playoff - mean_a) ** 2, axis=0) / (n_a - 1)
+        var_b = np.nansum((eliminated - mean_b) ** 2, axis=0) / (n_b - 1)
+        if equal_var:
+            df = n_a + n_b - 2
+            pooled = ((n_a - 1) * var_a + (n_b - 1) * var_b) / df
+            se = np.sqrt(pooled * (1 / n_a + 1 / n_b))
+        else:
+            se_a, se_b = var_a / n_a, var_b / n_b
+            df = (se_a + se_b) ** 2 / (se_a**2 / (n_a - 1) + se_b**2 / (n_b - 1))
+            se = np.sqrt(se_a + se_b)
+        t_stat = (mean_a - mean_b) / se
+    from scipy.stats import t as student_t
+
+    p_value = 2 * student_t.sf(np.abs(t_stat), df)
+    return t_stat, p_value, df
+
+
+def _chunks(total, chunk_size):
+    for start in range(0, total, chunk_size):
+        yield min(chunk_size, total - start)
+
+
+def _mean_differences(weights_a, weights_b, values_a, values_b, present_a, present_b):
+    """
+    Differences of weighted group means for a batch of resamples.
+
+    Each row of weights_a / weights_b gives how many times every observation is
+    drawn into that resample; missing values have zero entries in values_*
+    and present_*, so they drop out of both sums and counts.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_a = (weights_a @ values_a) / (weights_a @ present_a)
+        mean_b = (weights_b @ values_b) / (weights_b @ present_b)
+    return mean_a - mean_b
+
+
+def permutation_pvalues(
+    playoff, eliminated, n_resamples=N_PERMUTATIONS, chunk_size=RESAMPLE_CHUNK, seed=RESAMPLE_SEED
+):
+    """
+    Two-sided permutation test of the difference in means for every column.
+
+    Group labels are shuffled n_resamples times. Each chunk of shuffles is an
+    indicator matrix, so the group sums of all columns come from one matrix
+    product and memory is bounded by chunk_size x rows.
+
+    Args:
+        playoff (np.ndarray): Playoff rows x metrics, NaN for missing.
+        eliminated (np.ndarray): Eliminated rows x metrics, NaN for missing.
+        n_resamples (int): Number of label permutations.
+        chunk_size (int): Permutations evaluated per batch.
+        seed (int, optional): Seed for the resamples (None for fresh randomness).
+
+    Returns:
+        np.ndarray: One p-value per column, (extreme + 1) / (n_resamples + 1), or NaN
+                    for columns without values in both groups.
+    """
+    observed = np.abs(_group_means(playoff) - _group_means(eliminated))
+    if not len(playoff) or not len(eliminated):
+        return np.full(observed.shape, np.nan)
+
+    rng = np.random.default_rng(seed)
+    pooled = np.vstack([playoff, eliminated])
+    present = (~np.isnan(pooled)).astype(np.float64)
+    values = np.nan_to_num(pooled)
+    n, n_a = len(pooled), len(playoff)
+
+    extreme = np.zeros(pooled.shape[1])
+    for size in _chunks(n_resamples, chunk_size):
+        order = rng.permuted(np.tile(np.arange(n), (size, 1)), axis=1)
+        in_a = np.zeros((size, n))
+        np.put_along_axis(in_a, order[:, :n_a], 1.0, axis=1)
+        diffs = _mean_differences(in_a, 1.0 - in_a, values, values, present, present)
+        # Tolerance keeps permutations tied with the observed statistic counted as extreme
+        extreme += np.sum(np.abs(diffs) >= observed * (1 - 1e-12), axis=0)
+    return np.where(np.isnan(observed), np.nan, (extreme + 1) / (n_resamples + 1))
+
+
+def bootstrap_intervals(
+    playoff,
+    eliminated,
+    n_resamples=N_BOOTSTRAP,
+    confidence=0.95,
+    chunk_size=RESAMPLE_CHUNK,
+    seed=RESAMPLE_SEED,
+):
+    """
+    Percentile bootstrap confidence intervals of the difference in means for every column.
+
+    Each group is resampled with replacement; a chunk of resamples is a matrix
+    of draw counts, so the resampled means of all columns come from one matrix
+    product per group and memory is bounded by chunk_size x rows.
+
+    Args:
+        playoff (np.ndarray): Playoff rows x metrics, NaN for missing.
+        eliminated (np.ndarray): Eliminated rows x metrics, NaN for missing.
+        n_resamples (int): Number of bootstrap resamples.
+        confidence (float): Confidence level of the interval.
+        chunk_size (int): Resamples evaluated per batch.
+        seed (int, optional): Seed for the resamples (None for fresh randomness).
+
+    Returns:
+        tuple: (low, high) arrays with one bound per column, NaN when a group is empty.
+    """
+    n_a, n_b = len(playoff), len(eliminated)
+    if not n_a or not n_b:
+        # Nothing to resample (e.g. a season in progress has no playoff teams yet)
+        return np.full(playoff.shape[1], np.nan), np.full(playoff.shape[1], np.nan)
+
+    rng = np.random.default_rng(seed)
+    present_a = (~np.isnan(playoff)).astype(np.float64)
+    present_b = (~np.isnan(eliminated)).astype(np.float64)
+    values_a, values_b = np.nan_to_num(playoff), np.nan_to_num(eliminated)
+
+    diffs = []
+    for size in _chunks(n_resamples, chunk_size):
+        counts_a = rng.multinomial(n_a, np.full(n_a, 1 / n_a), size=size).astype(np.float64)
+        counts_b = rng.multinomial(n_b, np.full(n_b, 1 / n_b), size=size).astype(np.float64)
+        diffs.append(_mean_differences(counts_a, counts_b, values_a, values_b, present_a, present_b))
+    diffs = np.vstack(diffs)
+
+    tail = (1 - confidence) / 2 * 100
+    low, high = np.nanpercentile(diffs, [tail, 100 - tail], axis=0)
+    return low, high
+
+
+def adjust_pvalues(p_values, method="holm"):
+    """
+    Adjusts p-values for multiple comparisons.
+
+    Args:
+        p_values (array-like): Raw p-values (NaN entries are left as NaN).
+        method (str): "bonferroni", "holm" or "fdr_bh" (Benjamini-Hochberg).
+
+    Returns:
+        np.ndarray: Adjusted p-values, capped at 1.
+    """
+    p_values = np.asarray(p_values, dtype=np.float64)
+    adjusted = np.full_like(p_values, np.nan)
+    valid = ~np.isnan(p_values)
+    p = p_values[valid]
+    m = len(p)
+    if m == 0:
+        return adjusted
+
+    if method == "bonferroni":
+        result = p * m
+    elif method == "holm":
+        order = np.argsort(p)
+        steps = np.maximum.accumulate(p[order] * (m - np.arange(m)))
+        result = np.empty(m)
+        result[order] = steps
+    elif method == "fdr_bh":
+        order = np.argsort(p)[::-1]
+        steps = np.minimum.accumulate(p[order] * m / np.arange(m, 0, -1))
+        result = np.empty(m)
+        result[order] = steps
+    else:
+        raise ValueError(f"Unsupported correction method: {method}")
+
+    adjusted[valid] = np.minimum(result, 1.0)
+    return adjusted
+
+
+@INSTRUMENTATION.timed()
+def hypothesis_tests(
+    data,
+    metrics=TEST_METRICS,
+    n_permutations=N_PERMUTATIONS,
+    n_bootstrap=N_BOOTSTRAP,
+    confidence=0.95,
+    correction="holm",
+    chunk_size=RESAMPLE_CHUNK,
+    seed=RESAMPLE_SEED,
+):
+    """
+    Tests every metric for a playoff vs eliminated difference in one batch.
+
+    The data is split into the two groups once; Student's and Welch's t-tests
+    run on all metrics together, followed by a permutation test and a bootstrap
+    confidence interval of the difference in means (skipped when their resample
+    count is 0). Permutation p-values (or Welch's when no permutations are run)
+    are corrected for multiple comparisons.
+
+    Args:
+        data (pd.DataFrame): The dataset to analyze.
+        metrics (list): Metric columns to test.
+        n_permutations (int): Permutation test resamples.
+        n_bootstrap (int): Bootstrap resamples.
+        confidence (float): Confidence level of the bootstrap intervals.
+        correction (str): Multiple-comparison correction, see adjust_pvalues.
+        chunk_size (int): Resamples evaluated per batch.
+        seed (int, optional): Seed for the resamples (None for fresh randomness).
+
+    Returns:
+        pd.DataFrame: One row per metric (index "Metric"). Statistics, p-values and
+                      intervals are NaN when either group is empty.
+    """
+    playoff, eliminated = _split_playoff_groups(data, metrics)
+    t_stat, p_value, _ = _t_tests(playoff, eliminated, equal_var=True)
+    welch_t, welch_p, welch_df = _t_tests(playoff, eliminated, equal_var=False)
+
+    results = pd.DataFrame(
+        {
+            "Playoff N": np.sum(~np.isnan(playoff), axis=0),
+            "Eliminated N": np.sum(~np.isnan(eliminated), axis=0),
+            "Mean Difference": _group_means(playoff) - _group_means(eliminated),
+            "t_stat": t_stat,
+            "p_value": p_value,
+            "Welch t_stat": welch_t,
+            "Welch df": welch_df,
+            "Welch p_value": welch_p,
+        },
+        index=pd.Index(metrics, name="Metric"),
+    )
+
+    tested = welch_p
+    if n_permutations:
+        tested = permutation_pvalues(playoff, eliminated, n_permutations, chunk_size, seed)
+        results["Permutation p_value"] = tested
+    if n_bootstrap:
+        low, high = bootstrap_intervals(playoff, eliminated, n_bootstrap, confidence, chunk_size, seed)
+        results["CI Low"] = low
+        results["CI High"] = high
+    results[f"Adjusted p_value ({correction})"] = adjust_pvalues(tested, correction)
+    return results
+
+
+@INSTRUMENTATION.timed()
 def playoff_vs_non_playoff_comparison(data):
     """
     Performs T-tests comparing playoff vs non-playoff teams for key metrics.
@@ -72,26 +447,8 @@ def playoff_vs_non_playoff_comparison(data):
     Returns:
         dict: Dictionary of T-test results (metric: (t_stat, p_value)).
     """
-    metrics = [
-        "Passing Yards",
-        "Passing TDs",
-        "Interceptions",
-        "Rating",
-        "Rushing Yards",
-        "Rushing TDs",
-        "Total Yards",
-        "Total TDs",
-        "Passing TD to INT Ratio",
-        "4QC",
-        "GWD",
-    ]
-    results = {}
-    for metric in metrics:
-        playoff_data = data[data["Playoff Status"] == "Playoff"][metric]
-        non_playoff_data = data[data["Playoff Status"] == "Eliminated"][metric]
-        if not playoff_data.empty and not non_playoff_data.empty:
-            t_stat, p_value = ttest_ind(
-                playoff_data, non_playoff_data, nan_policy="omit"
-            )
-            results[metric] = (t_stat, p_value)
-    return results
+    playoff, eliminated = _split_playoff_groups(data, TEST_METRICS)
+    if not len(playoff) or not len(eliminated):
+        return {}
+    t_stat, p_value, _ = _t_tests(playoff, eliminated, equal_var=True)
+    return {metric: (t, p) for metric, t, p in zip(TEST_METRICS, t_stat, p_value)}
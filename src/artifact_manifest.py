@@ -0,0 +1,130 @@
+import hashlib
+import json
+import os
+import threading
+from config import MANIFEST_PATH
+
+
+def fingerprint(*parts):
+    """
+    Hashes the inputs that determine an artifact: DataFrames / Series by their
+    values, index, column names and dtypes, anything else by its JSON form.
+
+    Args:
+        *parts: DataFrames, Series or JSON-serializable parameters.
+
+    Returns:
+        str: SHA-256 hex digest.
+    """
+    # Imported here so reading the manifest (e.g. for the status command) does not load pandas
+    import pandas as pd
+
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, (pd.DataFrame, pd.Series)):
+            frame = part.to_frame() if isinstance(part, pd.Series) else part
+            layout = [list(map(str, frame.columns)), list(map(str, frame.dtypes)), list(frame.index.names)]
+            digest.update(json.dumps(layout, default=str).encode("utf-8"))
+            digest.update(pd.util.hash_pandas_object(frame, index=True).values.tobytes())
+        else:
+            digest.update(json.dumps(part, sort_keys=True, default=str).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ArtifactManifest:
+    """
+    Records the input fingerprint of every generated artifact (CSV or figure)
+    so unchanged artifacts are not regenerated.
+
+    The manifest is a JSON file mapping each output path to the fingerprint it
+    was written from and the size of the written file. An artifact is current
+    when the file still exists with that size and its new fingerprint matches.
+    Setting force makes every artifact stale.
+    """
+
+    def __init__(self, path=MANIFEST_PATH, force=False):
+        self.path = path
+        self.force = force
+        self._lock = threading.Lock()
+        self._entries = None
+
+    def _load(self):
+        if self._entries is None:
+            if os.path.exists(self.path):
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            else:
+                self._entries = {}
+        return self._entries
+
+    def _save(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._entries, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def is_current(self, artifact_path, digest):
+        """
+        Args:
+            artifact_path (str): Output file path.
+            digest (str): Fingerprint of the artifact's inputs.
+
+        Returns:
+            bool: True if the artifact can be kept as is.
+        """
+        if self.force:
+            return False
+        with self._lock:
+            entry = self._load().get(os.path.normpath(artifact_path))
+        return (
+            entry is not None
+            and entry["digest"] == digest
+            and os.path.exists(artifact_path)
+            and os.path.getsize(artifact_path) == entry["size"]
+        )
+
+    def paths(self):
+        """
+        Returns:
+            list: Sorted paths of every recorded artifact.
+        """
+        with self._lock:
+            return sorted(self._load())
+
+    def digest(self, artifact_path):
+        """
+        Args:
+            artifact_path (str): Output file path.
+
+        Returns:
+            str or None: Fingerprint the artifact was last written from, or None
+                         if it is not in the manifest or the file has changed size since.
+        """
+        with self._lock:
+            entry = self._load().get(os.path.normpath(artifact_path))
+        if entry is None or not os.path.exists(artifact_path):
+            return None
+        return entry["digest"] if os.path.getsize(artifact_path) == entry["size"] else None
+
+    def record(self, artifact_path, digest):
+        """
+        Records that an artifact was just written from inputs with this fingerprint.
+
+        Args:
+            artifact_path (str): Output file path.
+            digest (str): Fingerprint of the artifact's inputs.
+        """
+        with self._lock:
+            self._load()[os.path.normpath(artifact_path)] = {
+                "digest": digest,
+                "size": os.path.getsize(artifact_path),
+            }
+            self._save()
+
+
+# Shared manifest for every CSV and figure the pipeline writes
+ARTIFACT_MANIFEST = ArtifactManifest()
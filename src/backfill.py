@@ -0,0 +1,162 @@
+import os
+import pandas as pd
+from config import CRAWL_DIR, BACKFILL_BATCH
+from crawl_queue import CrawlQueue
+from get_data import (
+    fetch_pages,
+    scrape_qb_pass_stats,
+    scrape_qb_rush_stats,
+    season_standings,
+    playoff_team_status,
+    _merge_seasons,
+    SEASON_STORE,
+)
+from instrumentation import INSTRUMENTATION
+from page_schema import apply_schema
+
+# Tasks that must be done before a task can run
+DEPENDENCIES = {
+    "passing": [],
+    "rushing": ["passing"],
+    "standings": [],
+    "combine": ["passing", "rushing", "standings"],
+}
+
+
+def checkpoint_path(year, page, crawl_dir=CRAWL_DIR):
+    """
+    Returns:
+        str: Path of the parsed-result checkpoint of a (year, page) task.
+    """
+    return os.path.join(crawl_dir, "checkpoints", str(year), f"{page}.parquet")
+
+
+def write_checkpoint(df, path):
+    """
+    Writes a task's parsed DataFrame to a temporary file and renames it into
+    place, so a checkpoint is either complete or absent.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    df.reset_index(drop=True).to_parquet(tmp_path, engine="pyarrow", index=False)
+    os.replace(tmp_path, path)
+
+
+def read_checkpoint(path):
+    return pd.read_parquet(path, engine="pyarrow")
+
+
+def _scrape_passing(year, pages, queue):
+    return scrape_qb_pass_stats(year, response=pages.get((year, "passing")))
+
+
+def _scrape_rushing(year, pages, queue):
+    passing = read_checkpoint(queue.checkpoint(year, "passing"))
+    return scrape_qb_rush_stats(year, passing, response=pages.get((year, "rushing")))
+
+
+def _parse_standings(year, pages, queue):
+    response = pages.get((year, "standings"))
+    if not response:
+        raise RuntimeError("standings page could not be fetched")
+    return season_standings(year, response)
+
+
+def _combine_season(year, pages, queue):
+    passing = read_checkpoint(queue.checkpoint(year, "passing"))
+    rushing = read_checkpoint(queue.checkpoint(year, "rushing"))
+    standings = read_checkpoint(queue.checkpoint(year, "standings"))
+    merged = _merge_seasons([year], {year: (passing, rushing)})
+    if merged is None:
+        return None
+    return apply_schema(playoff_team_status(merged, years=[year], standings={year: standings}))
+
+
+TASK_RUNNERS = {
+    "passing": _scrape_passing,
+    "rushing": _scrape_rushing,
+    "standings": _parse_standings,
+    "combine": _combine_season,
+}
+
+
+def _run_task(queue, year, page, pages, store, crawl_dir):
+    """
+    Runs one task, checkpoints its result and records the outcome in the queue.
+
+    Returns:
+        bool: True if the task finished.
+    """
+    if any(queue.state(year, dependency) != "done" for dependency in DEPENDENCIES[page]):
+        # Left pending until the tasks it depends on succeed
+        return False
+
+    queue.start(year, page)
+    try:
+        with INSTRUMENTATION.stage("backfill_task", year=year, page=page) as record:
+            df = TASK_RUNNERS[page](year, pages, queue)
+            if df is None or df.empty:
+                raise RuntimeError(f"no {page} data found")
+            if page == "combine":
+                # The season store partition is the checkpoint of a combined season
+                store.write(df)
+                path = None
+            else:
+                path = checkpoint_path(year, page, crawl_dir)
+                write_checkpoint(df, path)
+            record["rows"] = len(df)
+    except Exception as e:
+        queue.fail(year, page, e)
+        print(f"Task {page} {year} failed: {e}")
+        return False
+
+    queue.finish(year, page, rows=len(df), checkpoint=path)
+    return True
+
+
+def run_backfill(years, queue=None, store=SEASON_STORE, batch=BACKFILL_BATCH, crawl_dir=CRAWL_DIR, retry_failed=False):
+    """
+    Crawls many seasons through a persistent task queue, so an interrupted
+    backfill resumes where it stopped.
+
+    Every season is split into passing, rushing and standings tasks, each
+    checkpointing its parsed DataFrame under crawl_dir before it is marked
+    done, and a combine task that merges the checkpoints and writes the
+    season to the store. Seasons are processed in batches whose pages are
+    fetched concurrently. Tasks already done are skipped, tasks interrupted
+    mid-run are redone, and failed tasks are retried on later runs until
+    they run out of attempts.
+
+    Args:
+        years (list): Seasons to backfill.
+        queue (crawl_queue.CrawlQueue, optional): Task queue. Defaults to the one in crawl_dir.
+        store (season_store.SeasonStore): Store that receives each combined season.
+        batch (int): Seasons fetched concurrently per batch.
+        crawl_dir (str): Directory of the queue database and checkpoints.
+        retry_failed (bool): Give failed tasks a fresh set of attempts first.
+
+    Returns:
+        crawl_queue.CrawlQueue: The queue, for progress reporting.
+    """
+    if queue is None:
+        queue = CrawlQueue(os.path.join(crawl_dir, "queue.sqlite"))
+    years = sorted(set(years))
+    queue.enqueue(years)
+    recovered = queue.recover()
+    if recovered:
+        print(f"Resuming: {recovered} interrupted task(s) returned to pending")
+    if retry_failed:
+        print(f"Retrying {queue.retry_failed()} failed task(s)")
+
+    for start in range(0, len(years), batch):
+        tasks = queue.runnable(years[start:start + batch])
+        if not tasks:
+            continue
+        # Only the pages of runnable tasks: pages of tasks already done are not fetched again
+        fetch_tasks = [(year, page) for year, page in tasks if page != "combine"]
+        pages = fetch_pages(fetch_tasks) if fetch_tasks else {}
+        for year, page in tasks:
+            _run_task(queue, year, page, pages, store, crawl_dir)
+
+    queue.print_progress()
+    return queue
@@ -1,6 +1,18 @@
 #
 import re
-from config import TEAM_NAME_MAPPING
+import numpy as np
+import pandas as pd
+from team_resolver import TEAM_RESOLVER
+
+# Annotations such as footnote markers in parentheses or brackets
+ANNOTATION_PATTERN = re.compile(r"\(.*?\)|\[.*?\]")
+# Lines of a newline-joined column that int() / float() would reject
+INVALID_INT_LINE = re.compile(r"\n(?![^\S\n]*[+-]?\d+[^\S\n]*(?:\n|$))[^\n]*")
+INVALID_FLOAT_LINE = re.compile(
+    r"\n(?![^\S\n]*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?[^\S\n]*(?:\n|$))[^\n]*"
+)
+# Player page links, e.g. /players/M/MahoPa00.htm
+PLAYER_LINK_PATTERN = re.compile(r"/players/[A-Za-z]/([\w.-]+)\.htm")
 
 
 def clean_text(value, data_type=str):
@@ -15,7 +27,7 @@ def clean_text(value, data_type=str):
     Returns:
         Converted value or None if conversion fails.
     """
-    value = re.sub(r"\(.*?\)|\[.*?\]", "", value).strip()  # Remove annotations
+    value = ANNOTATION_PATTERN.sub("", value).strip()  # Remove annotations
     if value == "":
         return None
     try:
@@ -24,26 +36,86 @@ def clean_text(value, data_type=str):
         return None
 
 
-def standardize_team_names(df):
+def clean_column(values, data_type=str):
     """
-    Standardizes team names using the team_name_mapping dictionary.
+    Vectorized version of clean_text for a whole column of raw cell strings.
+    The column is joined into one newline-separated block so annotations and
+    commas are removed by single passes over the whole block, invalid numbers
+    are blanked by one regex pass, and the result is cast in one call.
+    Missing values appear exactly where clean_text would return None.
 
     Args:
-        df (pd.DataFrame): DataFrame containing QB stats.
+        values (list): Raw string values (None for absent cells).
+        data_type (type): int, float or str.
 
     Returns:
-        pd.DataFrame: DataFrame with standardized team names.
+        Array for a DataFrame column: Int64 or Float64 for numbers, an object
+        ndarray (NaN for missing) for strings.
     """
-    df["Standardized Team"] = df["Team"].map(TEAM_NAME_MAPPING)
+    values = ["" if value is None else value for value in values]
+    block = "\n".join(values)
+    if block.count("\n") != max(len(values) - 1, 0):
+        # A cell contains a newline itself, so lines no longer map to cells
+        cleaned = [clean_text(value, data_type) for value in values]
+        if data_type is str:
+            return np.array([np.nan if value is None else value for value in cleaned], dtype=object)
+        return pd.array(cleaned, dtype="Int64" if data_type is int else "Float64")
 
-    # Handle unmapped teams explicitly
-    unmapped_teams = df[df["Standardized Team"].isna()]["Team"].unique()
-    if len(unmapped_teams) > 0:
-        print(
-            f"Teams missing from mapping (Standardized Team is NaN): {unmapped_teams}"
-        )
+    if "(" in block or "[" in block:
+        block = ANNOTATION_PATTERN.sub("", block)  # Remove annotations
+    lines = block.split("\n") if values else []
 
-    # Fill NaN values with "Unknown" or drop rows
-    df["Standardized Team"] = df["Standardized Team"].fillna("Unknown")
+    if data_type is str:
+        cleaned = [line.strip().replace(",", "") for line in lines]
+        return np.array([value if value else np.nan for value in cleaned], dtype=object)
 
+    block = block.replace(",", "")  # Remove commas for numbers
+    invalid = INVALID_INT_LINE if data_type is int else INVALID_FLOAT_LINE
+    block = invalid.sub("\nnan", "\n" + block)[1:]
+    numbers = np.array(block.split("\n") if values else [], dtype=np.float64)
+    missing = np.isnan(numbers)
+    if data_type is int:
+        numbers[missing] = 0
+        return pd.arrays.IntegerArray(numbers.astype(np.int64), missing)
+    return pd.arrays.FloatingArray(numbers, missing)
+
+
+def player_id_from_link(link):
+    """
+    Extracts the site's player ID from a player page link.
+
+    Args:
+        link (str): href of the player cell's link, or None.
+
+    Returns:
+        str or None: Player ID (e.g. "MahoPa00"), or None if the link is not a player page.
+    """
+    if not link:
+        return None
+    match = PLAYER_LINK_PATTERN.search(link)
+    return match.group(1) if match else None
+
+
+def standardize_team_names(df):
+    """
+    Standardizes team names to their current franchise with TEAM_RESOLVER.
+
+    "Standardized Team" is a categorical whose codes are the franchise IDs
+    (see team_resolver.TeamResolver), so joins can run on its integer codes.
+    Abbreviations another franchise used in earlier seasons are resolved by
+    the "Year" column. Players listed with several teams ("2TM") get a
+    missing team; names not in the mapping become "Unknown" and are reported
+    together.
+
+    Args:
+        df (pd.DataFrame): DataFrame containing QB stats.
+
+    Returns:
+        pd.DataFrame: DataFrame with standardized team names.
+    """
+    years = df["Year"].astype("int64") if "Year" in df.columns else None
+    codes, unknown = TEAM_RESOLVER.codes(df["Team"], years)
+    if unknown:
+        print(f"Teams missing from mapping (Standardized Team is Unknown): {unknown}")
+    df["Standardized Team"] = TEAM_RESOLVER.names(codes)
     return df
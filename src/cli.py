@@ -0,0 +1,279 @@
+"""
+Command line entry point for the QB stats pipeline.
+
+Usage (from src/, or with src/ on PYTHONPATH):
+    python -m cli status
+    python -m cli scrape [--years 2013 2021 2022]
+    python -m cli combine [--years 2013 2021 2022]
+    python -m cli backfill --range 1970 2024 [--retry-failed]
+    python -m cli pack
+    python -m cli reparse [--years 2013 2021] [--workers 4]
+    python -m cli analyze [--force]
+    python -m cli plot [--force] [--facet]
+    python -m cli --metrics stages.jsonl --trace trace.json combine
+
+Only the standard library, config and instrumentation are imported up front.
+Each subcommand lists the modules it needs and they are imported when it
+runs, so status and --help never load pandas, requests, scipy or matplotlib.
+"""
+
+import argparse
+import importlib
+import logging
+from collections import namedtuple
+from config import LOG_LEVEL, PACK_PATH, PARSE_WORKERS, SEASONS
+from instrumentation import INSTRUMENTATION
+
+# A subcommand: modules imported before its handler runs, the handler and its help text
+Command = namedtuple("Command", ["modules", "handler", "help"])
+
+
+def _scrape(args):
+    from get_data import RUN_REPORT
+    from http_session import HTTP_SESSION
+
+    if args.sinks:
+        from get_data import export_season_stream
+
+        results = export_season_stream(args.years, args.sinks)
+        for page, outputs in results.items():
+            for name, output in zip(args.sinks, outputs):
+                if name == "aggregate" and output is not None:
+                    print(f"\n{page.capitalize()} totals by season:")
+                    print(output)
+    else:
+        from parse_pipeline import run_season_pipeline
+
+        season_stats, _ = run_season_pipeline(args.years, pages=("passing", "rushing"))
+        print(f"Scraped {len(season_stats)} of {len(set(args.years))} seasons.")
+    RUN_REPORT.print_report()
+    HTTP_SESSION.print_stats()
+
+
+def _combine(args):
+    from get_data import combine_qb_stats, RUN_REPORT
+    from http_session import HTTP_SESSION
+
+    combined_df = combine_qb_stats(args.years, args.output)
+    if combined_df is None:
+        print("Failed to combine QB Stats.")
+    RUN_REPORT.print_report()
+    HTTP_SESSION.print_stats()
+
+
+def _backfill(args):
+    from backfill import run_backfill
+    from get_data import RUN_REPORT
+    from http_session import HTTP_SESSION
+
+    years = list(range(args.range[0], args.range[1] + 1)) if args.range else args.years
+    run_backfill(years, retry_failed=args.retry_failed)
+    RUN_REPORT.print_report()
+    HTTP_SESSION.print_stats()
+
+
+def _pack(args):
+    from page_pack import PagePack, pack_page_cache
+
+    pack = PagePack(args.pack)
+    pack_page_cache(pack)
+    stats = pack.stats()
+    print(f"{pack.path}: {stats['pages']} pages of {stats['years']} seasons, {stats['bytes'] / 1024:.1f} KiB")
+
+
+def _reparse(args):
+    from get_data import combine_qb_stats, PAGE_CACHE, RUN_REPORT
+    from page_pack import PagePack, reparse_pack
+
+    # Everything comes from the pack: seasons without packed standings are not fetched either
+    PAGE_CACHE.offline = True
+    pack = PagePack(args.pack)
+    years = args.years or pack.years()
+    season_stats, standings = reparse_pack(pack, years, workers=args.workers)
+    combined_df = combine_qb_stats(
+        years, args.output, season_stats=season_stats, standings=standings, store=None
+    )
+    if combined_df is None:
+        print("Failed to combine QB Stats.")
+    RUN_REPORT.print_report()
+
+
+def _analyze(args):
+    from artifact_manifest import ARTIFACT_MANIFEST
+    from run_analysis_visualization import load_data, analyze
+
+    ARTIFACT_MANIFEST.force = args.force
+    analyze(load_data(args.input))
+
+
+def _plot(args):
+    from artifact_manifest import ARTIFACT_MANIFEST
+    from run_analysis_visualization import load_data, plot
+
+    ARTIFACT_MANIFEST.force = args.force
+    plot(load_data(args.input), facet=args.facet)
+
+
+def _status(args):
+    import os
+    import time
+    from artifact_manifest import ARTIFACT_MANIFEST
+    from config import CRAWL_DIR
+    from crawl_queue import CrawlQueue
+    from page_cache import PageCache
+    from page_pack import PagePack
+    from season_store import SeasonStore
+
+    store = SeasonStore()
+    stored = store.years()
+    print(f"Season store ({store.store_dir}):")
+    for year in sorted(set(args.years) | set(stored)):
+        if year not in stored:
+            state = "missing"
+        else:
+            modified = time.strftime("%Y-%m-%d %H:%M", time.localtime(store.modified(year)))
+            state = f"{'stale' if store.is_stale(year) else 'fresh'}, written {modified}"
+        print(f"  {year}: {state}")
+
+    cache = PageCache()
+    stats = cache.stats()
+    print(
+        f"Page cache ({cache.cache_dir}): {stats['urls']} URLs, "
+        f"{stats['objects']} objects, {stats['bytes'] / 1024:.1f} KiB"
+    )
+
+    pack = PagePack()
+    if os.path.exists(pack.index_path):
+        stats = pack.stats()
+        print(
+            f"Page pack ({pack.path}): {stats['pages']} pages of {stats['years']} seasons, "
+            f"{stats['bytes'] / 1024:.1f} KiB ({stats['size'] / 1024:.1f} KiB uncompressed)"
+        )
+
+    queue_path = os.path.join(CRAWL_DIR, "queue.sqlite")
+    if os.path.exists(queue_path):
+        CrawlQueue(queue_path).print_progress()
+
+    paths = ARTIFACT_MANIFEST.paths()
+    current = [path for path in paths if ARTIFACT_MANIFEST.digest(path)]
+    print(f"Artifacts ({ARTIFACT_MANIFEST.path}): {len(current)} of {len(paths)} unchanged since written")
+    for path in paths:
+        if path not in current:
+            print(f"  changed or missing: {path}")
+
+
+COMMANDS = {
+    "scrape": Command(["get_data", "parse_pipeline"], _scrape, "Scrape passing and rushing stats per season."),
+    "combine": Command(["get_data"], _combine, "Combine seasons with playoff status (refreshes stale seasons only)."),
+    "backfill": Command(["backfill"], _backfill, "Resumably crawl many seasons into the season store."),
+    "pack": Command(["page_pack"], _pack, "Archive the season pages in the page cache into the page pack."),
+    "reparse": Command(
+        ["page_pack", "parse_pipeline"],
+        _reparse,
+        "Re-parse packed season pages into combined stats without fetching.",
+    ),
+    "analyze": Command(["run_analysis_visualization"], _analyze, "Compute descriptive statistics and playoff tests."),
+    "plot": Command(["run_analysis_visualization", "visualize_results"], _plot, "Draw correlation heatmaps and playoff boxplots."),
+    "status": Command(
+        ["season_store", "page_cache", "page_pack", "artifact_manifest", "crawl_queue"],
+        _status,
+        "Show stored seasons, backfill progress, page cache, page pack and artifacts.",
+    ),
+}
+
+
+def load_command(name):
+    """
+    Imports the modules a subcommand needs.
+
+    Args:
+        name (str): Key of COMMANDS.
+
+    Returns:
+        Command: The loaded subcommand.
+    """
+    command = COMMANDS[name]
+    for module in command.modules:
+        importlib.import_module(module)
+    return command
+
+
+def build_parser():
+    """
+    Returns:
+        argparse.ArgumentParser: Parser with one subparser per entry of COMMANDS.
+    """
+    parser = argparse.ArgumentParser(prog="python -m cli", description="NFL QB stats pipeline.")
+    parser.add_argument(
+        "--metrics", default=INSTRUMENTATION.log_path, help="Append per-stage metrics to this JSON lines file."
+    )
+    parser.add_argument(
+        "--trace", default=INSTRUMENTATION.trace_path, help="Write a Chrome trace of the stages to this file."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for name, command in COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=command.help, description=command.help)
+        if name in ("scrape", "combine", "backfill", "status"):
+            subparser.add_argument(
+                "--years", type=int, nargs="+", default=SEASONS, help="Seasons to process (default: config.SEASONS)."
+            )
+        if name == "scrape":
+            subparser.add_argument(
+                "--sinks",
+                nargs="+",
+                metavar="SINK",
+                help="Stream seasons one at a time into these stat_sinks.SINKS (csv, parquet, aggregate) "
+                "instead of scraping them all in memory.",
+            )
+        if name == "backfill":
+            subparser.add_argument(
+                "--range", type=int, nargs=2, metavar=("FIRST", "LAST"), help="Backfill every season from FIRST to LAST."
+            )
+            subparser.add_argument(
+                "--retry-failed", action="store_true", help="Give failed tasks a fresh set of attempts."
+            )
+        if name == "combine":
+            subparser.add_argument(
+                "--output", default="qb_combined_stats_with_playoff_status.csv", help="Combined stats CSV."
+            )
+        if name in ("pack", "reparse"):
+            subparser.add_argument("--pack", default=PACK_PATH, help="Page pack file.")
+        if name == "reparse":
+            subparser.add_argument(
+                "--years", type=int, nargs="+", help="Seasons to re-parse (default: every packed season)."
+            )
+            subparser.add_argument(
+                "--workers", type=int, default=PARSE_WORKERS, help="Parse processes (0 parses in-process)."
+            )
+            subparser.add_argument(
+                "--output", default="qb_combined_stats_reparsed.csv", help="Combined stats CSV of the re-parsed seasons."
+            )
+        if name in ("analyze", "plot"):
+            subparser.add_argument(
+                "--input", default="qb_combined_stats_with_playoff_status.csv", help="Combined stats export to read."
+            )
+            subparser.add_argument(
+                "--force",
+                action="store_true",
+                help="Regenerate every output even if its inputs are unchanged.",
+            )
+        if name == "plot":
+            subparser.add_argument(
+                "--facet", action="store_true", help="Draw each group of figures into a single file."
+            )
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=LOG_LEVEL, format="%(levelname)s %(name)s: %(message)s")
+    INSTRUMENTATION.log_path = args.metrics
+    INSTRUMENTATION.trace_path = args.trace
+    load_command(args.command).handler(args)
+    if INSTRUMENTATION.records:
+        INSTRUMENTATION.print_summary()
+        INSTRUMENTATION.close()
+
+
+if __name__ == "__main__":
+    main()
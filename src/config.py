@@ -1,8 +1,13 @@
+import os
+
 TEAM_NAME_MAPPING = {
     # Arizona Cardinals
     "ARI": "Arizona Cardinals",
     "Ariz.": "Arizona Cardinals",
     "Cardinals": "Arizona Cardinals",
+    "PHO": "Arizona Cardinals",  # Historical name: Phoenix Cardinals
+    "Phoenix Cardinals": "Arizona Cardinals",
+    "St. Louis Cardinals": "Arizona Cardinals",
     # Atlanta Falcons
     "ATL": "Atlanta Falcons",
     "Atl.": "Atlanta Falcons",
@@ -56,6 +61,7 @@ TEAM_NAME_MAPPING = {
     "IND": "Indianapolis Colts",
     "Ind.": "Indianapolis Colts",
     "Colts": "Indianapolis Colts",
+    "Baltimore Colts": "Indianapolis Colts",
     # Jacksonville Jaguars
     "JAX": "Jacksonville Jaguars",
     "Jax.": "Jacksonville Jaguars",
@@ -71,6 +77,8 @@ TEAM_NAME_MAPPING = {
     "Raiders": "Las Vegas Raiders",
     "OAK": "Las Vegas Raiders",  # Historical name: Oakland Raiders
     "Oakland Raiders": "Las Vegas Raiders",
+    "RAI": "Las Vegas Raiders",  # Historical name: Los Angeles Raiders
+    "Los Angeles Raiders": "Las Vegas Raiders",
     # Los Angeles Chargers
     "LAC": "Los Angeles Chargers",
     "SDG": "Los Angeles Chargers",  # Historical name: San Diego Chargers
@@ -79,6 +87,7 @@ TEAM_NAME_MAPPING = {
     "LAR": "Los Angeles Rams",
     "STL": "Los Angeles Rams",  # Historical name: St. Louis Rams
     "St. Louis Rams": "Los Angeles Rams",
+    "RAM": "Los Angeles Rams",  # Los Angeles Rams before the move to St. Louis
     # Miami Dolphins
     "MIA": "Miami Dolphins",
     "Mia.": "Miami Dolphins",
@@ -91,6 +100,8 @@ TEAM_NAME_MAPPING = {
     "NE": "New England Patriots",
     "NWE": "New England Patriots",
     "Patriots": "New England Patriots",
+    "BOS": "New England Patriots",  # Historical name: Boston Patriots
+    "Boston Patriots": "New England Patriots",
     # New Orleans Saints
     "NO": "New Orleans Saints",
     "NOR": "New Orleans Saints",
@@ -121,6 +132,8 @@ TEAM_NAME_MAPPING = {
     # Tennessee Titans
     "TEN": "Tennessee Titans",
     "Titans": "Tennessee Titans",
+    "Houston Oilers": "Tennessee Titans",
+    "Tennessee Oilers": "Tennessee Titans",
     # Washington Teams
     "WAS": "Washington Commanders",
     "Washington Redskins": "Washington Commanders",
@@ -128,7 +141,129 @@ TEAM_NAME_MAPPING = {
     "Washington Commanders": "Washington Commanders",
     "Commanders": "Washington Commanders",  # Add shorthand
     "Washington": "Washington Commanders",  # Add generic case
-    # Multiple Teams
-    "2TM": "None",  # Players traded between teams
-    "None": "None",  # Placeholder for traded players or missing teams
+    # Multiple Teams: no single franchise (see team_resolver.NO_TEAM)
+    "2TM": None,  # Players traded between teams
+    "3TM": None,
+    "4TM": None,
+    "None": None,  # Placeholder for missing teams
 }
+
+# Stable integer ID of every franchise (team_resolver franchise codes). The IDs
+# are stored in backfill standings checkpoints, so never renumber or reuse one:
+# rename a franchise in place and give a new franchise the next unused ID.
+FRANCHISE_IDS = {
+    "Arizona Cardinals": 0,
+    "Atlanta Falcons": 1,
+    "Baltimore Ravens": 2,
+    "Buffalo Bills": 3,
+    "Carolina Panthers": 4,
+    "Chicago Bears": 5,
+    "Cincinnati Bengals": 6,
+    "Cleveland Browns": 7,
+    "Dallas Cowboys": 8,
+    "Denver Broncos": 9,
+    "Detroit Lions": 10,
+    "Green Bay Packers": 11,
+    "Houston Texans": 12,
+    "Indianapolis Colts": 13,
+    "Jacksonville Jaguars": 14,
+    "Kansas City Chiefs": 15,
+    "Las Vegas Raiders": 16,
+    "Los Angeles Chargers": 17,
+    "Los Angeles Rams": 18,
+    "Miami Dolphins": 19,
+    "Minnesota Vikings": 20,
+    "New England Patriots": 21,
+    "New Orleans Saints": 22,
+    "New York Giants": 23,
+    "New York Jets": 24,
+    "Philadelphia Eagles": 25,
+    "Pittsburgh Steelers": 26,
+    "San Francisco 49ers": 27,
+    "Seattle Seahawks": 28,
+    "Tampa Bay Buccaneers": 29,
+    "Tennessee Titans": 30,
+    "Washington Commanders": 31,
+}
+
+# Codes the site reused for a different franchise in earlier seasons:
+# alias -> [(first season, last season, current franchise name)]. Outside
+# these ranges the alias resolves through TEAM_NAME_MAPPING.
+TEAM_SEASON_ALIASES = {
+    "BAL": [(1953, 1983, "Indianapolis Colts")],  # Baltimore Colts
+    "HOU": [(1960, 1996, "Tennessee Titans")],  # Houston Oilers
+    "STL": [(1960, 1987, "Arizona Cardinals")],  # St. Louis Cardinals
+}
+
+# On-disk page cache used by get_data.request_with_retry
+CACHE_DIR = os.environ.get("QB_CACHE_DIR", ".page_cache")
+CACHE_MAX_BYTES = 200 * 1024 * 1024  # Evict least recently used pages above this size
+CURRENT_SEASON_TTL = 60 * 60  # Seconds before a page for the current season is revalidated
+CACHE_OFFLINE = os.environ.get("QB_CACHE_OFFLINE", "0") == "1"  # Replay cached pages only
+CACHE_INDEX_FLUSH_INTERVAL = 60  # Seconds between index writes for cache hits (access times only)
+
+# Combined QB stats store, one Parquet partition per season (see season_store.SeasonStore)
+STORE_DIR = os.environ.get("QB_STORE_DIR", "qb_store")
+
+# Site-wide request rate limit (Pro Football Reference allows about 20 requests per minute)
+REQUESTS_PER_MINUTE = 20
+RATE_LIMIT_BURST = 1  # Requests allowed back-to-back before the limiter starts spacing them
+FETCH_WORKERS = 4  # Threads fetching season pages concurrently
+
+# HTTP session settings
+BASE_URL = os.environ.get("QB_BASE_URL", "https://www.pro-football-reference.com")  # Point at a local stand-in server for testing
+CONNECT_TIMEOUT = 5  # Seconds to establish a connection
+READ_TIMEOUT = 30  # Seconds to wait for data on an open connection
+BACKOFF_BASE = 5  # Base delay in seconds for full-jitter exponential backoff
+BACKOFF_CAP = 120  # Maximum backoff delay in seconds
+
+# Figure rendering (see visualize_results.render_figures)
+PLOT_WORKERS = min(4, os.cpu_count() or 1)  # Processes rendering figures in parallel
+PLOT_BACKEND = "Agg"  # Non-interactive backend used by the rendering workers
+
+# Resampling tests in analyze_data.hypothesis_tests
+N_PERMUTATIONS = 10000  # Label permutations per metric
+N_BOOTSTRAP = 10000  # Bootstrap resamples per metric
+RESAMPLE_CHUNK = 1000  # Resamples evaluated per batch (bounds memory to chunk x rows)
+RESAMPLE_SEED = 510  # Fixed seed so reruns on unchanged data give identical results
+
+# Rows per chunk read by streaming_stats when summarizing large datasets
+STATS_CHUNK_ROWS = 100000
+
+# Fingerprints of generated CSVs and figures, used to skip unchanged outputs
+MANIFEST_PATH = os.environ.get("QB_MANIFEST_PATH", ".artifact_manifest.json")
+
+# Log level for diagnostic output such as per-team standings parsing (e.g. "DEBUG")
+LOG_LEVEL = os.environ.get("QB_LOG_LEVEL", "WARNING")
+
+# Table extraction backend used by the scrapers ("stream" or "bs4", see table_extract.BACKENDS)
+EXTRACT_BACKEND = "stream"
+
+# Formats written for the exported datasets (keys of export_csv.FORMATS).
+# CSV keeps one file per season; Parquet / Feather hold every season in one file.
+EXPORT_FORMATS = ("csv", "parquet")
+
+# Seasons scraped by main.py and by the CLI when no --years are given
+SEASONS = [2013, 2021, 2022]
+
+# Stage instrumentation (see instrumentation.Instrumentation): JSON lines log and Chrome trace file.
+# Both are off unless a path is given.
+INSTRUMENT_LOG = os.environ.get("QB_INSTRUMENT_LOG")
+TRACE_PATH = os.environ.get("QB_TRACE_PATH")
+
+# Resumable backfills (see backfill.run_backfill): task queue database and parsed-page checkpoints
+CRAWL_DIR = os.environ.get("QB_CRAWL_DIR", "qb_crawl")
+MAX_TASK_ATTEMPTS = 3  # Attempts per (year, page) task before it stays failed
+BACKFILL_BATCH = 4  # Seasons whose pages are fetched concurrently per batch
+
+# Season pipeline (see parse_pipeline.run_season_pipeline): processes extracting tables from
+# fetched pages (0 parses in-process) and the bounded queues between its stages
+PARSE_WORKERS = int(os.environ.get("QB_PARSE_WORKERS", min(4, os.cpu_count() or 1)))
+PAGE_QUEUE_DEPTH = 8  # Fetched pages waiting for a parse worker
+TABLE_QUEUE_DEPTH = 8  # Parsed pages waiting for the merge stage
+
+# Table rows cleaned per batch by the streaming scrapers (see get_data.stream_pass_stats)
+STREAM_BATCH_ROWS = 5000
+
+# Append-only archive of raw season pages for re-parsing without refetching (see page_pack.PagePack)
+PACK_PATH = os.environ.get("QB_PACK_PATH", "qb_pages.pack")
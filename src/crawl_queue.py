@@ -0,0 +1,221 @@
+import os
+import sqlite3
+import threading
+import time
+from config import CRAWL_DIR, MAX_TASK_ATTEMPTS
+
+# Task kinds per season, in the order they run: the three scraped pages, then
+# "combine", which merges the season's checkpoints into the season store
+TASK_PAGES = ["passing", "rushing", "standings", "combine"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    year INTEGER NOT NULL,
+    page TEXT NOT NULL,
+    page_order INTEGER NOT NULL,
+    state TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    rows INTEGER,
+    checkpoint TEXT,
+    error TEXT,
+    started REAL,
+    finished REAL,
+    PRIMARY KEY (year, page)
+)
+"""
+
+
+class CrawlQueue:
+    """
+    Persistent queue of (year, page) crawl tasks stored in SQLite.
+
+    Every task is "pending", "running", "done" or "failed". Enqueuing is
+    idempotent, so the same backfill can be started any number of times; a
+    restart first returns tasks left "running" by an interrupted run to
+    "pending". Failed tasks are retried until they have been attempted
+    max_attempts times. Only the standard library is used, so progress can be
+    read without loading the scraping stack.
+    """
+
+    def __init__(self, path=os.path.join(CRAWL_DIR, "queue.sqlite"), max_attempts=MAX_TASK_ATTEMPTS):
+        self.path = path
+        self.max_attempts = max_attempts
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(_SCHEMA)
+
+    def _connect(self):
+        # A connection per call: cheap for SQLite and safe across threads
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _execute(self, sql, params=()):
+        with self._lock, self._connect() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def enqueue(self, years, pages=TASK_PAGES):
+        """
+        Adds a pending task for every (year, page) not queued yet.
+
+        Args:
+            years (list): Seasons to crawl.
+            pages (list): Task kinds (keys of TASK_PAGES) per season.
+        """
+        with self._lock, self._connect() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO tasks (year, page, page_order) VALUES (?, ?, ?)",
+                [(year, page, TASK_PAGES.index(page)) for year in sorted(set(years)) for page in pages],
+            )
+
+    def recover(self):
+        """
+        Returns tasks left "running" by an interrupted run to "pending".
+
+        Returns:
+            int: Number of recovered tasks.
+        """
+        with self._lock, self._connect() as conn:
+            return conn.execute("UPDATE tasks SET state = 'pending' WHERE state = 'running'").rowcount
+
+    def retry_failed(self):
+        """
+        Gives every failed task a fresh set of attempts.
+
+        Returns:
+            int: Number of reset tasks.
+        """
+        with self._lock, self._connect() as conn:
+            return conn.execute(
+                "UPDATE tasks SET state = 'pending', attempts = 0, error = NULL WHERE state = 'failed'"
+            ).rowcount
+
+    def runnable(self, years=None):
+        """
+        Args:
+            years (list, optional): Only consider these seasons.
+
+        Returns:
+            list: (year, page) of pending tasks and failed tasks with attempts
+                  left, by year and then TASK_PAGES order.
+        """
+        rows = self._execute(
+            "SELECT year, page FROM tasks"
+            " WHERE state = 'pending' OR (state = 'failed' AND attempts < ?)"
+            " ORDER BY year, page_order",
+            (self.max_attempts,),
+        )
+        if years is not None:
+            years = set(years)
+            rows = [row for row in rows if row[0] in years]
+        return [tuple(row) for row in rows]
+
+    def state(self, year, page):
+        """
+        Returns:
+            str or None: State of a task, or None if it is not queued.
+        """
+        rows = self._execute("SELECT state FROM tasks WHERE year = ? AND page = ?", (year, page))
+        return rows[0][0] if rows else None
+
+    def checkpoint(self, year, page):
+        """
+        Returns:
+            str or None: Checkpoint path of a finished task.
+        """
+        rows = self._execute(
+            "SELECT checkpoint FROM tasks WHERE year = ? AND page = ? AND state = 'done'", (year, page)
+        )
+        return rows[0][0] if rows else None
+
+    def start(self, year, page):
+        """
+        Marks a task as running and counts the attempt.
+        """
+        self._execute(
+            "UPDATE tasks SET state = 'running', attempts = attempts + 1, started = ?, error = NULL"
+            " WHERE year = ? AND page = ?",
+            (time.time(), year, page),
+        )
+
+    def finish(self, year, page, rows=None, checkpoint=None):
+        """
+        Marks a task as done. Call only once its checkpoint is durably written.
+
+        Args:
+            year (int): Task season.
+            page (str): Task kind.
+            rows (int, optional): Rows the task produced.
+            checkpoint (str, optional): Path of the task's checkpoint file.
+        """
+        self._execute(
+            "UPDATE tasks SET state = 'done', rows = ?, checkpoint = ?, finished = ?"
+            " WHERE year = ? AND page = ?",
+            (rows, checkpoint, time.time(), year, page),
+        )
+
+    def fail(self, year, page, error):
+        """
+        Marks a task as failed; it is retried while it has attempts left.
+        """
+        self._execute(
+            "UPDATE tasks SET state = 'failed', error = ?, finished = ? WHERE year = ? AND page = ?",
+            (str(error), time.time(), year, page),
+        )
+
+    def progress(self):
+        """
+        Summarizes the queue.
+
+        Returns:
+            dict: Task counts by state and by page, done rows, the failed tasks
+                  with their errors, and throughput in tasks and rows per minute
+                  between the first start and the last finish of a done task.
+        """
+        rows = self._execute("SELECT year, page, state, attempts, rows, error, started, finished FROM tasks")
+        states = {state: 0 for state in ("pending", "running", "done", "failed")}
+        pages = {}
+        for _, page, state, _, _, _, _, _ in rows:
+            states[state] += 1
+            pages.setdefault(page, dict.fromkeys(states, 0))[state] += 1
+
+        done = [row for row in rows if row[2] == "done"]
+        elapsed = (
+            max(row[7] for row in done) - min(row[6] for row in done) if done else 0
+        )
+        done_rows = sum(row[4] or 0 for row in done)
+        return {
+            "tasks": len(rows),
+            "states": states,
+            "pages": pages,
+            "rows": done_rows,
+            "failed": [
+                (year, page, attempts, error)
+                for year, page, state, attempts, _, error, _, _ in rows
+                if state == "failed"
+            ],
+            "tasks_per_min": len(done) / elapsed * 60 if elapsed > 0 else None,
+            "rows_per_min": done_rows / elapsed * 60 if elapsed > 0 else None,
+        }
+
+    def print_progress(self):
+        """
+        Prints task counts, throughput and failed tasks.
+        """
+        progress = self.progress()
+        states = progress["states"]
+        percent = states["done"] / progress["tasks"] * 100 if progress["tasks"] else 0
+        print(f"Crawl queue ({self.path}): {states['done']}/{progress['tasks']} tasks done ({percent:.0f}%)")
+        print("  " + ", ".join(f"{count} {state}" for state, count in states.items()))
+        for page in TASK_PAGES:
+            if page in progress["pages"]:
+                counts = progress["pages"][page]
+                print(f"  {page}: {counts['done']} done, {counts['pending'] + counts['running']} to do, {counts['failed']} failed")
+        if progress["tasks_per_min"] is not None:
+            print(
+                f"  Throughput: {progress['tasks_per_min']:.1f} tasks/min, "
+                f"{progress['rows_per_min']:.0f} rows/min"
+            )
+        for year, page, attempts, error in progress["failed"]:
+            print(f"  Failed {year} {page} ({attempts}/{self.max_attempts} attempts): {error}")
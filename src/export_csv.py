@@ -1,11 +1,248 @@
 import os
+import numpy as np
+import pandas as pd
+from artifact_manifest import ARTIFACT_MANIFEST, fingerprint
+from config import EXPORT_FORMATS
+from instrumentation import INSTRUMENTATION
+
+# File extension of every supported export format
+FORMATS = {
+    "csv": ".csv",
+    "csv.gz": ".csv.gz",
+    "csv.zst": ".csv.zst",
+    "parquet": ".parquet",
+    "feather": ".feather",
+}
+
+# Formats tried by read_frame, fastest to load on multi-season data first
+READ_ORDER = ["feather", "parquet", "csv", "csv.zst", "csv.gz"]
+
+
+def format_of(path):
+    """
+    Args:
+        path (str): Output path.
+
+    Returns:
+        str: Key of FORMATS matching the path's extension.
+    """
+    for fmt in sorted(FORMATS, key=lambda f: -len(FORMATS[f])):
+        if path.endswith(FORMATS[fmt]):
+            return fmt
+    raise ValueError(f"Unsupported export format: {path}")
+
+
+def _stem(path):
+    return path[: -len(FORMATS[format_of(path)])]
+
+
+def _write(df, path, fmt):
+    if fmt == "csv":
+        df.to_csv(path, index=False)
+    elif fmt == "csv.gz":
+        df.to_csv(path, index=False, compression={"method": "gzip", "mtime": 0})
+    elif fmt == "csv.zst":
+        # pyarrow ships the zstd codec, so no extra dependency is needed
+        import pyarrow as pa
+
+        with pa.CompressedOutputStream(path, "zstd") as out:
+            out.write(df.to_csv(index=False).encode("utf-8"))
+    elif fmt == "parquet":
+        df.to_parquet(path, engine="pyarrow", index=False)
+    elif fmt == "feather":
+        df.reset_index(drop=True).to_feather(path)
+
+
+def _stage(df, path, manifest):
+    """
+    Writes df to a temporary file next to path, unless path is already current.
+
+    Returns:
+        tuple or None: (tmp_path, path, digest) to commit, or None if skipped.
+    """
+    digest = fingerprint("frame", df)
+    if manifest is not None and manifest.is_current(path, digest):
+        print(f"{path} is up to date, skipping export")
+        return None
 
-def export_to_csv(df, csv_filename):
     # Ensure the directory exists
-    directory = os.path.dirname(csv_filename)
-    if directory and not os.path.exists(directory):
-        os.makedirs(directory)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    tmp_path = f"{path}.tmp"
+    try:
+        with INSTRUMENTATION.stage("export", path=path, rows=len(df)):
+            _write(df, tmp_path, format_of(path))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return tmp_path, path, digest
+
+
+def _commit(staged, manifest):
+    # Every file was written successfully; rename them all into place
+    for tmp_path, path, digest in staged:
+        os.replace(tmp_path, path)
+        print(f"Data exported to {path}")
+        if manifest is not None:
+            manifest.record(path, digest)
+
+
+def _abort(staged):
+    for tmp_path, _, _ in staged:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _export_all(writes, manifest):
+    staged = []
+    try:
+        for df, path in writes:
+            entry = _stage(df, path, manifest)
+            if entry is not None:
+                staged.append(entry)
+    except BaseException:
+        _abort(staged)
+        raise
+    _commit(staged, manifest)
+    return [path for _, path, _ in staged]
+
+
+def export_frame(df, path, formats=None, manifest=ARTIFACT_MANIFEST):
+    """
+    Atomically exports a DataFrame in one or more formats.
+
+    Each file is written to a temporary path and only renamed over the
+    destination once every requested format has been written, so a crash
+    never leaves a half-written file behind. Files whose contents would not
+    change (per the artifact manifest) are skipped.
+
+    Args:
+        df (pd.DataFrame): Data to export.
+        path (str): Output path; its extension selects the format (see FORMATS).
+        formats (list, optional): Additional formats to write next to path under
+            the same name (e.g. ["parquet"]).
+        manifest (artifact_manifest.ArtifactManifest, optional): Manifest used to
+            skip unchanged files.
+
+    Returns:
+        list: Paths that were written.
+    """
+    stem = _stem(path)
+    paths = [path] + [stem + FORMATS[fmt] for fmt in formats or [] if stem + FORMATS[fmt] != path]
+    return _export_all([(df, p) for p in paths], manifest)
+
+
+def export_to_csv(df, csv_filename, manifest=ARTIFACT_MANIFEST):
+    """
+    Atomically exports a DataFrame to a single file (CSV unless the extension says otherwise).
+
+    Args:
+        df (pd.DataFrame): Data to export.
+        csv_filename (str): Output path.
+        manifest (artifact_manifest.ArtifactManifest, optional): Manifest used to
+            skip an unchanged file.
+    """
+    export_frame(df, csv_filename, manifest=manifest)
+
+
+def export_dataset(frames, name, formats=EXPORT_FORMATS, manifest=ARTIFACT_MANIFEST):
+    """
+    Exports one DataFrame per partition (e.g. per year) in a single batch.
+
+    Text formats get one file per partition, "<name>_<key><ext>". Parquet and
+    Feather get one file holding every partition, "<name><ext>". All files are
+    written to temporary paths first and renamed into place together.
+
+    Args:
+        frames (dict): Partition key to DataFrame, in output order.
+        name (str): Output path without extension.
+        formats (list): Keys of FORMATS to write.
+        manifest (artifact_manifest.ArtifactManifest, optional): Manifest used to
+            skip unchanged files.
+
+    Returns:
+        list: Paths that were written.
+    """
+    writes = []
+    for fmt in formats:
+        if fmt in ("parquet", "feather"):
+            combined = pd.concat(frames.values(), ignore_index=True) if frames else None
+            if combined is not None:
+                writes.append((combined, name + FORMATS[fmt]))
+        else:
+            writes.extend((df, f"{name}_{key}{FORMATS[fmt]}") for key, df in frames.items())
+    return _export_all(writes, manifest)
+
+
+def _csv_like(df):
+    """
+    Converts typed columns to what read_csv returns for the CSV export of the
+    same data, so results do not depend on which format was read: categoricals
+    become their values, nullable numbers become NumPy numbers and float32
+    values are parsed from their shortest text form, exactly as written to CSV.
+    """
+    columns = {}
+    for column in df.columns:
+        values = df[column]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            values = values.astype(values.cat.categories.dtype)
+        if values.dtype.kind == "f" and values.dtype.itemsize == 4:
+            # CSV holds the shortest text form of each float32 value; parse
+            # each distinct value's text once
+            uniques, inverse = np.unique(values.to_numpy("float32", na_value=np.nan), return_inverse=True)
+            values = uniques.astype(str).astype("float64")[inverse]
+        elif isinstance(values.dtype, pd.api.extensions.ExtensionDtype) and values.dtype.kind in "iuf":
+            if values.dtype.kind == "f" or values.isna().any():
+                values = values.to_numpy("float64", na_value=np.nan)
+            else:
+                values = values.to_numpy("int64")
+        columns[column] = values
+    return pd.DataFrame(columns)
+
+
+def read_frame(path, manifest=ARTIFACT_MANIFEST):
+    """
+    Loads an exported DataFrame from the fastest available format.
+
+    Every format exported under the same name is considered; among the files
+    holding the same data as the most recently written one (per the artifact
+    manifest), the first in READ_ORDER is read. Columns come back with the
+    types read_csv gives for the CSV export.
+
+    Args:
+        path (str): Path of any exported format, e.g. "qb_combined_stats_with_playoff_status.csv".
+        manifest (artifact_manifest.ArtifactManifest, optional): Manifest used to
+            tell which files are in sync.
+
+    Returns:
+        pd.DataFrame: The loaded data.
+    """
+    stem = _stem(path)
+    candidates = [stem + FORMATS[fmt] for fmt in READ_ORDER if os.path.exists(stem + FORMATS[fmt])]
+    if not candidates:
+        raise FileNotFoundError(path)
+
+    newest = max(candidates, key=os.path.getmtime)
+    if manifest is not None:
+        digest = manifest.digest(newest)
+        candidates = [
+            c for c in candidates if c == newest or (digest and manifest.digest(c) == digest)
+        ]
+    else:
+        candidates = [newest]
+    chosen = candidates[0]
+
+    fmt = format_of(chosen)
+    if fmt == "feather":
+        return _csv_like(pd.read_feather(chosen))
+    if fmt == "parquet":
+        return _csv_like(pd.read_parquet(chosen, engine="pyarrow"))
+    if fmt == "csv.zst":
+        import pyarrow as pa
 
-    # Export the DataFrame to CSV
-    df.to_csv(csv_filename, index=False)
-    print(f"Data exported to {csv_filename}")
+        with pa.input_stream(chosen, compression="zstd") as stream:
+            return pd.read_csv(stream)
+    return pd.read_csv(chosen)
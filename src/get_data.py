@@ -1,128 +1,433 @@
-import requests
-from bs4 import BeautifulSoup
-import time
+import atexit
+import logging
+import numpy as np
 import pandas as pd
 import random
-from clean_data import clean_text
+from concurrent.futures import ThreadPoolExecutor
+from clean_data import clean_column, player_id_from_link
 from clean_data import standardize_team_names
-from export_csv import export_to_csv
-from config import TEAM_NAME_MAPPING
+from export_csv import export_to_csv, export_frame, export_dataset
+from config import FETCH_WORKERS, BASE_URL, BACKOFF_BASE, EXPORT_FORMATS, STREAM_BATCH_ROWS
+from page_cache import PageCache, CachedResponse, season_ttl
+from run_report import RunReport
+from http_session import HTTP_SESSION
+from table_extract import extract_table
+from page_schema import PAGE_SCHEMAS, resolve_columns, missing_fields, apply_schema
+from season_store import SeasonStore
+from instrumentation import INSTRUMENTATION
+from team_resolver import TEAM_RESOLVER, NO_TEAM
+from stat_sinks import FrameSink, drain, make_sinks
+
+
+USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.45 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.3 Safari/605.1.15",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:91.0) Gecko/20100101 Firefox/91.0",
+]
+
+# Season pages fetched for every year, relative to the year's URL
+SEASON_PAGES = {
+    "passing": "passing.htm",
+    "rushing": "rushing.htm",
+    "standings": "",
+}
+
+logger = logging.getLogger(__name__)
+
+# Shared on-disk page cache for every Pro Football Reference request
+PAGE_CACHE = PageCache()
+# Cache hits keep their access times in memory; write them before the interpreter exits
+atexit.register(PAGE_CACHE.close)
+
+# Combined QB stats, one stored partition per season
+SEASON_STORE = SeasonStore()
+
+# Per-run record of how often each URL was fetched and parsed
+RUN_REPORT = RunReport()
 
 
 # function to delay HTTP requests to avoid rate limiting
-def request_with_retry(url, headers=None, retries=3, delay=5):
+def request_with_retry(url, headers=None, retries=3, delay=BACKOFF_BASE, cache=PAGE_CACHE):
     """
-    Handles HTTP requests with retries for rate limiting (429 errors).
+    Handles HTTP requests with retries for rate limiting (429), server errors (5xx)
+    and dropped connections, using the shared keep-alive HTTP_SESSION. The session
+    applies connect/read timeouts, honors Retry-After, backs off with full jitter
+    and waits for the shared rate limiter before every request.
+    Pages are served from the page cache while fresh, revalidated with
+    ETag/Last-Modified once expired, and replayed without network access
+    when the cache is in offline mode.
 
     Args:
         url (str): URL to fetch.
         headers (dict): Headers for the HTTP request.
         retries (int): Number of times to retry in case of failure.
-        delay (int): Delay between retries in seconds.
+        delay (float): Base delay in seconds for the jittered exponential backoff.
+        cache (PageCache, optional): Page cache to use. None disables caching.
 
     Returns:
-        response (requests.Response or None): Response object or None if all retries failed.
-    """
-    for attempt in range(retries):
-        response = requests.get(url, headers=headers)
-        if response.status_code == 200:
-            return response
-        elif response.status_code == 429:
-            print(
-                f"Received 429 Too Many Requests. Attempt {attempt + 1}/{retries}. Retrying after {delay} seconds..."
-            )
-            time.sleep(delay)
-            delay *= 2  # Exponential delay
-        else:
-            print(f"Failed to retrieve data from {url}: {response.status_code}")
-            return None
+        response (requests.Response, CachedResponse or None): Response object or None if all retries failed.
+    """
+    entry = cache.get(url) if cache else None
+    if entry and (cache.offline or cache.is_fresh(entry)):
+        RUN_REPORT.record_fetch(url, from_cache=True)
+        return CachedResponse(url, entry["content"])
+    if cache and cache.offline:
+        print(f"Offline mode: {url} is not in the page cache.")
+        RUN_REPORT.record_failure(url)
+        return None
+
+    request_headers = dict(headers or {})
+    if entry:
+        request_headers.update(cache.validators(entry))
+
+    response = HTTP_SESSION.get(
+        url, headers=request_headers, retries=retries, backoff_base=delay
+    )
+    if response is None:
+        RUN_REPORT.record_failure(url)
+        return None
+    if response.status_code == 200:
+        if cache:
+            cache.put(url, response.content, response.headers, season_ttl(url))
+        RUN_REPORT.record_fetch(url)
+        return response
+    if response.status_code == 304 and entry:
+        cache.touch(url, response.headers, season_ttl(url))
+        RUN_REPORT.record_fetch(url, from_cache=True)
+        return CachedResponse(url, entry["content"], response.headers)
+    print(f"Failed to retrieve data from {url}: {response.status_code}")
+    RUN_REPORT.record_failure(url)
     return None
 
 
-def scrape_qb_pass_stats(year, csv_filename=None):
+def _clean_batches(table, page_type, url, batch_rows=None):
     """
-    Scrapes quarterback pass stats from Pro Football Reference for a given year and returns a DataFrame.
+    Resolves a page's schema columns once and cleans the table's rows in
+    slices, each one column at a time.
 
     Args:
-        year (int): The year for which to scrape QB stats.
-        csv_filename (str, optional): File path to export the scraped DataFrame. Defaults to None.
+        table (table_extract.ExtractedTable): Extracted stats table.
+        page_type (str): Key of PAGE_SCHEMAS.
+        url (str): Page URL, for error messages.
+        batch_rows (int, optional): Table rows per batch. All rows in one batch when None.
+
+    Yields:
+        pd.DataFrame: One cleaned column per schema field (exported or not), plus a
+                      "Player ID" column parsed from each row's player link.
+                      Header/spacer rows that do not reach every mapped column are
+                      dropped. At least one (possibly empty) batch is yielded.
+    """
+    schema = PAGE_SCHEMAS[page_type]
+    index = resolve_columns(page_type, table)
+    missing = missing_fields(page_type, index)
+    if missing:
+        print(f"Columns not found on {url}: {missing}")
+    last_column = max(index.values(), default=-1)
+    rows = [i for i, width in enumerate(table.widths) if width > last_column]
+    batch_rows = batch_rows or max(len(rows), 1)
+
+    for start in range(0, max(len(rows), 1), batch_rows):
+        batch = rows[start:start + batch_rows]
+        cleaned = {}
+        for field in schema:
+            if field.name in index:
+                column = table.columns[index[field.name]]
+                raw = [column[i] for i in batch]
+            else:
+                raw = [None] * len(batch)
+            values = clean_column(raw, field.dtype)
+            if field.default is not None:
+                values = values.fillna(field.default)
+            cleaned[field.name] = values
+        cleaned["Player ID"] = [player_id_from_link(table.links[i]) for i in batch]
+        yield apply_schema(pd.DataFrame(cleaned))
+
+
+def _clean_table(table, page_type, url):
+    """
+    Resolves a page's schema columns and cleans each one as a whole column.
+
+    Args:
+        table (table_extract.ExtractedTable): Extracted stats table.
+        page_type (str): Key of PAGE_SCHEMAS.
+        url (str): Page URL, for error messages.
 
     Returns:
-        pd.DataFrame: DataFrame containing quarterback pass stats.
+        pd.DataFrame: The single batch of _clean_batches.
     """
-    pass_stats_url = f"https://www.pro-football-reference.com/years/{year}/passing.htm"
-    print(f"Fetching passing stats from: {pass_stats_url}")
+    return next(_clean_batches(table, page_type, url))
 
-    headers = {
-        "User-Agent": random.choice(
-            [
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.45 Safari/537.36",
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.3 Safari/605.1.15",
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:91.0) Gecko/20100101 Firefox/91.0",
-            ]
-        )
-    }
 
-    response = request_with_retry(pass_stats_url, headers=headers)
-    if not response:
-        print(f"Failed to retrieve data from {pass_stats_url} after retries.")
+def player_key(stats_df):
+    """
+    Key identifying a player within a season: the site's player ID, falling
+    back to the name for rows without a player link (or DataFrames without IDs).
+
+    Args:
+        stats_df (pd.DataFrame): Stats with a "Name" and optionally a "Player ID" column.
+
+    Returns:
+        pd.Series: One key per row.
+    """
+    if "Player ID" not in stats_df.columns:
+        return stats_df["Name"]
+    return stats_df["Player ID"].fillna(stats_df["Name"])
+
+
+def filter_rush_to_passers(rush_stats_df, passing_stats_df):
+    """
+    Selects the rushing rows of players that appear in the passing stats.
+
+    Players are matched on player_key, so two players sharing a name do not
+    collide, and membership is a hash lookup, so the cost grows with
+    rows + passers rather than rows x passers.
+
+    Args:
+        rush_stats_df (pd.DataFrame): Cleaned rushing stats.
+        passing_stats_df (pd.DataFrame): Passing stats of the players to keep.
+
+    Returns:
+        pd.Series: Boolean mask over rush_stats_df.
+    """
+    passers = set(player_key(passing_stats_df))
+    return player_key(rush_stats_df).isin(passers)
+
+
+def _export_columns(page_type):
+    # Exported schema fields, with the player ID right after the name
+    columns = [field.name for field in PAGE_SCHEMAS[page_type] if field.export]
+    columns.insert(columns.index("Name") + 1, "Player ID")
+    return columns
+
+
+def season_page_url(year, page):
+    """
+    Builds the Pro Football Reference URL of a season page.
+
+    Args:
+        year (int): Season year.
+        page (str): One of the SEASON_PAGES keys ("passing", "rushing", "standings").
+
+    Returns:
+        str: Page URL.
+    """
+    return f"{BASE_URL}/years/{year}/{SEASON_PAGES[page]}"
+
+
+class _FetchFailed:
+    """
+    Falsy placeholder for a prefetched page whose fetch failed, so callers can
+    tell it apart from a page that was not prefetched (None) and do not retry it.
+    """
+
+    def __bool__(self):
+        return False
+
+    def __repr__(self):
+        return "FETCH_FAILED"
+
+
+FETCH_FAILED = _FetchFailed()
+
+
+def fetch_season_pages(years, pages=tuple(SEASON_PAGES), max_workers=FETCH_WORKERS):
+    """
+    Fetches every (year, page) combination concurrently, see fetch_pages.
+
+    Args:
+        years (list): Years to fetch.
+        pages (iterable): SEASON_PAGES keys to fetch for each year.
+        max_workers (int): Number of fetch threads.
+
+    Returns:
+        dict: Mapping of (year, page) to the response (or FETCH_FAILED if the fetch
+              failed), ordered by year and then page.
+    """
+    return fetch_pages([(year, page) for year in sorted(set(years)) for page in pages], max_workers)
+
+
+@INSTRUMENTATION.timed("fetch")
+def fetch_pages(tasks, max_workers=FETCH_WORKERS):
+    """
+    Fetches season pages concurrently on a thread pool. Requests share
+    HTTP_SESSION's connection pool and are spaced by its rate limiter, so the
+    pool only overlaps network latency and never exceeds the site's request rate.
+
+    Args:
+        tasks (list): (year, page) pairs to fetch, page being a SEASON_PAGES key.
+        max_workers (int): Number of fetch threads.
+
+    Returns:
+        dict: Mapping of (year, page) to the response (or FETCH_FAILED if the fetch
+              failed), in the order of tasks.
+    """
+    print(f"Fetching {len(tasks)} season pages with {max_workers} workers...")
+
+    def fetch(task):
+        year, page = task
+        headers = {"User-Agent": random.choice(USER_AGENTS)}
+        return request_with_retry(season_page_url(year, page), headers=headers)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        responses = list(executor.map(fetch, tasks))
+
+    return {task: FETCH_FAILED if response is None else response for task, response in zip(tasks, responses)}
+
+
+def _season_table(year, page, response=None, table=None):
+    """
+    Fetches (unless given) and extracts the stats table of a season's passing
+    or rushing page. A given table is used as is; a response of FETCH_FAILED
+    (a failed prefetch) is not fetched again.
+
+    Returns:
+        table_extract.ExtractedTable or None: The table, or None if the page
+            could not be fetched or has no stats table.
+    """
+    url = season_page_url(year, page)
+
+    if table is None:
+        if response is None:
+            print(f"Fetching {page} stats from: {url}")
+            headers = {"User-Agent": random.choice(USER_AGENTS)}
+            response = request_with_retry(url, headers=headers)
+        if not response:
+            print(f"Failed to retrieve data from {url} after retries.")
+            return None
+        table = extract_table(response.content, table_class="stats_table")
+    RUN_REPORT.record_parse(url)
+
+    if not table:
+        print(f"No stats table found on {url}.")
         return None
+    return table
 
-    soup = BeautifulSoup(response.content, "html.parser")
-    table = soup.find("table", class_="stats_table")
-
-    # Initialize a list to store all player stats
-    qb_pass_stats = []
-
-    # Extract Quarterback Pass Stats
-    for row in table.find_all("tr")[1:]:
-        columns = row.find_all("td")
-
-        # Check for position "QB" in column 3 and games played >= 10 in column 5
-        if (
-            len(columns) > 4
-            and columns[3].text.strip() == "QB"
-            and columns[4].text.strip().isdigit()
-            and int(columns[4].text.strip()) >= 10
-        ):
-            try:
-                # Retrieve QB stats, clean data with clean_data.py
-                qb_name = clean_text(columns[0].text, str)
-                qb_team = clean_text(columns[2].text, str)
-                qb_gamesplayed = clean_text(columns[4].text, int)
-                qb_passingyards = clean_text(columns[10].text, int)
-                qb_passingtds = clean_text(columns[11].text, int)
-                qb_interceptions = clean_text(columns[13].text, int)
-                qb_rating = clean_text(columns[23].text, float)
-
-                # Skip players with no valid rating
-                if pd.isna(qb_rating):
-                    continue
-
-                qb_4qc = clean_text(columns[29].text, int)  # 4th Quarter Comebacks
-                qb_gwd = clean_text(columns[30].text, int)  # Game-Winning Drives
-
-                # Append qb pass stats to the list
-                qb_pass_stats.append(
-                    {
-                        "Name": qb_name,
-                        "Team": qb_team,
-                        "Games Played": qb_gamesplayed,
-                        "Passing Yards": qb_passingyards,
-                        "Passing TDs": qb_passingtds,
-                        "Interceptions": qb_interceptions,
-                        "Rating": qb_rating,
-                        "4QC": qb_4qc,
-                        "GWD": qb_gwd,
-                        "Year": year,
-                    }
-                )
-            except (ValueError, IndexError) as e:
-                print(f"Error processing row: {e}")
-                continue
 
-    # Create a DataFrame
-    qb_pass_stats_df = pd.DataFrame(qb_pass_stats)
+def stream_pass_stats(year, response=None, table=None, batch_rows=STREAM_BATCH_ROWS, qualified=True):
+    """
+    Streams a season's quarterback pass stats as typed row batches.
+
+    The page's table is cleaned batch_rows rows at a time and each batch is
+    yielded before the next is cleaned, so a slow consumer (see
+    stat_sinks.drain) holds back the cleaning instead of letting batches pile up.
+
+    Args:
+        year (int): The year for which to scrape QB stats.
+        response (requests.Response, optional): Already fetched passing page. Fetched when
+            neither it nor table is provided.
+        table (table_extract.ExtractedTable, optional): Stats table already extracted from response.
+        batch_rows (int): Table rows cleaned per batch.
+        qualified (bool): Only yield QBs with games played >= 10 and a valid rating.
+            False yields every player on the page, whatever the position.
+
+    Yields:
+        pd.DataFrame: Exported passing columns plus "Year" (categorical), typed as
+                      by apply_schema. Nothing is yielded if the page or its table
+                      is missing; otherwise at least one (possibly empty) batch.
+    """
+    table = _season_table(year, "passing", response, table)
+    if table is None:
+        return
+
+    export_columns = _export_columns("passing")
+    for stats in _clean_batches(table, "passing", season_page_url(year, "passing"), batch_rows):
+        if qualified:
+            # Keep QBs with games played >= 10 and a valid rating
+            stats = stats[
+                (
+                    (stats["Position"] == "QB")
+                    & (stats["Games Played"] >= 10)
+                    & stats["Rating"].notna()
+                ).fillna(False)
+            ]
+        batch = stats.loc[:, export_columns].reset_index(drop=True)
+        batch["Year"] = pd.Categorical([year] * len(batch), categories=[year])
+        yield batch
+
+
+def stream_rush_stats(year, passing_stats_df, response=None, table=None, batch_rows=STREAM_BATCH_ROWS):
+    """
+    Streams a season's rushing stats of the players in passing_stats_df as typed row batches.
+
+    Args:
+        year (int): The year to fetch data for.
+        passing_stats_df (pd.DataFrame): Passing stats (at least "Name" and
+            "Player ID") of the players to keep.
+        response (requests.Response, optional): Already fetched rushing page. Fetched when
+            neither it nor table is provided.
+        table (table_extract.ExtractedTable, optional): Stats table already extracted from response.
+        batch_rows (int): Table rows cleaned per batch.
+
+    Yields:
+        pd.DataFrame: Exported rushing columns plus "Year" of players with games
+                      played >= 5, as for stream_pass_stats.
+    """
+    table = _season_table(year, "rushing", response, table)
+    if table is None:
+        return
+
+    export_columns = _export_columns("rushing")
+    for stats in _clean_batches(table, "rushing", season_page_url(year, "rushing"), batch_rows):
+        # Keep players from the passing stats DataFrame with games played >= 5
+        qualified = (
+            filter_rush_to_passers(stats, passing_stats_df) & (stats["Games Played"] >= 5)
+        ).fillna(False)
+        batch = stats.loc[qualified, export_columns].reset_index(drop=True)
+        batch["Year"] = pd.Categorical([year] * len(batch), categories=[year])
+        yield batch
+
+
+def stream_season_stats(years, pages=None, batch_rows=STREAM_BATCH_ROWS):
+    """
+    Streams the passing and rushing stats of many seasons, one season at a time.
+
+    Each season's pages are fetched when it is reached (unless pages are
+    given), so memory is bounded by one season's pages and the batches the
+    consumer has not released, however many seasons are scraped.
+
+    Args:
+        years (list): Years to process.
+        pages (dict, optional): Prefetched responses from fetch_season_pages.
+        batch_rows (int): Table rows cleaned per batch.
+
+    Yields:
+        tuple: ("passing" or "rushing", batch) pairs, to route to sinks with
+               stat_sinks.drain.
+    """
+    for year in sorted(set(years)):
+        season_pages = pages if pages is not None else fetch_season_pages([year], pages=("passing", "rushing"))
+        # Only the passers' keys are kept to filter the rushing page
+        passers = []
+        for batch in stream_pass_stats(year, response=season_pages.get((year, "passing")), batch_rows=batch_rows):
+            passers.append(batch[["Name", "Player ID"]])
+            yield "passing", batch
+        if not passers:
+            print(f"Skipping year {year} due to missing passing stats.")
+            continue
+        passing = pd.concat(passers, ignore_index=True)
+        for batch in stream_rush_stats(year, passing, response=season_pages.get((year, "rushing")), batch_rows=batch_rows):
+            yield "rushing", batch
+
+
+@INSTRUMENTATION.timed("scrape_passing", fields=("year",))
+def scrape_qb_pass_stats(year, csv_filename=None, response=None, table=None):
+    """
+    Scrapes quarterback pass stats from Pro Football Reference for a given year and returns a DataFrame.
+
+    Args:
+        year (int): The year for which to scrape QB stats.
+        csv_filename (str, optional): File path to export the scraped DataFrame. Defaults to None.
+        response (requests.Response, optional): Already fetched passing page. Fetched when
+            neither it nor table is provided.
+        table (table_extract.ExtractedTable, optional): Stats table already extracted from
+            response (e.g. by a parse_pipeline worker). Extracted here when not provided.
+
+    Returns:
+        pd.DataFrame: DataFrame containing quarterback pass stats.
+    """
+    (qb_pass_stats_df,) = drain(stream_pass_stats(year, response, table), [FrameSink()])
+    if qb_pass_stats_df is None:
+        return None
 
     # Export to CSV if filename is provided
     if csv_filename:
@@ -131,7 +436,8 @@ def scrape_qb_pass_stats(year, csv_filename=None):
     return qb_pass_stats_df
 
 
-def scrape_qb_rush_stats(year, passing_stats_df, csv_filename=None):
+@INSTRUMENTATION.timed("scrape_rushing", fields=("year",))
+def scrape_qb_rush_stats(year, passing_stats_df, csv_filename=None, response=None, table=None):
     """
     Scrapes quarterback rushing stats from Pro Football Reference and returns a DataFrame.
     Filters for players in the passing stats DataFrame.
@@ -140,69 +446,19 @@ def scrape_qb_rush_stats(year, passing_stats_df, csv_filename=None):
         year (int): The year to fetch data for.
         passing_stats_df (pd.DataFrame): DataFrame containing passing stats to filter QBs.
         csv_filename (str, optional): File path to export the DataFrame. Defaults to None.
+        response (requests.Response, optional): Already fetched rushing page. Fetched when
+            neither it nor table is provided.
+        table (table_extract.ExtractedTable, optional): Stats table already extracted from
+            response (e.g. by a parse_pipeline worker). Extracted here when not provided.
 
     Returns:
         pd.DataFrame or None: DataFrame containing quarterback rushing stats or None if no data is found.
     """
-    rush_stats_url = f"https://www.pro-football-reference.com/years/{year}/rushing.htm"
-    print(f"Fetching rushing stats from: {rush_stats_url}")
-
-    headers = {
-        "User-Agent": random.choice(
-            [
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.45 Safari/537.36",
-                "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/15.3 Safari/605.1.15",
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:91.0) Gecko/20100101 Firefox/91.0",
-            ]
-        )
-    }
-
-    response = request_with_retry(rush_stats_url, headers=headers)
-    if not response:
-        print(f"Failed to retrieve data from {rush_stats_url} after retries.")
-        return None
-
-    soup = BeautifulSoup(response.content, "html.parser")
-    table = soup.find("table", class_="stats_table")
-
-    if not table:
-        print(f"No stats table found on {rush_stats_url}.")
+    (qb_rush_stats_df,) = drain(stream_rush_stats(year, passing_stats_df, response, table), [FrameSink()])
+    if qb_rush_stats_df is None:
         return None
 
-    # Get the list of QB names from the passing stats DataFrame
-    qb_names = passing_stats_df["Name"].tolist()
-
-    qb_rush_stats = []
-
-    for row in table.find_all("tr")[1:]:  # Skip header row
-        columns = row.find_all("td")
-        if len(columns) > 4:
-            try:
-                qb_name = columns[0].text.strip()
-                games_played = columns[4].text.strip()
-
-                # Check if the player is in the passing stats DataFrame
-                if (
-                    qb_name in qb_names
-                    and games_played.isdigit()
-                    and int(games_played) >= 5
-                ):
-                    rushing_yards = int(columns[6].text.strip().replace(",", "") or 0)
-                    rushing_tds = int(columns[7].text.strip().replace(",", "") or 0)
-                    qb_rush_stats.append(
-                        {
-                            "Name": qb_name,
-                            "Rushing Yards": rushing_yards,
-                            "Rushing TDs": rushing_tds,
-                            "Year": year,
-                        }
-                    )
-            except IndexError as e:
-                print(f"Row parsing error: {e}. Skipping row.")
-                continue
-
-    if qb_rush_stats:
-        qb_rush_stats_df = pd.DataFrame(qb_rush_stats)
+    if not qb_rush_stats_df.empty:
         if csv_filename:
             export_to_csv(qb_rush_stats_df, csv_filename)
         return qb_rush_stats_df
@@ -211,35 +467,224 @@ def scrape_qb_rush_stats(year, passing_stats_df, csv_filename=None):
     return None
 
 
-def combine_qb_stats(years, csv_filename="qb_combined_stats_with_playoff_status.csv"):
+def scrape_season_stats(years, pages=None):
     """
-    Combines QB stats for multiple years and appends playoff status.
+    Scrapes passing and rushing stats once for each year and exports them.
+
+    The per-year frames are written in one batch per page type after every
+    year has been scraped (see export_csv.export_dataset): one
+    qb_pass_stats_<year>.csv / qb_rush_stats_<year>.csv per year plus a single
+    multi-year file for each binary format in EXPORT_FORMATS.
 
     Args:
         years (list): List of years to process.
-        csv_filename (str): File path to export the final combined DataFrame.
+        pages (dict, optional): Prefetched responses from fetch_season_pages.
+            All passing and rushing pages are fetched concurrently when not provided.
 
     Returns:
-        pd.DataFrame: Combined QB stats with playoff status.
+        dict: Mapping of year to a (pass_stats, rush_stats) tuple of DataFrames.
+              Years with missing passing or rushing stats are left out.
     """
-    combined_stats = []
+    if pages is None:
+        pages = fetch_season_pages(years, pages=("passing", "rushing"))
 
-    for year in years:
+    season_stats = {}
+
+    for year in sorted(set(years)):
         print(f"Processing data for year {year}...")
-        pass_stats = scrape_qb_pass_stats(year, f"qb_pass_stats_{year}.csv")
+        pass_stats = scrape_qb_pass_stats(year, response=pages.get((year, "passing")))
         if pass_stats is None:
             print(f"Skipping year {year} due to missing passing stats.")
             continue
 
-        rush_stats = scrape_qb_rush_stats(year, pass_stats, f"qb_rush_stats_{year}.csv")
+        rush_stats = scrape_qb_rush_stats(
+            year,
+            pass_stats,
+            response=pages.get((year, "rushing")),
+        )
         if rush_stats is None:
             print(f"Skipping year {year} due to missing rushing stats.")
             continue
 
-        # Merge passing and rushing stats
+        season_stats[year] = (pass_stats, rush_stats)
+
+    export_season_stats(season_stats)
+
+    return season_stats
+
+
+def export_season_stats(season_stats):
+    """
+    Exports per-year passing and rushing stats in one batch per page type.
+
+    Args:
+        season_stats (dict): Mapping of year to a (pass_stats, rush_stats) tuple of DataFrames.
+    """
+    export_dataset({year: stats[0] for year, stats in season_stats.items()}, "qb_pass_stats")
+    export_dataset({year: stats[1] for year, stats in season_stats.items()}, "qb_rush_stats")
+
+
+def export_season_stream(years, sinks=("csv", "parquet"), batch_rows=STREAM_BATCH_ROWS):
+    """
+    Scrapes seasons one at a time and streams their passing and rushing stats
+    into sinks, for scrapes too large to hold in memory. File sinks write
+    every season to one file per page type (qb_pass_stats.stream.<ext>,
+    qb_rush_stats.stream.<ext>). The names differ from the export_dataset
+    outputs, whose artifact manifest entries use another fingerprint.
+
+    Args:
+        years (list): Years to process.
+        sinks (iterable): stat_sinks.SINKS names of the sinks fed by each page type.
+        batch_rows (int): Table rows cleaned per batch.
+
+    Returns:
+        dict: "passing" and "rushing" to the close() result of each sink, see stat_sinks.drain.
+    """
+    routed = {
+        "passing": make_sinks(sinks, "qb_pass_stats.stream"),
+        "rushing": make_sinks(sinks, "qb_rush_stats.stream"),
+    }
+    return drain(stream_season_stats(years, batch_rows=batch_rows), routed)
+
+
+@INSTRUMENTATION.timed("combine")
+def combine_qb_stats(
+    years,
+    csv_filename="qb_combined_stats_with_playoff_status.csv",
+    season_stats=None,
+    pages=None,
+    store=SEASON_STORE,
+    standings=None,
+):
+    """
+    Combines QB stats for multiple years and appends playoff status.
+
+    With a season store, only seasons whose partitions are missing or stale are
+    scraped and combined; their partitions are rewritten and the exported
+    DataFrame is read back from the store for every requested year.
+
+    Args:
+        years (list): List of years to process.
+        csv_filename (str): File path to export the final combined DataFrame.
+        season_stats (dict, optional): Per-year (pass_stats, rush_stats) DataFrames
+            from scrape_season_stats. Scraped here when not provided.
+        pages (dict, optional): Prefetched responses from fetch_season_pages.
+            The pages of the seasons to scrape are fetched concurrently up front when not provided.
+        store (season_store.SeasonStore, optional): Store to update incrementally.
+            Every year is rebuilt from scratch when None.
+        standings (dict, optional): Year to already parsed season_standings table
+            (e.g. from parse_pipeline.run_season_pipeline). Standings pages of
+            these years are not fetched.
+
+    Returns:
+        pd.DataFrame: Combined QB stats with playoff status.
+    """
+    years = sorted(set(years))
+    scrape_years = years if store is None else store.stale_years(years)
+    if store is not None:
+        print(f"Seasons to refresh in {store.store_dir}: {scrape_years or 'none'}")
+
+    scraped_df = None
+    if scrape_years:
+        if pages is None and (season_stats is None or standings is None):
+            pages = fetch_season_pages(scrape_years)
+        if season_stats is None:
+            season_stats = scrape_season_stats(scrape_years, pages)
+        scraped_df = _combine_seasons(scrape_years, season_stats, pages, standings)
+
+    if store is None:
+        final_combined_df = scraped_df
+    else:
+        final_combined_df = _update_store(store, years, scraped_df)
+
+    if final_combined_df is None:
+        print("No data to combine.")
+        return None
+
+    # Export to CSV and the configured binary formats
+    if csv_filename:
+        export_frame(final_combined_df, csv_filename, formats=EXPORT_FORMATS)
+
+    return final_combined_df
+
+
+def _update_store(store, years, scraped_df):
+    """
+    Writes freshly scraped seasons to the store and reads back every requested year.
+    Seasons without a playoff status for every QB (standings unavailable) are
+    returned but not stored, so they are scraped again on the next run.
+    """
+    if scraped_df is None:
+        return store.read(years)
+
+    incomplete = scraped_df["Playoff Status"].isna().groupby(scraped_df["Year"]).any()
+    incomplete_years = list(incomplete[incomplete].index)
+    if incomplete_years:
+        print(f"Not storing seasons without playoff status: {incomplete_years}")
+    store.write(scraped_df[~scraped_df["Year"].isin(incomplete_years)])
+
+    frames = [store.read(years), scraped_df[scraped_df["Year"].isin(incomplete_years)]]
+    frames = [frame for frame in frames if frame is not None and not frame.empty]
+    if not frames:
+        return None
+    return apply_schema(
+        pd.concat(frames, ignore_index=True)
+        .sort_values("Year", kind="stable")
+        .reset_index(drop=True)
+    )
+
+
+def _combine_seasons(years, season_stats, pages, standings=None):
+    """
+    Merges each season's passing and rushing stats, derives the combined stats
+    and appends playoff status.
+
+    Args:
+        years (list): Sorted years to combine.
+        season_stats (dict): Per-year (pass_stats, rush_stats) DataFrames.
+        pages (dict): Prefetched responses from fetch_season_pages.
+        standings (dict, optional): Year to already parsed season_standings table.
+
+    Returns:
+        pd.DataFrame or None: Combined stats, or None if no year has stats.
+    """
+    final_combined_df = _merge_seasons(years, season_stats)
+    if final_combined_df is None:
+        return None
+
+    # Append playoff status
+    return apply_schema(playoff_team_status(final_combined_df, years=years, pages=pages, standings=standings))
+
+
+@INSTRUMENTATION.timed("merge")
+def _merge_seasons(years, season_stats):
+    """
+    Merges each season's passing and rushing stats and derives the combined stats.
+
+    Args:
+        years (list): Sorted years to combine.
+        season_stats (dict): Per-year (pass_stats, rush_stats) DataFrames.
+
+    Returns:
+        pd.DataFrame or None: Combined stats without playoff status, or None if
+                              no year has stats.
+    """
+    combined_stats = []
+
+    for year in years:
+        if year not in season_stats:
+            continue
+        pass_stats, rush_stats = season_stats[year]
+
+        # Merge passing and rushing stats on the player key
         year_combined = pd.merge(
-            pass_stats, rush_stats, on=["Name", "Year"], how="left"
-        )
+            pass_stats.assign(_key=player_key(pass_stats)),
+            rush_stats.drop(columns=["Name", "Player ID"], errors="ignore").assign(
+                _key=player_key(rush_stats)
+            ),
+            on=["_key", "Year"],
+            how="left",
+        ).drop(columns="_key")
         year_combined["Rushing Yards"] = year_combined["Rushing Yards"].fillna(0)
         year_combined["Rushing TDs"] = year_combined["Rushing TDs"].fillna(0)
 
@@ -250,36 +695,104 @@ def combine_qb_stats(years, csv_filename="qb_combined_stats_with_playoff_status.
         year_combined["Total TDs"] = (
             year_combined["Passing TDs"] + year_combined["Rushing TDs"]
         )
+        # Divide as float64 so 0/0 gives a NaN that fillna replaces
         year_combined["Passing TD to INT Ratio"] = (
-            (year_combined["Passing TDs"] / year_combined["Interceptions"])
+            (
+                year_combined["Passing TDs"].astype("float64")
+                / year_combined["Interceptions"].astype("float64")
+            )
             .fillna(0)
             .round(2)
         )
 
         # Standardize team names before combining data
-        year_combined = standardize_team_names(year_combined)
+        year_combined = apply_schema(standardize_team_names(year_combined))
 
         combined_stats.append(year_combined)
 
     if not combined_stats:
-        print("No data to combine.")
         return None
 
-    # Concatenate all years' stats
-    final_combined_df = pd.concat(combined_stats, ignore_index=True)
+    # Concatenate all years' stats (categories differ per year, so re-apply the schema)
+    final_combined_df = apply_schema(pd.concat(combined_stats, ignore_index=True))
 
     # Debugging: Check if "Standardized Team" column is present
     if "Standardized Team" not in final_combined_df.columns:
         print("Error: 'Standardized Team' column not found in combined DataFrame.")
         return None
 
-    # Append playoff status
-    final_combined_df = playoff_team_status(final_combined_df, csv_filename, years)
-
     return final_combined_df
 
 
-def playoff_team_status(qb_combined_stats_df, csv_filename=None, years=None):
+STANDINGS_COLUMNS = ["Year", "Franchise", "Playoff Status"]
+
+
+def season_standings(year, response):
+    """
+    Parses a season's standings page into each team's playoff status.
+
+    Args:
+        year (int): The season of the page.
+        response (requests.Response or CachedResponse): Fetched standings page.
+
+    Returns:
+        pd.DataFrame or None: Year, Franchise (team_resolver franchise ID) and Playoff
+                              Status ("Playoff" or "Eliminated") per team, or None if
+                              the page has no AFC/NFC standings tables.
+    """
+    afc_table = extract_table(response.content, table_id="AFC")
+    nfc_table = extract_table(response.content, table_id="NFC")
+    return standings_from_tables(year, afc_table, nfc_table)
+
+
+def standings_from_tables(year, afc_table, nfc_table):
+    """
+    Builds a season's playoff status table from its extracted AFC and NFC standings tables.
+
+    Args:
+        year (int): The season of the tables.
+        afc_table (table_extract.ExtractedTable or None): AFC standings table.
+        nfc_table (table_extract.ExtractedTable or None): NFC standings table.
+
+    Returns:
+        pd.DataFrame or None: See season_standings.
+    """
+    RUN_REPORT.record_parse(season_page_url(year, "standings"))
+    if not afc_table or not nfc_table:
+        print(f"Could not find standings tables for year {year}. Skipping...")
+        return None
+
+    # Team names of both conferences; "*" and "+" mark playoff teams
+    names = pd.Series(
+        [name for name in afc_table.th + nfc_table.th if name is not None], dtype=object
+    ).str.strip()
+    clean_names = names.str.rstrip("*+").str.strip()
+    codes, unknown = TEAM_RESOLVER.codes(clean_names, year)
+    if unknown:
+        print(f"Standings teams missing from mapping for year {year}: {unknown}")
+
+    table = pd.DataFrame(
+        {
+            "Year": np.full(len(codes), year, dtype="int64"),
+            "Franchise": codes,
+            "Playoff Status": np.where(names.str.endswith(("*", "+")), "Playoff", "Eliminated"),
+        }
+    )
+    logger.debug(
+        "Year %s Playoff Mapping: %s",
+        year,
+        dict(zip(TEAM_RESOLVER.names(codes), table["Playoff Status"])),
+    )
+
+    # Only teams resolved to a franchise can match a QB; a team listed twice keeps its last row
+    resolved = (table["Franchise"] != NO_TEAM) & (table["Franchise"] != TEAM_RESOLVER.unknown)
+    return table[resolved].drop_duplicates("Franchise", keep="last").reset_index(drop=True)
+
+
+@INSTRUMENTATION.timed("playoff")
+def playoff_team_status(
+    qb_combined_stats_df, csv_filename=None, years=None, pages=None, standings=None
+):
     """
     Appends playoff status to the combined QB stats DataFrame for given years.
 
@@ -287,6 +800,10 @@ def playoff_team_status(qb_combined_stats_df, csv_filename=None, years=None):
         qb_combined_stats_df (pd.DataFrame): DataFrame containing QB stats with standardized team names.
         csv_filename (str, optional): File path to export the final DataFrame. Defaults to None.
         years (list, optional): List of years to process. Defaults to None.
+        pages (dict, optional): Prefetched responses from fetch_season_pages.
+            Standings pages missing from it are fetched here.
+        standings (dict, optional): Year to already parsed season_standings table.
+            Years listed here are not fetched or parsed again.
 
     Returns:
         pd.DataFrame: Updated DataFrame with playoff status included.
@@ -299,86 +816,78 @@ def playoff_team_status(qb_combined_stats_df, csv_filename=None, years=None):
             "The input DataFrame is missing or does not contain the required 'Standardized Team' column."
         )
 
-    # Dictionary to store playoff status by team name per year
-    team_playoff_status = {}
-
-    def process_table(table, year):
-        for row in table.find_all("tr")[1:]:  # Skip header row
-            header = row.find("th")
-            if header:
-                team_name = header.text.strip()
-                clean_team_name = team_name.rstrip(
-                    "*+"
-                ).strip()  # Remove playoff markers
-                standardized_name = TEAM_NAME_MAPPING.get(
-                    clean_team_name, clean_team_name
-                )  # Use mapping
-
-                # Debugging print to confirm mapping
-                print(
-                    f"Processing: Raw: {team_name}, Cleaned: {clean_team_name}, Standardized: {standardized_name}"
-                )
+    if years is None:
+        years = sorted(qb_combined_stats_df["Year"].unique())
 
-                # Map the cleaned and standardized name to playoff status
-                if team_name.endswith(("*", "+")):
-                    team_playoff_status[standardized_name] = "Playoff"
-                else:
-                    team_playoff_status[standardized_name] = "Eliminated"
+    # Parsed standings (see season_standings) of every season that has them
+    season_tables = []
+    processed_years = []
 
     # Process playoff data for each year
     for year in years:
-        print(f"\nProcessing playoff data for year {year}...")
-        team_playoff_status = {}  # Reset playoff status dictionary for each year
-        team_standings_url = f"https://www.pro-football-reference.com/years/{year}/"
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:91.0) Gecko/20100101 Firefox/91.0"
+        table = (standings or {}).get(year)
+        if table is None:
+            print(f"\nProcessing playoff data for year {year}...")
+            response = (pages or {}).get((year, "standings"))
+            if response is None:
+                headers = {
+                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:91.0) Gecko/20100101 Firefox/91.0"
+                }
+                response = request_with_retry(season_page_url(year, "standings"), headers=headers)
+            if not response:
+                print(
+                    f"Failed to retrieve data for year {year}. Skipping playoff status update for this year."
+                )
+                continue
+            table = season_standings(year, response)
+            if table is None:
+                continue
+        elif "Franchise" not in table.columns:
+            # Standings parsed before teams were keyed by franchise ID (e.g. a backfill checkpoint)
+            table = table.assign(Franchise=TEAM_RESOLVER.franchise_codes(table["Standardized Team"]))
+            table = table[table["Franchise"] != NO_TEAM]
+
+        season_tables.append(table)
+        processed_years.append(year)
+
+    # Attach every season's playoff status with one merge on the integer (Year, Franchise)
+    # keys; a season listed twice keeps its last parse
+    status_table = (
+        pd.concat(
+            [table[STANDINGS_COLUMNS] for table in season_tables]
+            or [pd.DataFrame(columns=STANDINGS_COLUMNS)],
+            ignore_index=True,
+        )
+        .astype({"Year": "int64", "Franchise": "int16"})
+        .drop_duplicates(["Year", "Franchise"], keep="last")
+    )
+    keys = pd.DataFrame(
+        {
+            "Year": qb_combined_stats_df["Year"].astype("int64").to_numpy(),
+            "Franchise": TEAM_RESOLVER.franchise_codes(qb_combined_stats_df["Standardized Team"]),
         }
-        response = request_with_retry(team_standings_url, headers=headers)
-        if not response:
-            print(
-                f"Failed to retrieve data for year {year}. Skipping playoff status update for this year."
-            )
-            continue
-
-        soup = BeautifulSoup(response.content, "html.parser")
-        afc_table = soup.find("table", id="AFC")
-        nfc_table = soup.find("table", id="NFC")
-        if not afc_table or not nfc_table:
-            print(f"Could not find standings tables for year {year}. Skipping...")
-            continue
-
-        # Process AFC and NFC tables
-        process_table(afc_table, year)
-        process_table(nfc_table, year)
-
-        # Debugging: Check playoff mapping
-        print(f"Year {year} Playoff Mapping: {team_playoff_status}")
-
-        # Map playoff statuses to QB stats DataFrame for this year
-        qb_combined_stats_df.loc[
-            qb_combined_stats_df["Year"] == year, "Playoff Status"
-        ] = qb_combined_stats_df.loc[
-            qb_combined_stats_df["Year"] == year, "Standardized Team"
-        ].map(
-            lambda team: team_playoff_status.get(team, "Unknown")
+    )
+    status = keys.merge(status_table, on=["Year", "Franchise"], how="left")["Playoff Status"]
+    status.index = qb_combined_stats_df.index
+
+    # QBs of a processed season whose team is not in its standings
+    processed = keys["Year"].isin(processed_years).set_axis(qb_combined_stats_df.index)
+    unmatched = processed & status.isna()
+    if unmatched.any():
+        logger.debug(
+            "Unmatched teams to playoff status: %s",
+            qb_combined_stats_df.loc[unmatched, "Standardized Team"].unique(),
         )
 
-    # Debugging: Check for unmatched teams
-    unmatched_teams = qb_combined_stats_df[
-        qb_combined_stats_df["Playoff Status"] == "Unknown"
-    ]["Standardized Team"].unique()
-    if unmatched_teams.size > 0:
-        print("\n--- Debug: Unmatched Teams to Playoff Status ---")
-        print(unmatched_teams)
-
     # Handle unmatched teams (default to "Eliminated")
-    qb_combined_stats_df["Playoff Status"] = qb_combined_stats_df[
-        "Playoff Status"
-    ].replace("Unknown", "Eliminated")
+    status = status.mask(unmatched, "Eliminated")
+    if "Playoff Status" in qb_combined_stats_df.columns:
+        # Seasons without standings keep their previous status
+        status = status.where(processed, qb_combined_stats_df["Playoff Status"].astype(object))
+    qb_combined_stats_df["Playoff Status"] = status
 
     # Export to CSV
     if csv_filename:
-        qb_combined_stats_df.to_csv(csv_filename, index=False)
-        print(f"Data exported to {csv_filename}")
+        export_frame(qb_combined_stats_df, csv_filename)
 
     return qb_combined_stats_df
@@ -0,0 +1,195 @@
+import random
+import threading
+import time
+from bisect import bisect_left
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from config import (
+    CONNECT_TIMEOUT,
+    READ_TIMEOUT,
+    BACKOFF_BASE,
+    BACKOFF_CAP,
+    FETCH_WORKERS,
+)
+from rate_limit import RATE_LIMITER
+from instrumentation import INSTRUMENTATION
+
+# Upper bounds (milliseconds) of the latency histogram buckets
+LATENCY_BUCKETS_MS = [50, 100, 250, 500, 1000, 2500, 5000, 10000, float("inf")]
+
+# Errors worth retrying: dropped/reset connections and stalled sockets
+RETRYABLE_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+
+class HostStats:
+    """
+    Request counters and latency histogram for a single host.
+    """
+
+    def __init__(self):
+        self.requests = 0
+        self.retries = 0
+        self.errors = 0
+        self.bytes = 0
+        self.latency_ms = [0] * len(LATENCY_BUCKETS_MS)
+
+    def record(self, seconds, nbytes):
+        self.requests += 1
+        self.bytes += nbytes
+        self.latency_ms[bisect_left(LATENCY_BUCKETS_MS, seconds * 1000)] += 1
+
+    def as_dict(self):
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "errors": self.errors,
+            "bytes": self.bytes,
+            "latency_ms": {
+                f"<={edge:g}": count
+                for edge, count in zip(LATENCY_BUCKETS_MS, self.latency_ms)
+            },
+        }
+
+
+def full_jitter_backoff(attempt, base=BACKOFF_BASE, cap=BACKOFF_CAP):
+    """
+    Full-jitter exponential backoff: a uniform draw in [0, min(cap, base * 2**attempt)].
+
+    Args:
+        attempt (int): Zero-based retry attempt.
+        base (float): Base delay in seconds.
+        cap (float): Maximum delay in seconds.
+
+    Returns:
+        float: Seconds to wait.
+    """
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+def retry_after_seconds(value):
+    """
+    Parses a Retry-After header given either as delta-seconds or an HTTP date.
+
+    Args:
+        value (str or None): Header value.
+
+    Returns:
+        float or None: Seconds to wait, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class HttpSession:
+    """
+    Connection-pooled, keep-alive session shared by all scrapers.
+
+    Every request uses connect/read timeouts and waits for the shared rate
+    limiter. 429 responses honor Retry-After, while 5xx responses and
+    connection resets/timeouts are retried with full-jitter backoff.
+    """
+
+    def __init__(
+        self,
+        timeout=(CONNECT_TIMEOUT, READ_TIMEOUT),
+        pool_size=FETCH_WORKERS,
+        limiter=RATE_LIMITER,
+    ):
+        self.timeout = timeout
+        self.limiter = limiter
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.stats = {}
+        self._lock = threading.Lock()
+
+    def _host_stats(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            return self.stats.setdefault(host, HostStats())
+
+    def get(self, url, headers=None, retries=3, backoff_base=BACKOFF_BASE):
+        """
+        GETs a URL, retrying on 429, 5xx and connection errors.
+
+        Args:
+            url (str): URL to fetch.
+            headers (dict, optional): Request headers.
+            retries (int): Maximum number of attempts.
+            backoff_base (float): Base delay in seconds for the jittered backoff.
+
+        Returns:
+            requests.Response or None: The final response (which may be a
+            non-retryable error status), or None if every attempt failed.
+        """
+        stats = self._host_stats(url)
+        for attempt in range(retries):
+            if attempt:
+                with self._lock:
+                    stats.retries += 1
+            self.limiter.acquire()
+            start = time.perf_counter()
+            try:
+                response = self.session.get(url, headers=headers, timeout=self.timeout)
+            except RETRYABLE_ERRORS as e:
+                with self._lock:
+                    stats.errors += 1
+                wait = full_jitter_backoff(attempt, backoff_base)
+                print(
+                    f"Connection error for {url}: {e}. Attempt {attempt + 1}/{retries}. Retrying after {wait:.1f} seconds..."
+                )
+                time.sleep(wait)
+                continue
+            with self._lock:
+                stats.record(time.perf_counter() - start, len(response.content))
+            INSTRUMENTATION.count("http_requests")
+            INSTRUMENTATION.count("http_bytes", len(response.content))
+
+            if response.status_code == 429:
+                wait = retry_after_seconds(response.headers.get("Retry-After"))
+                if wait is None:
+                    wait = full_jitter_backoff(attempt, backoff_base)
+                print(
+                    f"Received 429 Too Many Requests. Attempt {attempt + 1}/{retries}. Retrying after {wait:.1f} seconds..."
+                )
+                # Pause the shared limiter so every worker backs off, not just this one
+                self.limiter.pause(wait)
+            elif response.status_code >= 500:
+                with self._lock:
+                    stats.errors += 1
+                wait = full_jitter_backoff(attempt, backoff_base)
+                print(
+                    f"Received {response.status_code} from {url}. Attempt {attempt + 1}/{retries}. Retrying after {wait:.1f} seconds..."
+                )
+                time.sleep(wait)
+            else:
+                return response
+        return None
+
+    def print_stats(self):
+        """
+        Prints per-host request, retry, byte and latency counters.
+        """
+        print("\n--- HTTP Stats ---")
+        with self._lock:
+            for host, stats in sorted(self.stats.items()):
+                print(f"{host}: {stats.as_dict()}")
+
+
+# Shared session used by get_data.request_with_retry
+HTTP_SESSION = HttpSession()
@@ -0,0 +1,219 @@
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from config import INSTRUMENT_LOG, TRACE_PATH
+
+try:
+    import resource
+except ImportError:  # Windows has no getrusage
+    resource = None
+
+
+def peak_rss_mib():
+    """
+    Returns:
+        float or None: Peak resident set size of this process so far, in MiB
+                       (None where the platform does not report it).
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class Instrumentation:
+    """
+    Records wall time, CPU time, peak RSS, HTTP traffic and row counts of the
+    pipeline's stages.
+
+    Stages are opened with the stage() context manager or the timed()
+    decorator and may nest. Counters added with count() (e.g. HTTP bytes from
+    fetch threads) are credited to every stage open at the time. Each finished
+    stage is appended to the JSON lines log when log_path is set, and all
+    stages are written as a Chrome trace (chrome://tracing, Perfetto) to
+    trace_path on close().
+    """
+
+    def __init__(self, log_path=INSTRUMENT_LOG, trace_path=TRACE_PATH):
+        self.log_path = log_path
+        self.trace_path = trace_path
+        self.records = []
+        self._active = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+
+    def _stack(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    @contextmanager
+    def stage(self, name, **fields):
+        """
+        Measures the enclosed block as one stage.
+
+        Args:
+            name (str): Stage name, e.g. "fetch" or "scrape_passing".
+            **fields: Extra values to record with the stage, e.g. year=2022.
+
+        Yields:
+            dict: The stage's record; set record["rows"] (or any other key)
+                  inside the block to record it.
+        """
+        stack = self._stack()
+        record = {"stage": name, **fields}
+        if stack:
+            record["parent"] = stack[-1]["stage"]
+        counters = {}
+        stack.append(record)
+        with self._lock:
+            self._active.append(counters)
+
+        times = os.times()
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            end = time.perf_counter()
+            end_times = os.times()
+            stack.pop()
+            with self._lock:
+                self._active.remove(counters)
+            record.update(
+                start_s=round(start - self._origin, 6),
+                wall_s=round(end - start, 6),
+                cpu_s=round(end_times.user + end_times.system - times.user - times.system, 6),
+                child_cpu_s=round(
+                    end_times.children_user + end_times.children_system
+                    - times.children_user - times.children_system,
+                    6,
+                ),
+                peak_rss_mib=peak_rss_mib(),
+                thread=threading.get_ident(),
+                **counters,
+            )
+            self._finish(record)
+
+    def timed(self, name=None, fields=()):
+        """
+        Decorator measuring every call of a function as a stage.
+
+        Args:
+            name (str, optional): Stage name. Defaults to the function's name.
+            fields (tuple): Names of arguments to record with the stage, e.g. ("year",).
+
+        Returns:
+            callable: Decorator. The row count of DataFrame results is recorded as "rows".
+        """
+
+        def decorator(func):
+            stage_name = name or func.__name__
+            code = func.__code__
+            positions = {arg: i for i, arg in enumerate(code.co_varnames[: code.co_argcount])}
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                values = {}
+                for field in fields:
+                    if field in kwargs:
+                        values[field] = kwargs[field]
+                    elif positions.get(field, len(args)) < len(args):
+                        values[field] = args[positions[field]]
+                with self.stage(stage_name, **values) as record:
+                    result = func(*args, **kwargs)
+                    if hasattr(result, "shape"):
+                        record["rows"] = result.shape[0]
+                    return result
+
+            return wrapper
+
+        return decorator
+
+    def count(self, counter, amount=1):
+        """
+        Adds to a counter of every open stage (from any thread).
+
+        Args:
+            counter (str): Counter name, e.g. "http_bytes".
+            amount (int): Amount to add.
+        """
+        with self._lock:
+            for counters in self._active:
+                counters[counter] = counters.get(counter, 0) + amount
+
+    def _finish(self, record):
+        with self._lock:
+            self.records.append(record)
+            if self.log_path:
+                with open(self.log_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(record, default=str) + "\n")
+
+    def write_trace(self, path=None):
+        """
+        Writes every recorded stage as a Chrome trace event file.
+
+        Args:
+            path (str, optional): Output path. Defaults to trace_path.
+        """
+        path = path or self.trace_path
+        events = []
+        for record in self.records:
+            label = record["stage"] + (f" {record['year']}" if record.get("year") is not None else "")
+            events.append(
+                {
+                    "name": label,
+                    "cat": "stage",
+                    "ph": "X",
+                    "ts": record["start_s"] * 1e6,
+                    "dur": record["wall_s"] * 1e6,
+                    "pid": os.getpid(),
+                    "tid": record["thread"],
+                    "args": {
+                        key: value
+                        for key, value in record.items()
+                        if key not in ("stage", "start_s", "wall_s", "thread")
+                    },
+                }
+            )
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, default=str)
+        os.replace(tmp_path, path)
+        print(f"Trace written to {path}")
+
+    def print_summary(self):
+        """
+        Prints total wall / CPU time, HTTP bytes and rows per stage name.
+        """
+        totals = {}
+        for record in self.records:
+            total = totals.setdefault(
+                record["stage"], {"calls": 0, "wall_s": 0.0, "cpu_s": 0.0, "http_bytes": 0, "rows": 0}
+            )
+            total["calls"] += 1
+            for key in ("wall_s", "cpu_s", "http_bytes", "rows"):
+                total[key] += record.get(key) or 0
+        print("\n--- Stage Timings ---")
+        for stage, total in totals.items():
+            print(
+                f"{stage}: {total['calls']}x, wall {total['wall_s']:.3f}s, cpu {total['cpu_s']:.3f}s, "
+                f"{total['http_bytes']} HTTP bytes, {total['rows']} rows"
+            )
+        print(f"Peak RSS: {peak_rss_mib():.1f} MiB" if resource else "Peak RSS: unavailable")
+
+    def close(self):
+        """
+        Writes the Chrome trace if a trace path is set.
+        """
+        if self.trace_path and self.records:
+            self.write_trace()
+
+
+# Shared instrumentation for every pipeline stage
+INSTRUMENTATION = Instrumentation()
@@ -1,39 +1,43 @@
-from get_data import (
-    scrape_qb_pass_stats,
-    scrape_qb_rush_stats,
-    combine_qb_stats,
-)
+import logging
+from config import LOG_LEVEL, SEASONS
+from get_data import combine_qb_stats, RUN_REPORT, SEASON_STORE
+from http_session import HTTP_SESSION
+from instrumentation import INSTRUMENTATION
+from parse_pipeline import run_season_pipeline
 
 
 def main():
     """
     Main function to scrape QB stats for each year and combine them into single csv
     """
+    logging.basicConfig(level=LOG_LEVEL, format="%(levelname)s %(name)s: %(message)s")
+
     # Define the years to
-    years_to_scrape = [2013, 2021, 2022]
-
-    # Scrape QB Passing and Rushing Stats
-    for year in years_to_scrape:
-        print(f"\nProcessing QB Passing Stats for {year}...")
-        pass_df = scrape_qb_pass_stats(year, f"qb_pass_stats_{year}.csv")
-        if pass_df is not None:
-            print(f"QB Passing Stats {year} (First 5 Rows):")
-            print(pass_df.head())
-
-            print(f"\nProcessing QB Rushing Stats for {year}...")
-            rush_df = scrape_qb_rush_stats(year, pass_df, f"qb_rush_stats_{year}.csv")
-            if rush_df is not None:
-                print(f"QB Rushing Stats {year} (First 5 Rows):")
-                print(rush_df.head())
-            else:
-                print(f"Failed to scrape QB Rushing Stats for {year}.")
-        else:
-            print(f"Failed to scrape QB Passing Stats for {year}.")
-
-    # Combine QB Passing and Rushing Stats and append with Playoff status
+    years_to_scrape = SEASONS
+
+    # Only seasons missing from the store (or the stale current season) need scraping
+    stale_years = SEASON_STORE.stale_years(years_to_scrape)
+
+    # Fetch every season page on threads and parse them on a process pool while
+    # the QB Passing and Rushing Stats of finished seasons are built
+    season_stats, standings = run_season_pipeline(stale_years)
+    for year in stale_years:
+        if year not in season_stats:
+            print(f"Failed to scrape QB Passing/Rushing Stats for {year}.")
+            continue
+        pass_df, rush_df = season_stats[year]
+        print(f"QB Passing Stats {year} (First 5 Rows):")
+        print(pass_df.head())
+        print(f"QB Rushing Stats {year} (First 5 Rows):")
+        print(rush_df.head())
+
+    # Combine the already scraped QB Passing and Rushing Stats and append with Playoff status
     print("\nCombining QB Stats and Exporting...")
     combined_df = combine_qb_stats(
-        years_to_scrape, "qb_combined_stats_with_playoff_status.csv"
+        years_to_scrape,
+        "qb_combined_stats_with_playoff_status.csv",
+        season_stats=season_stats,
+        standings=standings,
     )
     if combined_df is not None:
         print("Combined QB Stats (First 5 Rows):")
@@ -41,6 +45,11 @@ def main():
     else:
         print("Failed to combine QB Stats.")
 
+    RUN_REPORT.print_report()
+    HTTP_SESSION.print_stats()
+    INSTRUMENTATION.print_summary()
+    INSTRUMENTATION.close()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,295 @@
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import time
+import zlib
+from datetime import date
+from config import CACHE_DIR, CACHE_MAX_BYTES, CURRENT_SEASON_TTL, CACHE_OFFLINE, CACHE_INDEX_FLUSH_INTERVAL
+
+
+def current_season(today=None):
+    """
+    Returns the NFL season currently in progress (or most recently started).
+    January and February games belong to the previous calendar year's season.
+
+    Args:
+        today (datetime.date, optional): Date to evaluate. Defaults to today.
+
+    Returns:
+        int: The current season year.
+    """
+    today = today or date.today()
+    return today.year if today.month >= 3 else today.year - 1
+
+
+def season_close(year):
+    """
+    Returns when a season stops being the current one (see current_season).
+
+    Args:
+        year (int): Season year.
+
+    Returns:
+        float: Local midnight of March 1 of the following year, in seconds since the epoch.
+    """
+    return time.mktime(date(year + 1, 3, 1).timetuple())
+
+
+def season_ttl(url):
+    """
+    Chooses the cache lifetime for a Pro Football Reference season page.
+    Closed seasons never change, so their pages never expire; the current
+    season (or any URL without a year) is revalidated after CURRENT_SEASON_TTL.
+
+    Args:
+        url (str): URL of the cached page.
+
+    Returns:
+        int or None: TTL in seconds, or None if the entry never expires.
+    """
+    match = re.search(r"/years/(\d{4})/", url)
+    if match and int(match.group(1)) < current_season():
+        return None
+    return CURRENT_SEASON_TTL
+
+
+class CachedResponse:
+    """
+    Minimal stand-in for requests.Response built from a cache entry.
+    """
+
+    def __init__(self, url, content, headers=None, status_code=200):
+        self.url = url
+        self.content = content
+        self.headers = headers or {}
+        self.status_code = status_code
+        self.from_cache = True
+
+    @property
+    def ok(self):
+        return self.status_code < 400
+
+    def __bool__(self):
+        return self.ok
+
+
+class PageCache:
+    """
+    Persistent HTTP page cache keyed by URL.
+
+    Page bodies are stored zlib-compressed under the SHA-256 of their content,
+    so identical pages share one object. An index file maps each URL to its
+    object, validators (ETag / Last-Modified), fetch time, TTL and last access
+    time, which drives least-recently-used eviction once the stored objects
+    exceed max_bytes. Cache hits only update the access time in memory; the
+    index is written by put, touch and eviction, by a hit at most every
+    flush_interval seconds, and by close.
+    """
+
+    def __init__(
+        self,
+        cache_dir=CACHE_DIR,
+        max_bytes=CACHE_MAX_BYTES,
+        offline=CACHE_OFFLINE,
+        flush_interval=CACHE_INDEX_FLUSH_INTERVAL,
+    ):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.offline = offline
+        self.flush_interval = flush_interval
+        self._index_path = os.path.join(cache_dir, "index.json")
+        self._lock = threading.Lock()
+        self._index = None
+        self._dirty = False
+        self._saved_at = time.time()
+
+    def _load_index(self):
+        if self._index is None:
+            if os.path.exists(self._index_path):
+                with open(self._index_path, "r", encoding="utf-8") as f:
+                    self._index = json.load(f)
+            else:
+                self._index = {}
+        return self._index
+
+    def _save_index(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{self._index_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, self._index_path)
+        self._dirty = False
+        self._saved_at = time.time()
+
+    def _object_path(self, digest):
+        return os.path.join(self.cache_dir, "objects", digest[:2], f"{digest}.z")
+
+    def get(self, url):
+        """
+        Looks up a cached page.
+
+        Args:
+            url (str): URL of the page.
+
+        Returns:
+            dict or None: Index entry with the decompressed body under "content",
+            or None if the URL is not cached.
+        """
+        with self._lock:
+            entry = self._load_index().get(url)
+            if entry is None:
+                return None
+            try:
+                with open(self._object_path(entry["digest"]), "rb") as f:
+                    content = zlib.decompress(f.read())
+            except (OSError, zlib.error):
+                # Object missing or corrupt: forget the entry and refetch
+                del self._index[url]
+                self._save_index()
+                return None
+            entry["last_access"] = time.time()
+            self._dirty = True
+            if entry["last_access"] - self._saved_at >= self.flush_interval:
+                self._save_index()
+            return dict(entry, content=content)
+
+    def is_fresh(self, entry):
+        """
+        Checks whether a cache entry can be served without revalidation.
+
+        Args:
+            entry (dict): Entry returned by get().
+
+        Returns:
+            bool: True if the entry has not expired.
+        """
+        ttl = entry.get("ttl")
+        return ttl is None or time.time() - entry["fetched_at"] < ttl
+
+    def validators(self, entry):
+        """
+        Builds conditional request headers for revalidating an entry.
+
+        Args:
+            entry (dict): Entry returned by get().
+
+        Returns:
+            dict: If-None-Match / If-Modified-Since headers.
+        """
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def put(self, url, content, headers=None, ttl=None):
+        """
+        Stores a page body and its validators, then evicts old pages if needed.
+
+        Args:
+            url (str): URL of the page.
+            content (bytes): Raw page body.
+            headers (Mapping, optional): Response headers (ETag, Last-Modified).
+            ttl (int, optional): Lifetime in seconds; None never expires.
+        """
+        headers = headers or {}
+        digest = hashlib.sha256(content).hexdigest()
+        object_path = self._object_path(digest)
+        with self._lock:
+            index = self._load_index()
+            if not os.path.exists(object_path):
+                os.makedirs(os.path.dirname(object_path), exist_ok=True)
+                tmp_path = f"{object_path}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(zlib.compress(content, 6))
+                os.replace(tmp_path, object_path)
+            now = time.time()
+            index[url] = {
+                "digest": digest,
+                "size": os.path.getsize(object_path),
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified"),
+                "fetched_at": now,
+                "last_access": now,
+                "ttl": ttl,
+            }
+            self._evict()
+            self._save_index()
+
+    def touch(self, url, headers=None, ttl=None):
+        """
+        Marks an entry as freshly fetched after a 304 Not Modified response.
+
+        Args:
+            url (str): URL of the page.
+            headers (Mapping, optional): Headers of the 304 response.
+            ttl (int, optional): New lifetime in seconds; None never expires. A
+                season's pages stop expiring once it closes (see season_ttl).
+        """
+        headers = headers or {}
+        with self._lock:
+            entry = self._load_index().get(url)
+            if entry is None:
+                return
+            entry["fetched_at"] = entry["last_access"] = time.time()
+            entry["etag"] = headers.get("ETag", entry.get("etag"))
+            entry["last_modified"] = headers.get("Last-Modified", entry.get("last_modified"))
+            entry["ttl"] = ttl
+            self._save_index()
+
+    def _evict(self):
+        # Distinct objects only: several URLs can point at the same content
+        sizes = {e["digest"]: e["size"] for e in self._index.values()}
+        total = sum(sizes.values())
+        by_age = sorted(self._index.items(), key=lambda item: item[1]["last_access"])
+        for url, entry in by_age:
+            if total <= self.max_bytes:
+                break
+            del self._index[url]
+            if all(e["digest"] != entry["digest"] for e in self._index.values()):
+                total -= entry["size"]
+                try:
+                    os.remove(self._object_path(entry["digest"]))
+                except OSError:
+                    pass
+
+    def stats(self):
+        """
+        Summarizes the cache contents.
+
+        Returns:
+            dict: Number of URLs, distinct objects and stored (compressed) bytes.
+        """
+        with self._lock:
+            index = self._load_index()
+            sizes = {e["digest"]: e["size"] for e in index.values()}
+            return {"urls": len(index), "objects": len(sizes), "bytes": sum(sizes.values())}
+
+    def urls(self):
+        """
+        Returns:
+            list: Sorted URLs of every cached page.
+        """
+        with self._lock:
+            return sorted(self._load_index())
+
+    def close(self):
+        """
+        Writes access times recorded since the last index write.
+        """
+        with self._lock:
+            if self._dirty:
+                self._save_index()
+
+    def clear(self):
+        """
+        Removes every cached page.
+        """
+        with self._lock:
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+            self._index = {}
+            self._dirty = False
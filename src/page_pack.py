@@ -0,0 +1,229 @@
+import hashlib
+import json
+import mmap
+import os
+import zlib
+from urllib.parse import urlsplit
+from config import PACK_PATH, PARSE_WORKERS
+
+
+class PagePack:
+    """
+    Append-only archive of the raw season pages, for re-parsing them without
+    refetching.
+
+    Every page is zlib-compressed and appended to one pack file. A sidecar
+    index (path + ".idx") holds one JSON line per page with its year, page
+    type, offset and length in the pack, uncompressed size and SHA-256; it is
+    appended only after the page bytes are written, so an interrupted append
+    leaves at most unindexed bytes at the end of the pack. The last entry of a
+    (year, page) wins, and adding unchanged content is a no-op. Readers map
+    the pack with mmap and slice it without copying. Only the standard library
+    is used, so the archive can be inspected without the scraping stack.
+    """
+
+    def __init__(self, path=PACK_PATH):
+        self.path = path
+        self.index_path = f"{path}.idx"
+        self._entries = None
+        self._file = None
+        self._map = None
+
+    def _load(self):
+        if self._entries is None:
+            self._entries = {}
+            if os.path.exists(self.index_path):
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        if line.strip():
+                            entry = json.loads(line)
+                            self._entries[entry["year"], entry["page"]] = entry
+        return self._entries
+
+    def entries(self):
+        """
+        Returns:
+            dict: (year, page) to its latest index entry, by year and then page.
+        """
+        return dict(sorted(self._load().items()))
+
+    def years(self):
+        """
+        Returns:
+            list: Sorted seasons with at least one packed page.
+        """
+        return sorted({year for year, _ in self._load()})
+
+    def add(self, year, page, content):
+        """
+        Appends a page to the pack unless its latest version has the same content.
+
+        Args:
+            year (int): Season of the page.
+            page (str): SEASON_PAGES key of the page.
+            content (bytes): Page HTML.
+
+        Returns:
+            bool: True if the page was appended.
+        """
+        digest = hashlib.sha256(content).hexdigest()
+        current = self._load().get((year, page))
+        if current is not None and current["sha256"] == digest:
+            return False
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = zlib.compress(content)
+        with open(self.path, "ab") as f:
+            offset = f.seek(0, os.SEEK_END)
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        entry = {
+            "year": year,
+            "page": page,
+            "offset": offset,
+            "length": len(data),
+            "size": len(content),
+            "sha256": digest,
+        }
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        self._entries[year, page] = entry
+        # The mapping does not cover the appended bytes
+        self.close()
+        return True
+
+    def view(self, year=None, page=None, entry=None):
+        """
+        Args:
+            year (int): Season of the page.
+            page (str): SEASON_PAGES key of the page.
+            entry (dict, optional): Index entry to read instead of (year, page).
+
+        Returns:
+            memoryview: The page's compressed bytes, sliced from the mapped pack
+                        without copying.
+        """
+        if entry is None:
+            entry = self._load()[year, page]
+        if self._map is None:
+            self._file = open(self.path, "rb")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(self._map)[entry["offset"]:entry["offset"] + entry["length"]]
+
+    def read(self, year=None, page=None, entry=None):
+        """
+        Returns:
+            bytes: The page's HTML (see view for the arguments).
+        """
+        view = self.view(year, page, entry)
+        try:
+            return zlib.decompress(view)
+        finally:
+            view.release()
+
+    def stats(self):
+        """
+        Returns:
+            dict: Number of seasons and pages, and their stored and uncompressed bytes.
+        """
+        entries = self._load().values()
+        return {
+            "years": len({entry["year"] for entry in entries}),
+            "pages": len(entries),
+            "bytes": os.path.getsize(self.path) if os.path.exists(self.path) else 0,
+            "size": sum(entry["size"] for entry in entries),
+        }
+
+    def close(self):
+        """
+        Unmaps the pack. Views handed out must have been released.
+        """
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = None
+            self._file = None
+
+
+def pack_page_cache(pack=None, cache=None):
+    """
+    Appends every season page in the page cache to the pack.
+
+    Args:
+        pack (PagePack, optional): Pack to add to. Defaults to the one at PACK_PATH.
+        cache (page_cache.PageCache, optional): Cache to read. Defaults to get_data.PAGE_CACHE.
+
+    Returns:
+        int: Number of pages appended (new or changed since they were packed).
+    """
+    from get_data import PAGE_CACHE, SEASON_PAGES
+
+    pack = pack or PagePack()
+    cache = cache or PAGE_CACHE
+    pages = {name: page for page, name in SEASON_PAGES.items()}
+    added = 0
+    for url in cache.urls():
+        parts = urlsplit(url).path.split("/")
+        # Season pages are /years/<year>/<name>
+        if len(parts) != 4 or parts[1] != "years" or not parts[2].isdigit() or parts[3] not in pages:
+            continue
+        entry = cache.get(url)
+        if entry is not None and pack.add(int(parts[2]), pages[parts[3]], entry["content"]):
+            added += 1
+    print(f"Packed {added} new or changed pages into {pack.path}")
+    return added
+
+
+# Pack opened by each parse worker process
+_WORKER_PACK = None
+
+
+def _init_worker(path):
+    global _WORKER_PACK
+    _WORKER_PACK = PagePack(path)
+
+
+def _parse_entry(entry, pack=None):
+    from parse_pipeline import parse_page
+
+    pack = pack or _WORKER_PACK
+    return entry["year"], entry["page"], parse_page(entry["page"], pack.read(entry=entry))
+
+
+def reparse_pack(pack=None, years=None, workers=PARSE_WORKERS):
+    """
+    Re-parses packed season pages in one batch, without fetching anything.
+
+    Parse workers map the pack themselves and are sent only index entries,
+    so no page bytes are copied between processes; each worker decompresses
+    its slice of the mapping and extracts the tables. The results go through
+    the season pipeline's merge stage (parse_pipeline.merge_parsed).
+
+    Args:
+        pack (PagePack, optional): Pack to read. Defaults to the one at PACK_PATH.
+        years (list, optional): Seasons to re-parse. Every packed season when None.
+        workers (int): Number of parse processes. 0 parses in this process.
+
+    Returns:
+        tuple: (season_stats, standings), see parse_pipeline.merge_parsed.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from parse_pipeline import merge_parsed
+
+    pack = pack or PagePack()
+    entries = [
+        entry
+        for (year, _), entry in pack.entries().items()
+        if years is None or year in years
+    ]
+    print(f"Re-parsing {len(entries)} packed pages from {pack.path} with {workers} parse processes...")
+
+    if workers <= 0:
+        parsed = (_parse_entry(entry, pack) for entry in entries)
+        return merge_parsed((year, page, True, table) for year, page, table in parsed)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(pack.path,)) as pool:
+        parsed = pool.map(_parse_entry, entries, chunksize=max(1, len(entries) // (workers * 4)))
+        return merge_parsed((year, page, True, table) for year, page, table in parsed)
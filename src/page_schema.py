@@ -0,0 +1,128 @@
+from collections import namedtuple
+
+# A scraped column: output name, the data-stat attributes and header labels it
+# may appear under (newest site layout first), the type to clean it to, whether
+# it is part of the exported DataFrame, and the value used when a cell is empty.
+Field = namedtuple(
+    "Field",
+    ["name", "stats", "labels", "dtype", "export", "default"],
+    defaults=(True, None),
+)
+
+PAGE_SCHEMAS = {
+    "passing": [
+        Field("Name", ("name_display", "player"), ("Player",), str),
+        Field("Team", ("team_name_abbr", "team"), ("Team", "Tm"), str),
+        Field("Position", ("pos",), ("Pos",), str, export=False),
+        Field("Games Played", ("games", "g"), ("G",), int),
+        Field("Passing Yards", ("pass_yds",), ("Yds",), int),
+        Field("Passing TDs", ("pass_td",), ("TD",), int),
+        Field("Interceptions", ("pass_int",), ("Int",), int),
+        Field("Rating", ("qbr",), ("QBR",), float),
+        Field("4QC", ("comebacks",), ("4QC",), int),  # 4th Quarter Comebacks
+        Field("GWD", ("gwd",), ("GWD",), int),  # Game-Winning Drives
+    ],
+    "rushing": [
+        Field("Name", ("name_display", "player"), ("Player",), str),
+        Field("Games Played", ("games", "g"), ("G",), int, export=False),
+        Field("Rushing Yards", ("rush_yds",), ("Yds",), int, default=0),
+        Field("Rushing TDs", ("rush_td",), ("TD",), int, default=0),
+    ],
+}
+
+# Storage types of the scraped and combined QB stats: categoricals for repeated
+# labels, the narrowest nullable integer that holds a season total, float32 for
+# ratings and ratios. Columns not listed keep their type.
+COMBINED_DTYPES = {
+    "Team": "category",
+    "Games Played": "Int8",
+    "Passing Yards": "Int16",
+    "Passing TDs": "Int8",
+    "Interceptions": "Int8",
+    "Rating": "Float32",
+    "4QC": "Int8",
+    "GWD": "Int8",
+    "Year": "category",
+    "Rushing Yards": "Int16",
+    "Rushing TDs": "Int8",
+    "Total Yards": "Int16",
+    "Total TDs": "Int8",
+    "Passing TD to INT Ratio": "float32",
+    "Standardized Team": "category",
+    "Playoff Status": "category",
+}
+
+# Resolved index maps, keyed by (page type, season layout)
+_RESOLVED = {}
+
+
+def _layout(table):
+    """
+    Signature of a table's column layout: the data-stat of every <td> position,
+    or the header labels when the page has no data-stat attributes.
+    """
+    if any(table.stats):
+        return ("stats",) + tuple(table.stats)
+    labels = [label for stat, label in table.header if stat != "ranker" and label != "Rk"]
+    return ("labels",) + tuple(labels)
+
+
+def resolve_columns(page_type, table):
+    """
+    Maps each schema field of a page type to its <td> position in a table.
+
+    Columns are matched on data-stat attributes, falling back to header labels,
+    and the resulting index map is cached per (page type, season layout), so each
+    layout is resolved once and row extraction is a keyed lookup.
+
+    Args:
+        page_type (str): Key of PAGE_SCHEMAS ("passing" or "rushing").
+        table (table_extract.ExtractedTable): Extracted stats table.
+
+    Returns:
+        dict: Mapping of field name to column index. Fields not found on the page are left out.
+    """
+    layout = _layout(table)
+    key = (page_type, layout)
+    if key not in _RESOLVED:
+        kind, names = layout[0], list(layout[1:])
+        index = {}
+        for field in PAGE_SCHEMAS[page_type]:
+            candidates = field.stats if kind == "stats" else field.labels
+            for candidate in candidates:
+                if candidate in names:
+                    index[field.name] = names.index(candidate)
+                    break
+        _RESOLVED[key] = index
+    return _RESOLVED[key]
+
+
+def missing_fields(page_type, index):
+    """
+    Args:
+        page_type (str): Key of PAGE_SCHEMAS.
+        index (dict): Result of resolve_columns.
+
+    Returns:
+        list: Names of schema fields that could not be located on the page.
+    """
+    return [field.name for field in PAGE_SCHEMAS[page_type] if field.name not in index]
+
+
+def apply_schema(df, dtypes=COMBINED_DTYPES):
+    """
+    Casts the columns of a DataFrame that are listed in dtypes to their storage type.
+
+    Args:
+        df (pd.DataFrame): Scraped or combined stats.
+        dtypes (dict): Column name to dtype.
+
+    Returns:
+        pd.DataFrame: df itself when every column already has its type, otherwise a cast copy.
+    """
+    casts = {
+        column: dtype
+        for column, dtype in dtypes.items()
+        if column in df.columns and df[column].dtype != dtype
+    }
+    return df.astype(casts) if casts else df
@@ -0,0 +1,275 @@
+import queue
+import random
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from config import FETCH_WORKERS, PARSE_WORKERS, PAGE_QUEUE_DEPTH, TABLE_QUEUE_DEPTH
+from get_data import (
+    SEASON_PAGES,
+    USER_AGENTS,
+    request_with_retry,
+    season_page_url,
+    scrape_qb_pass_stats,
+    scrape_qb_rush_stats,
+    standings_from_tables,
+    export_season_stats,
+)
+from instrumentation import INSTRUMENTATION
+from table_extract import extract_table
+
+# Marks the end of a queue's items
+_DONE = object()
+
+
+def parse_page(page, content):
+    """
+    Extracts the tables the scrapers need from a season page. Runs in a parse
+    worker process, so it only takes and returns picklable values.
+
+    Args:
+        page (str): SEASON_PAGES key of the page.
+        content (bytes): Page HTML.
+
+    Returns:
+        table_extract.ExtractedTable or tuple: The stats table of a passing or
+            rushing page (or None), or the (AFC, NFC) tables of a standings page.
+    """
+    if page == "standings":
+        return extract_table(content, table_id="AFC"), extract_table(content, table_id="NFC")
+    return extract_table(content, table_class="stats_table")
+
+
+def _put(q, item, stop):
+    # Blocks while the queue is full, but gives up once the pipeline is stopping
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return
+        except queue.Full:
+            continue
+
+
+def _get(q, stop):
+    # Returns _DONE instead of waiting forever once the pipeline is stopping
+    while not stop.is_set():
+        try:
+            return q.get(timeout=0.1)
+        except queue.Empty:
+            continue
+    return _DONE
+
+
+def _fetch_stage(tasks, pages_queue, stop, fetch_workers):
+    """
+    Fetches every (year, page) task on a thread pool and puts
+    (year, page, response) on pages_queue, then _DONE. An error is put on
+    pages_queue (ahead of _DONE) and the remaining fetches are cancelled.
+    """
+
+    def fetch(task):
+        year, page = task
+        if stop.is_set():
+            return
+        headers = {"User-Agent": random.choice(USER_AGENTS)}
+        response = request_with_retry(season_page_url(year, page), headers=headers)
+        _put(pages_queue, (year, page, response), stop)
+
+    executor = ThreadPoolExecutor(max_workers=fetch_workers)
+    try:
+        for _ in executor.map(fetch, tasks):
+            pass
+    except Exception as e:
+        # Handed down to the merge stage, which raises it and stops the pipeline
+        _put(pages_queue, e, stop)
+    finally:
+        executor.shutdown(cancel_futures=True)
+        _put(pages_queue, _DONE, stop)
+
+
+def _parse_stage(pages_queue, tables_queue, stop, pool):
+    """
+    Takes fetched pages off pages_queue, submits their extraction to the
+    process pool (or runs it here without one) and puts
+    (year, page, response, future) on tables_queue, then _DONE. The bounded
+    tables_queue also bounds the extractions in flight. Errors of this stage
+    or the fetch stage are put on tables_queue ahead of _DONE.
+    """
+    try:
+        while not stop.is_set():
+            item = _get(pages_queue, stop)
+            if item is _DONE:
+                break
+            if isinstance(item, Exception):
+                _put(tables_queue, item, stop)
+                break
+            year, page, response = item
+            if not response:
+                future = None
+            elif pool is None:
+                future = Future()
+                try:
+                    future.set_result(parse_page(page, response.content))
+                except Exception as e:
+                    future.set_exception(e)
+            else:
+                future = pool.submit(parse_page, page, response.content)
+            _put(tables_queue, (year, page, response, future), stop)
+    except Exception as e:
+        _put(tables_queue, e, stop)
+    finally:
+        _put(tables_queue, _DONE, stop)
+
+
+def _merge_season(year, fetched, tables, season_stats):
+    """
+    Builds a season's passing and rushing stats once both of its pages are parsed.
+    """
+    print(f"Processing data for year {year}...")
+    for page in ("passing", "rushing"):
+        url = season_page_url(year, page)
+        if not fetched[year, page]:
+            print(f"Failed to retrieve data from {url} after retries.")
+        elif tables[year, page] is None:
+            print(f"No stats table found on {url}.")
+        else:
+            continue
+        print(f"Skipping year {year} due to missing {page} stats.")
+        return
+    pass_stats = scrape_qb_pass_stats(year, table=tables[year, "passing"])
+    if pass_stats is None:
+        print(f"Skipping year {year} due to missing passing stats.")
+        return
+    rush_stats = scrape_qb_rush_stats(year, pass_stats, table=tables[year, "rushing"])
+    if rush_stats is None:
+        print(f"Skipping year {year} due to missing rushing stats.")
+        return
+    season_stats[year] = (pass_stats, rush_stats)
+
+
+def merge_parsed(parsed):
+    """
+    The merge stage: builds season stats and standings from parsed pages in
+    the order they arrive, merging a season as soon as both its passing and
+    rushing tables are in. The season stats are exported as by
+    get_data.scrape_season_stats.
+
+    Args:
+        parsed (iterable): (year, page, fetched, table) tuples, with table as
+            returned by parse_page (None when fetched is False).
+
+    Returns:
+        tuple: (season_stats, standings) with season_stats as returned by
+               scrape_season_stats and standings mapping each year whose
+               standings were parsed to its season_standings table.
+    """
+    season_stats = {}
+    standings = {}
+    fetched = {}
+    tables = {}
+    for year, page, ok, table in parsed:
+        INSTRUMENTATION.count("pages_parsed")
+        if page == "standings":
+            if not ok:
+                print(f"Failed to retrieve standings for year {year}.")
+                continue
+            table = standings_from_tables(year, *table)
+            if table is not None:
+                standings[year] = table
+            continue
+
+        fetched[year, page] = ok
+        tables[year, page] = table
+        if (year, "passing") in fetched and (year, "rushing") in fetched:
+            _merge_season(year, fetched, tables, season_stats)
+            # The season is merged; free its tables
+            for key in ((year, "passing"), (year, "rushing")):
+                del fetched[key], tables[key]
+
+    season_stats = dict(sorted(season_stats.items()))
+    export_season_stats(season_stats)
+    return season_stats, dict(sorted(standings.items()))
+
+
+def _parsed_pages(tables_queue):
+    # Yields (year, page, fetched, table) from the parse stage until it is done,
+    # raising the error of a failed stage
+    while True:
+        item = tables_queue.get()
+        if item is _DONE:
+            return
+        if isinstance(item, Exception):
+            raise item
+        year, page, response, future = item
+        yield year, page, bool(response), future.result() if future is not None else None
+
+
+def _start_pool(workers):
+    """
+    Creates the parse process pool and starts all of its workers. The pool
+    would otherwise fork them on its first submit, while the fetch threads
+    are running, and a child forked then can inherit a lock held by one of them.
+    """
+    pool = ProcessPoolExecutor(max_workers=workers)
+    for future in [pool.submit(int) for _ in range(workers)]:
+        future.result()
+    return pool
+
+
+@INSTRUMENTATION.timed("season_pipeline")
+def run_season_pipeline(
+    years,
+    pages=tuple(SEASON_PAGES),
+    fetch_workers=FETCH_WORKERS,
+    parse_workers=PARSE_WORKERS,
+    page_queue_depth=PAGE_QUEUE_DEPTH,
+    table_queue_depth=TABLE_QUEUE_DEPTH,
+):
+    """
+    Fetches, parses and merges season pages as a three-stage pipeline.
+
+    Fetch threads (I/O bound) put raw pages on a bounded queue; a dispatcher
+    hands each page to a pool of parse_workers processes that extract its
+    tables (CPU bound, so they run outside this process's GIL); the calling
+    thread is the single merge stage (merge_parsed). Full queues block the stage
+    feeding them, so at most page_queue_depth fetched pages and
+    table_queue_depth parsed results are held at a time. An error in any stage
+    stops the others and is raised here.
+
+    Args:
+        years (list): Years to process.
+        pages (iterable): SEASON_PAGES keys to fetch for each year. Seasons
+            need "passing" and "rushing"; "standings" adds their playoff status.
+        fetch_workers (int): Number of fetch threads.
+        parse_workers (int): Number of parse processes. 0 parses in this
+            process, on the dispatcher thread.
+        page_queue_depth (int): Fetched pages that may wait for a parse worker.
+        table_queue_depth (int): Parsed pages that may wait for the merge stage.
+
+    Returns:
+        tuple: (season_stats, standings), see merge_parsed.
+    """
+    tasks = [(year, page) for year in sorted(set(years)) for page in pages]
+    print(
+        f"Processing {len(tasks)} season pages with {fetch_workers} fetch threads "
+        f"and {parse_workers} parse processes..."
+    )
+
+    pages_queue = queue.Queue(maxsize=page_queue_depth)
+    tables_queue = queue.Queue(maxsize=table_queue_depth)
+    stop = threading.Event()
+    pool = _start_pool(parse_workers) if parse_workers > 0 else None
+    stages = [
+        threading.Thread(target=_fetch_stage, args=(tasks, pages_queue, stop, fetch_workers), daemon=True),
+        threading.Thread(target=_parse_stage, args=(pages_queue, tables_queue, stop, pool), daemon=True),
+    ]
+
+    try:
+        for stage in stages:
+            stage.start()
+        return merge_parsed(_parsed_pages(tables_queue))
+    finally:
+        # On an error, unblock and stop the other stages before the pool shuts down
+        stop.set()
+        for stage in stages:
+            stage.join()
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
@@ -0,0 +1,60 @@
+import threading
+import time
+from config import REQUESTS_PER_MINUTE, RATE_LIMIT_BURST
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket shared by every request to the site.
+
+    Tokens refill continuously at `rate` per second up to `capacity`; each
+    request takes one token and blocks until one is available.
+    """
+
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = max(0.0, now - max(self._updated, self._paused_until))
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = max(now, self._updated)
+
+    def acquire(self):
+        """
+        Blocks until a token is available, then consumes it.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                else:
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds):
+        """
+        Stops handing out tokens for `seconds`, e.g. after a 429 response,
+        so every worker backs off together instead of each sleeping on its own.
+
+        Args:
+            seconds (float): How long to pause.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = 0
+            self._paused_until = max(self._paused_until, now + seconds)
+
+
+# Global limiter honoring the site's published rate policy
+RATE_LIMITER = TokenBucket(REQUESTS_PER_MINUTE / 60, RATE_LIMIT_BURST)
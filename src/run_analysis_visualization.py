@@ -1,26 +1,46 @@
-import pandas as pd
+import argparse
+from artifact_manifest import ARTIFACT_MANIFEST
 from analyze_data import (
     descriptive_statistics,
     correlation_analysis,
     playoff_vs_non_playoff_comparison,
+    hypothesis_tests,
 )
-from visualize_results import (
-    visualize_correlation_matrices,
-    visualize_playoff_comparison,
-)
+from export_csv import export_to_csv, read_frame
+from instrumentation import INSTRUMENTATION
+
+COMBINED_CSV = "qb_combined_stats_with_playoff_status.csv"
+
 
+@INSTRUMENTATION.timed("load")
+def load_data(file_path=COMBINED_CSV):
+    """
+    Loads the combined QB stats and replaces missing / infinite TD to INT ratios with 0.
 
-def main():
-    # Load data
-    file_path = "qb_combined_stats_with_playoff_status.csv"
-    data = pd.read_csv(file_path)
+    Args:
+        file_path (str): Path of the combined stats export (any format, see export_csv.read_frame).
+
+    Returns:
+        pd.DataFrame: Data ready for analysis and plotting.
+    """
+    # Load data from the fastest up-to-date export (Feather / Parquet / CSV)
+    data = read_frame(file_path)
 
     # Handle missing and infinite values
     data.fillna({"Passing TD to INT Ratio": 0}, inplace=True)
     data["Passing TD to INT Ratio"] = data["Passing TD to INT Ratio"].replace(
         [float("inf"), -float("inf")], 0
     )
+    return data
+
+
+def analyze(data):
+    """
+    Computes the descriptive statistics and playoff tests and exports them to CSV.
 
+    Args:
+        data (pd.DataFrame): Data from load_data.
+    """
     # Descriptive Statistics
     stats_csv = "descriptive_stats.csv"
     stats = descriptive_statistics(data, csv_filename=stats_csv)
@@ -31,17 +51,53 @@ def main():
     print("\nMean statistics by year:")
     print(stats.filter(like="_mean", axis=1))
 
-    # Correlation Analysis
-    correlations = correlation_analysis(data)
-    visualize_correlation_matrices(correlations)
-
     # Playoff vs Non-Playoff Comparison
     playoff_results = playoff_vs_non_playoff_comparison(data)
     for metric, (t_stat, p_value) in playoff_results.items():
         print(f"{metric}: t_stat={t_stat:.3f}, p_value={p_value:.3f}")
 
+    # Welch, permutation and bootstrap tests of every metric with multiple-comparison correction
+    tests = hypothesis_tests(data)
+    print("\nResampling tests (Playoff - Eliminated):")
+    print(tests.round(4))
+    export_to_csv(tests.reset_index(), "hypothesis_tests.csv")
+
+
+def plot(data, facet=False):
+    """
+    Draws the per-year correlation heatmaps and the playoff comparison boxplots.
+
+    Args:
+        data (pd.DataFrame): Data from load_data.
+        facet (bool): Draw each group of figures into a single file.
+    """
+    # matplotlib and seaborn take most of the start-up time, so only plotting loads them
+    from visualize_results import visualize_correlation_matrices, visualize_playoff_comparison
+
+    # Correlation Analysis
+    correlations = correlation_analysis(data)
+    visualize_correlation_matrices(correlations, facet=facet)
+
     # Visualize playoff comparisons
-    visualize_playoff_comparison(data)
+    visualize_playoff_comparison(data, facet=facet)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analyze and plot the combined QB stats.")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate every CSV and figure even if its inputs are unchanged.",
+    )
+    args = parser.parse_args(argv)
+    ARTIFACT_MANIFEST.force = args.force
+
+    data = load_data()
+    analyze(data)
+    plot(data)
+
+    INSTRUMENTATION.print_summary()
+    INSTRUMENTATION.close()
 
 
 if __name__ == "__main__":
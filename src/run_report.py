@@ -0,0 +1,60 @@
+from collections import Counter
+
+
+class RunReport:
+    """
+    Tracks how many times each URL was fetched (successfully or not) and
+    parsed during a run.
+    """
+
+    def __init__(self):
+        self.fetched = Counter()
+        self.failed = Counter()
+        self.parsed = Counter()
+        self.cache_hits = Counter()
+
+    def record_fetch(self, url, from_cache=False):
+        self.fetched[url] += 1
+        if from_cache:
+            self.cache_hits[url] += 1
+
+    def record_failure(self, url):
+        self.failed[url] += 1
+
+    def record_parse(self, url):
+        self.parsed[url] += 1
+
+    def duplicates(self):
+        """
+        Returns:
+            list: URLs that were requested (counting failed fetches) or parsed more than once.
+        """
+        urls = set(self.fetched) | set(self.failed) | set(self.parsed)
+        return sorted(
+            url
+            for url in urls
+            if self.fetched[url] + self.failed[url] > 1 or self.parsed[url] > 1
+        )
+
+    def reset(self):
+        self.fetched.clear()
+        self.failed.clear()
+        self.parsed.clear()
+        self.cache_hits.clear()
+
+    def print_report(self):
+        """
+        Prints fetch/parse counts per URL and whether each happened exactly once.
+        """
+        print("\n--- Run Report ---")
+        for url in sorted(set(self.fetched) | set(self.failed) | set(self.parsed)):
+            source = "cache" if self.cache_hits[url] else "network"
+            failed = f", failed {self.failed[url]}x" if self.failed[url] else ""
+            print(
+                f"{url}: fetched {self.fetched[url]}x ({source}){failed}, parsed {self.parsed[url]}x"
+            )
+        duplicates = self.duplicates()
+        if duplicates:
+            print(f"WARNING: {len(duplicates)} URL(s) were fetched or parsed more than once.")
+        else:
+            print("Every URL was fetched and parsed exactly once.")
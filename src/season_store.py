@@ -0,0 +1,120 @@
+import os
+import time
+from config import STORE_DIR, CURRENT_SEASON_TTL
+from page_cache import current_season, season_close
+from page_schema import apply_schema
+from instrumentation import INSTRUMENTATION
+
+
+class SeasonStore:
+    """
+    Persistent columnar store of the combined QB stats, partitioned by season.
+
+    Each season is one Parquet file under store_dir/Year=<year>/, written to a
+    temporary file and renamed into place so readers never see a partial
+    partition. A closed season's partition goes stale only if it was written
+    before the season closed (it may hold partial stats); the current
+    season's partition is refreshed once it is older than CURRENT_SEASON_TTL.
+    """
+
+    def __init__(self, store_dir=STORE_DIR, ttl=CURRENT_SEASON_TTL):
+        self.store_dir = store_dir
+        self.ttl = ttl
+
+    def _partition_path(self, year):
+        return os.path.join(self.store_dir, f"Year={year}", "part.parquet")
+
+    def years(self):
+        """
+        Returns:
+            list: Sorted seasons that have a stored partition.
+        """
+        if not os.path.isdir(self.store_dir):
+            return []
+        years = []
+        for name in os.listdir(self.store_dir):
+            if name.startswith("Year=") and name[5:].isdigit():
+                if os.path.exists(self._partition_path(int(name[5:]))):
+                    years.append(int(name[5:]))
+        return sorted(years)
+
+    def modified(self, year):
+        """
+        Args:
+            year (int): Stored season year.
+
+        Returns:
+            float: Modification time of the season's partition (seconds since the epoch).
+        """
+        return os.path.getmtime(self._partition_path(year))
+
+    def is_stale(self, year):
+        """
+        Checks whether a season's partition is missing or out of date.
+
+        Args:
+            year (int): Season year.
+
+        Returns:
+            bool: True if the season needs to be scraped again.
+        """
+        path = self._partition_path(year)
+        if not os.path.exists(path):
+            return True
+        if year < current_season():
+            return self.modified(year) < season_close(year)
+        return time.time() - self.modified(year) >= self.ttl
+
+    def stale_years(self, years):
+        """
+        Args:
+            years (list): Seasons to check.
+
+        Returns:
+            list: Sorted seasons among years that are missing or stale.
+        """
+        return [year for year in sorted(set(years)) if self.is_stale(year)]
+
+    def write(self, df):
+        """
+        Replaces the partitions of every season present in a DataFrame.
+
+        Args:
+            df (pd.DataFrame): Combined stats with a "Year" column.
+        """
+        for year, season_df in df.groupby("Year", sort=True, observed=True):
+            path = self._partition_path(int(year))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with INSTRUMENTATION.stage("store_write", year=int(year), rows=len(season_df)):
+                season_df.reset_index(drop=True).to_parquet(
+                    tmp_path, engine="pyarrow", index=False
+                )
+            os.replace(tmp_path, path)
+            print(f"Stored {len(season_df)} rows for season {year}")
+
+    @INSTRUMENTATION.timed("store_read")
+    def read(self, years=None, columns=None):
+        """
+        Loads stored seasons, reading only the requested partitions.
+
+        Args:
+            years (list, optional): Seasons to load. Defaults to every stored season.
+            columns (list, optional): Columns to load. Defaults to all columns.
+
+        Returns:
+            pd.DataFrame or None: Stats for the stored seasons among years, in year
+                                  order, or None if none of them are stored.
+        """
+        import pandas as pd
+
+        stored = set(self.years())
+        years = sorted(stored if years is None else stored.intersection(years))
+        if not years:
+            return None
+
+        frames = [
+            pd.read_parquet(self._partition_path(year), engine="pyarrow", columns=columns)
+            for year in years
+        ]
+        return apply_schema(pd.concat(frames, ignore_index=True))
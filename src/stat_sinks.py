@@ -0,0 +1,236 @@
+import os
+import pandas as pd
+from artifact_manifest import ARTIFACT_MANIFEST, fingerprint
+from instrumentation import INSTRUMENTATION
+from page_schema import apply_schema
+
+
+class FrameSink:
+    """
+    Collects row batches into one DataFrame.
+    """
+
+    def __init__(self):
+        self.batches = []
+
+    def write(self, batch):
+        self.batches.append(batch)
+
+    def close(self):
+        """
+        Returns:
+            pd.DataFrame or None: Every batch in order, typed as by apply_schema
+                                  (None if no batch was written).
+        """
+        if not self.batches:
+            return None
+        if len(self.batches) == 1:
+            return self.batches[0]
+        # Batches have their own categories, so re-apply the schema after concatenating
+        return apply_schema(pd.concat(self.batches, ignore_index=True))
+
+
+class _FileSink:
+    """
+    Appends row batches to a temporary file and renames it over path on
+    close, as export_csv does, so readers never see a partial file. The
+    written file is recorded in the artifact manifest under a fingerprint of
+    its batches.
+    """
+
+    def __init__(self, path, manifest=ARTIFACT_MANIFEST):
+        self.path = path
+        self.manifest = manifest
+        self.tmp_path = f"{path}.tmp"
+        self.rows = 0
+        self._digests = []
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def write(self, batch):
+        with INSTRUMENTATION.stage("sink_write", path=self.path, rows=len(batch)):
+            self._append(batch)
+        self.rows += len(batch)
+        if self.manifest is not None:
+            self._digests.append(fingerprint("frame", batch.reset_index(drop=True)))
+
+    def _append(self, batch):
+        raise NotImplementedError
+
+    def _finish(self):
+        pass
+
+    def close(self):
+        """
+        Returns:
+            str or None: Path of the written file (None if no batch was written).
+        """
+        self._finish()
+        if not os.path.exists(self.tmp_path):
+            return None
+        os.replace(self.tmp_path, self.path)
+        print(f"Data exported to {self.path} ({self.rows} rows)")
+        if self.manifest is not None:
+            self.manifest.record(self.path, fingerprint("batches", self._digests))
+        return self.path
+
+    def abort(self):
+        """
+        Drops the partially written file.
+        """
+        self._finish()
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+
+class CsvSink(_FileSink):
+    """
+    Writes row batches to one CSV file, with the header from the first batch.
+    """
+
+    extension = "csv"
+
+    def _append(self, batch):
+        first = not os.path.exists(self.tmp_path)
+        batch.to_csv(self.tmp_path, mode="w" if first else "a", header=first, index=False)
+
+
+class ParquetSink(_FileSink):
+    """
+    Writes row batches to one Parquet file, one row group per batch.
+
+    Categorical columns are stored as their values, since every batch has its
+    own categories but the file has a single schema (taken from the first batch).
+    """
+
+    extension = "parquet"
+
+    def __init__(self, path, manifest=ARTIFACT_MANIFEST):
+        super().__init__(path, manifest)
+        self._writer = None
+
+    def _append(self, batch):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        batch = batch.astype(
+            {
+                column: batch[column].cat.categories.dtype
+                for column in batch.columns
+                if isinstance(batch[column].dtype, pd.CategoricalDtype)
+            }
+        )
+        if self._writer is None:
+            schema = pa.Schema.from_pandas(batch, preserve_index=False)
+            # A column that is empty in the first batch holds text in later ones
+            for i, field in enumerate(schema):
+                if pa.types.is_null(field.type):
+                    schema = schema.set(i, field.with_type(pa.string()))
+            self._writer = pq.ParquetWriter(self.tmp_path, schema)
+        self._writer.write_table(pa.Table.from_pandas(batch, schema=self._writer.schema, preserve_index=False))
+
+    def _finish(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class AggregateSink:
+    """
+    Keeps running totals instead of rows: the row count and the sum of every
+    numeric column per group, so memory grows with the number of groups only.
+
+    Args:
+        by (str or list): Column(s) to group by, e.g. "Year" or ["Year", "Team"].
+        columns (list, optional): Columns to sum. Defaults to every numeric column.
+    """
+
+    def __init__(self, by="Year", columns=None):
+        self.by = [by] if isinstance(by, str) else list(by)
+        self.columns = columns
+        self.totals = None
+
+    def write(self, batch):
+        columns = self.columns or [
+            column
+            for column in batch.select_dtypes("number").columns
+            if column not in self.by
+        ]
+        # Sum in 64 bits: the storage types (e.g. Int8) only hold one player's season
+        values = batch[self.by].join(
+            batch[columns].astype({c: "Float64" if batch[c].dtype.kind == "f" else "Int64" for c in columns})
+        )
+        groups = values.groupby(self.by, observed=True)
+        totals = groups[columns].sum().assign(rows=groups.size().astype("Int64"))
+        self.totals = totals if self.totals is None else self.totals.add(totals, fill_value=0)
+
+    def close(self):
+        """
+        Returns:
+            pd.DataFrame or None: "rows" and the column sums per group.
+        """
+        return self.totals
+
+
+# Sinks by name, for callers choosing them from configuration
+SINKS = {
+    "frame": FrameSink,
+    "csv": CsvSink,
+    "parquet": ParquetSink,
+    "aggregate": AggregateSink,
+}
+
+
+def make_sinks(names, prefix):
+    """
+    Builds sinks by SINKS name; file sinks write to prefix plus their extension.
+
+    Args:
+        names (iterable): SINKS names, e.g. ("csv", "aggregate").
+        prefix (str): Output path without extension, e.g. "qb_pass_stats".
+
+    Returns:
+        list: One new sink per name.
+    """
+    sinks = []
+    for name in names:
+        if name not in SINKS:
+            raise ValueError(f"Unsupported sink: {name} (choose from {', '.join(SINKS)})")
+        sink_class = SINKS[name]
+        extension = getattr(sink_class, "extension", None)
+        sinks.append(sink_class(f"{prefix}.{extension}") if extension else sink_class())
+    return sinks
+
+
+def drain(batches, sinks):
+    """
+    Feeds every batch to its sinks and closes them.
+
+    Batches are pulled one at a time and only after every sink has taken the
+    previous one, so a slow sink (e.g. a file on a slow disk) holds back the
+    generator producing them and at most one batch is in flight. If a batch
+    fails, file sinks drop their partial files.
+
+    Args:
+        batches (iterable): DataFrame batches, or (key, batch) pairs when sinks is a dict
+            (e.g. from get_data.stream_season_stats).
+        sinks (list or dict): Sinks receiving every batch, or key to list of sinks.
+
+    Returns:
+        list or dict: The close() result of each sink, in the shape of sinks.
+    """
+    routed = sinks if isinstance(sinks, dict) else {None: sinks}
+    try:
+        for item in batches:
+            key, batch = item if isinstance(sinks, dict) else (None, item)
+            for sink in routed.get(key, ()):
+                sink.write(batch)
+    except BaseException:
+        for sink_list in routed.values():
+            for sink in sink_list:
+                if hasattr(sink, "abort"):
+                    sink.abort()
+        raise
+    results = {key: [sink.close() for sink in sink_list] for key, sink_list in routed.items()}
+    return results if isinstance(sinks, dict) else results[None]
@@ -0,0 +1,218 @@
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from config import STATS_CHUNK_ROWS
+
+# Metrics summarized by descriptive_statistics, in output column order
+DESCRIPTIVE_METRICS = [
+    "Passing Yards",
+    "Passing TDs",
+    "Interceptions",
+    "Rating",
+    "Rushing Yards",
+    "Rushing TDs",
+    "Total Yards",
+    "Total TDs",
+    "Passing TD to INT Ratio",
+]
+
+STATISTICS = ["mean", "std", "min", "max"]
+
+
+class GroupAccumulator:
+    """
+    Mergeable per-group summary of numeric columns: count, mean, sum of squared
+    deviations (M2), min and max for every group and metric.
+
+    Chunks are folded in with the parallel form of Welford's update (Chan et
+    al.), so accumulators built from different chunks or by different workers
+    can be merged in any order without revisiting the rows.
+    """
+
+    def __init__(self, metrics=DESCRIPTIVE_METRICS, by="Year"):
+        self.metrics = list(metrics)
+        self.by = by
+        self.count = None
+        self.mean = None
+        self.m2 = None
+        self.min = None
+        self.max = None
+        self.integer = {metric: True for metric in self.metrics}
+
+    def _set(self, count, mean, m2, minimum, maximum):
+        self.count, self.mean, self.m2, self.min, self.max = count, mean, m2, minimum, maximum
+
+    def update(self, chunk):
+        """
+        Folds a chunk of rows into the accumulator.
+
+        Args:
+            chunk (pd.DataFrame): Rows with the group column and every metric.
+
+        Returns:
+            GroupAccumulator: self, for chaining.
+        """
+        for metric in self.metrics:
+            if not pd.api.types.is_integer_dtype(chunk[metric].dtype):
+                self.integer[metric] = False
+        values = chunk[self.metrics].astype("float64")
+        grouped = values.groupby(chunk[self.by].to_numpy())
+        count = grouped.count().astype("float64")
+        mean = grouped.mean()
+        m2 = grouped.var(ddof=0) * count
+        other = GroupAccumulator(self.metrics, self.by)
+        other._set(count, mean, m2, grouped.min(), grouped.max())
+        return self.merge(other)
+
+    def merge(self, other):
+        """
+        Merges another accumulator (e.g. from a parallel worker) into this one.
+
+        Args:
+            other (GroupAccumulator): Accumulator over the same metrics.
+
+        Returns:
+            GroupAccumulator: self, for chaining.
+        """
+        for metric in self.metrics:
+            self.integer[metric] = self.integer[metric] and other.integer[metric]
+        if other.count is None:
+            return self
+        if self.count is None:
+            self._set(other.count, other.mean, other.m2, other.min, other.max)
+            return self
+
+        groups = self.count.index.union(other.count.index)
+
+        def aligned(frame):
+            return frame.reindex(groups).to_numpy()
+
+        n_a, n_b = np.nan_to_num(aligned(self.count)), np.nan_to_num(aligned(other.count))
+        mean_a, mean_b = np.nan_to_num(aligned(self.mean)), np.nan_to_num(aligned(other.mean))
+        m2_a, m2_b = np.nan_to_num(aligned(self.m2)), np.nan_to_num(aligned(other.m2))
+        n = n_a + n_b
+        with np.errstate(divide="ignore", invalid="ignore"):
+            delta = mean_b - mean_a
+            mean = np.where(n > 0, mean_a + delta * n_b / n, np.nan)
+            m2 = np.where(n > 0, m2_a + m2_b + delta**2 * n_a * n_b / n, np.nan)
+
+        def frame(array):
+            return pd.DataFrame(array, index=groups, columns=self.metrics)
+
+        self._set(
+            frame(n),
+            frame(mean),
+            frame(m2),
+            frame(np.fmin(aligned(self.min), aligned(other.min))),
+            frame(np.fmax(aligned(self.max), aligned(other.max))),
+        )
+        return self
+
+    def result(self):
+        """
+        Returns:
+            pd.DataFrame: Per-group mean, std (ddof=1), min and max, rounded to 2
+                          decimals, with flattened "<metric>_<stat>" columns and
+                          the group column as a sorted index.
+        """
+        if self.count is None:
+            columns = [f"{metric}_{stat}" for metric in self.metrics for stat in STATISTICS]
+            return pd.DataFrame(columns=columns, index=pd.Index([], name=self.by))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            std = np.sqrt(self.m2 / (self.count - 1)).where(self.count > 1)
+        stats = {"mean": self.mean, "std": std, "min": self.min, "max": self.max}
+
+        columns = {}
+        for metric in self.metrics:
+            for stat in STATISTICS:
+                column = stats[stat][metric]
+                # Integer metrics keep integer extremes, like DataFrame.agg
+                if stat in ("min", "max") and self.integer[metric] and column.notna().all():
+                    column = column.astype("int64")
+                columns[f"{metric}_{stat}"] = column
+        result = pd.DataFrame(columns).sort_index().round(2)
+        result.index.name = self.by
+        return result
+
+
+def iter_chunks(source, columns, chunksize=STATS_CHUNK_ROWS):
+    """
+    Reads a CSV or Parquet file (or walks a DataFrame) in bounded chunks.
+
+    Args:
+        source (str or pd.DataFrame): .csv / .parquet path, or an in-memory DataFrame.
+        columns (list): Columns to read.
+        chunksize (int): Rows per chunk.
+
+    Yields:
+        pd.DataFrame: Successive chunks of the requested columns.
+    """
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), chunksize):
+            yield source.iloc[start:start + chunksize][columns]
+    elif str(source).endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(source).iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(source, usecols=columns, chunksize=chunksize)
+
+
+def accumulate(source, metrics=DESCRIPTIVE_METRICS, by="Year", chunksize=STATS_CHUNK_ROWS):
+    """
+    Builds a GroupAccumulator over one source, one chunk at a time.
+
+    Args:
+        source (str or pd.DataFrame): See iter_chunks.
+        metrics (list): Metric columns to summarize.
+        by (str): Group column.
+        chunksize (int): Rows per chunk.
+
+    Returns:
+        GroupAccumulator: Partial result for this source.
+    """
+    accumulator = GroupAccumulator(metrics, by)
+    for chunk in iter_chunks(source, [by] + list(metrics), chunksize):
+        accumulator.update(chunk)
+    return accumulator
+
+
+def streaming_descriptive_statistics(
+    sources, metrics=DESCRIPTIVE_METRICS, by="Year", chunksize=STATS_CHUNK_ROWS, workers=1
+):
+    """
+    Computes descriptive_statistics over files too large to load at once.
+
+    Each source is read in chunks into its own accumulator (in a process pool
+    when workers > 1) and the partial results are merged.
+
+    Args:
+        sources (str or list): Path(s) of CSV / Parquet files (e.g. season store partitions).
+        metrics (list): Metric columns to summarize.
+        by (str): Group column.
+        chunksize (int): Rows per chunk.
+        workers (int): Number of worker processes.
+
+    Returns:
+        pd.DataFrame: Same layout as analyze_data.descriptive_statistics.
+    """
+    if isinstance(sources, (str, pd.DataFrame)):
+        sources = [sources]
+    total = GroupAccumulator(metrics, by)
+    if workers > 1 and len(sources) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            partials = executor.map(
+                accumulate,
+                sources,
+                [metrics] * len(sources),
+                [by] * len(sources),
+                [chunksize] * len(sources),
+            )
+            for partial in partials:
+                total.merge(partial)
+    else:
+        for source in sources:
+            total.merge(accumulate(source, metrics, by, chunksize))
+    return total.result()
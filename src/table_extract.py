@@ -0,0 +1,219 @@
+import re
+from html.parser import HTMLParser
+from config import EXTRACT_BACKEND
+
+_TABLE_OPEN = re.compile(rb"<table\b[^>]*>", re.IGNORECASE)
+_TABLE_CLOSE = re.compile(rb"</table\s*>", re.IGNORECASE)
+_ATTR = re.compile(rb"""([\w:-]+)\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+))""")
+
+
+class ExtractedTable:
+    """
+    Column-oriented contents of one HTML table.
+
+    Attributes:
+        header (list): (data-stat, label) pairs of the last header row's <th> cells.
+        th (list): Text of the first <th> cell of each body row, or None.
+        columns (list): One list per <td> position holding that cell's text for
+            every body row (None where the row has fewer cells).
+        widths (list): Number of <td> cells in each body row.
+        stats (list): data-stat attribute of each <td> position, taken from the
+            first row that has the cell.
+        links (list): First link inside the <td> cells of each body row, or None.
+    """
+
+    def __init__(self):
+        self.header = []
+        self.th = []
+        self.columns = []
+        self.widths = []
+        self.stats = []
+        self.links = []
+
+    def __len__(self):
+        return len(self.widths)
+
+    def _add_row(self, th_text, cells, stats, link):
+        n = len(self.widths)
+        for i, text in enumerate(cells):
+            if i == len(self.columns):
+                self.columns.append([None] * n)
+                self.stats.append(stats[i])
+            self.columns[i].append(text)
+        for column in self.columns[len(cells):]:
+            column.append(None)
+        self.th.append(th_text)
+        self.widths.append(len(cells))
+        self.links.append(link)
+
+
+class _TableTokenizer(HTMLParser):
+    """
+    Tokenizes a single <table>...</table> fragment straight into an ExtractedTable.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.table = ExtractedTable()
+        self._in_thead = False
+        self._row = None
+        self._cell = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "thead":
+            self._in_thead = True
+        elif tag == "tr":
+            # <tr> and <td> end tags are optional in HTML
+            self._end_row()
+            self._row = {"th": None, "cells": [], "stats": [], "header": [], "link": None}
+        elif tag in ("td", "th") and self._row is not None:
+            self._end_cell()
+            self._cell = {"tag": tag, "text": [], "stat": dict(attrs).get("data-stat")}
+        elif tag == "a" and self._cell is not None and self._cell["tag"] == "td":
+            if self._row["link"] is None:
+                self._row["link"] = dict(attrs).get("href")
+
+    def handle_endtag(self, tag):
+        if tag in ("td", "th"):
+            self._end_cell()
+        elif tag == "tr":
+            self._end_row()
+        elif tag in ("thead", "tbody", "table"):
+            self._end_row()
+            if tag == "thead":
+                self._in_thead = False
+
+    def _end_cell(self):
+        if self._cell is None:
+            return
+        text = "".join(self._cell["text"])
+        if self._cell["tag"] == "td":
+            self._row["cells"].append(text)
+            self._row["stats"].append(self._cell["stat"])
+        else:
+            if self._row["th"] is None:
+                self._row["th"] = text
+            self._row["header"].append((self._cell["stat"], text.strip()))
+        self._cell = None
+
+    def _end_row(self):
+        if self._row is None:
+            return
+        self._end_cell()
+        row, self._row = self._row, None
+        # Header rows: inside <thead>, or the leading <th>-only row of a table without one
+        first_row = not self.table.header and not len(self.table)
+        if self._in_thead or (first_row and not row["cells"]):
+            self.table.header = row["header"]
+        else:
+            self.table._add_row(row["th"], row["cells"], row["stats"], row["link"])
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell["text"].append(data)
+
+
+def _attrs(tag):
+    return {
+        m.group(1).decode().lower(): (m.group(2) or m.group(3) or m.group(4) or b"").decode()
+        for m in _ATTR.finditer(tag)
+    }
+
+
+def _in_comment(content, pos):
+    return content.rfind(b"<!--", 0, pos) > content.rfind(b"-->", 0, pos)
+
+
+def _find_table_fragments(content, table_id=None, table_class=None):
+    for match in _TABLE_OPEN.finditer(content):
+        attrs = _attrs(match.group(0))
+        if table_id is not None and attrs.get("id") != table_id:
+            continue
+        if table_class is not None and table_class not in attrs.get("class", "").split():
+            continue
+        # Tables commented out in the page source are not part of the document
+        if _in_comment(content, match.start()):
+            continue
+        close = _TABLE_CLOSE.search(content, match.end())
+        end = close.end() if close else len(content)
+        yield content[match.start():end]
+
+
+def _extract_stream(content, table_id=None, table_class=None):
+    fragment = next(_find_table_fragments(content, table_id, table_class), None)
+    if fragment is None:
+        return None
+    tokenizer = _TableTokenizer()
+    tokenizer.feed(fragment.decode("utf-8", errors="replace"))
+    tokenizer.close()
+    tokenizer._end_row()
+    return tokenizer.table
+
+
+def _extract_bs4(content, table_id=None, table_class=None):
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(content, "html.parser")
+    kwargs = {}
+    if table_id is not None:
+        kwargs["id"] = table_id
+    if table_class is not None:
+        kwargs["class_"] = table_class
+    element = soup.find("table", **kwargs)
+    if element is None:
+        return None
+
+    table = ExtractedTable()
+    rows = element.find_all("tr")
+    thead = element.find("thead")
+    for row in rows:
+        if thead is not None and row.find_parent("thead") is thead:
+            table.header = [(th.get("data-stat"), th.text.strip()) for th in row.find_all("th")]
+            continue
+        if thead is None and not table.header and not len(table) and not row.find("td"):
+            table.header = [(th.get("data-stat"), th.text.strip()) for th in row.find_all("th")]
+            continue
+        th = row.find("th")
+        tds = row.find_all("td")
+        link = None
+        for td in tds:
+            anchor = td.find("a")
+            if anchor is not None:
+                link = anchor.get("href")
+                break
+        table._add_row(
+            th.text if th is not None else None,
+            [td.text for td in tds],
+            [td.get("data-stat") for td in tds],
+            link,
+        )
+    return table
+
+
+BACKENDS = {
+    "stream": _extract_stream,
+    "bs4": _extract_bs4,
+}
+
+
+def extract_table(content, table_id=None, table_class=None, backend=EXTRACT_BACKEND):
+    """
+    Extracts the first table matching an id and/or class from a page.
+
+    The default "stream" backend locates the target <table> in the raw bytes and
+    tokenizes only that fragment, emitting cells straight into column arrays
+    instead of building a tree for the whole page. The "bs4" backend builds a
+    full BeautifulSoup tree and is kept as the reference implementation.
+
+    Args:
+        content (bytes): Raw page body.
+        table_id (str, optional): id attribute of the table.
+        table_class (str, optional): One of the table's classes.
+        backend (str): Key of BACKENDS to use.
+
+    Returns:
+        ExtractedTable or None: The table contents, or None if no table matches.
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return BACKENDS[backend](content, table_id=table_id, table_class=table_class)
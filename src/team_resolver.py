@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+from config import FRANCHISE_IDS, TEAM_NAME_MAPPING, TEAM_SEASON_ALIASES
+
+# Franchise code of players listed with several teams in a season ("2TM") or with no team
+NO_TEAM = -1
+
+
+class TeamResolver:
+    """
+    Resolves team abbreviations and names to integer franchise IDs.
+
+    The franchise table is built once from a name mapping (alias to current
+    franchise name, or None for "several teams" codes such as "2TM") and
+    season aliases for codes the site has reused after a franchise moved
+    (e.g. "HOU" is the Oilers, now the Titans, until 1996 and the Texans from
+    2002). Franchise IDs are fixed in config.FRANCHISE_IDS, since they are
+    stored in checkpoints; they must run from 0 without gaps. Names that are
+    neither an alias nor a franchise get the ID of the "Unknown" label, which
+    comes after every franchise (it is never stored). Whole columns are
+    resolved in one call: each distinct name is looked up once and the result
+    is broadcast through its categorical codes.
+    """
+
+    def __init__(
+        self, mapping=TEAM_NAME_MAPPING, season_aliases=TEAM_SEASON_ALIASES, franchise_ids=FRANCHISE_IDS
+    ):
+        if sorted(franchise_ids.values()) != list(range(len(franchise_ids))):
+            raise ValueError("Franchise IDs must run from 0 to the number of franchises - 1 without repeats.")
+        franchises = {name for name in mapping.values() if name}
+        franchises.update(franchise for ranges in season_aliases.values() for _, _, franchise in ranges)
+        missing = sorted(franchises - set(franchise_ids))
+        if missing:
+            raise ValueError(f"Franchises without an ID in FRANCHISE_IDS: {missing}")
+        self.ids = dict(franchise_ids)
+        # Franchise names by ID
+        self.franchises = sorted(self.ids, key=self.ids.get)
+        self.unknown = len(self.franchises)
+        # Labels of the franchise IDs, for Categorical.from_codes
+        self.labels = self.franchises + ["Unknown"]
+
+        # Every franchise name resolves to itself
+        self.aliases = dict(self.ids)
+        for alias, name in mapping.items():
+            self.aliases[alias] = self.ids[name] if name else NO_TEAM
+        self.season_aliases = {
+            alias: [(first, last, self.ids[franchise]) for first, last, franchise in ranges]
+            for alias, ranges in season_aliases.items()
+        }
+
+    def codes(self, names, years=None):
+        """
+        Resolves a column of team names to franchise IDs.
+
+        Args:
+            names (array-like): Team abbreviations or names.
+            years (int or array-like, optional): Season of every name (or of all
+                of them). Season aliases are ignored without it.
+
+        Returns:
+            tuple: (codes, unknown) with codes an int16 NumPy array of franchise
+                   IDs (NO_TEAM for multi-team rows and missing names) and
+                   unknown the sorted names that resolved to "Unknown".
+        """
+        names = pd.Categorical(names)
+        categories = names.categories.astype(str)
+        # One lookup per distinct name; the extra last slot is what code -1 (a missing name) picks
+        lookup = np.array(
+            [self.aliases.get(name, self.unknown) for name in categories] + [NO_TEAM], dtype="int16"
+        )
+        codes = lookup[names.codes]
+
+        if years is not None:
+            years = np.broadcast_to(np.asarray(years, dtype="int64"), codes.shape)
+            for alias, ranges in self.season_aliases.items():
+                position = categories.get_indexer([alias])[0]
+                if position < 0:
+                    continue
+                rows = names.codes == position
+                for first, last, franchise in ranges:
+                    codes[rows & (years >= first) & (years <= last)] = franchise
+
+        unknown = sorted(categories[lookup[:-1] == self.unknown])
+        return codes, unknown
+
+    def names(self, codes):
+        """
+        Args:
+            codes (array-like): Franchise IDs from codes().
+
+        Returns:
+            pd.Categorical: Current franchise names ("Unknown" for unknown IDs,
+                            missing for NO_TEAM), with every label as a category.
+        """
+        return pd.Categorical.from_codes(np.asarray(codes), categories=self.labels)
+
+    def franchise_codes(self, names):
+        """
+        Franchise IDs of a column of already resolved franchise names, e.g. a
+        "Standardized Team" column read back from a CSV.
+
+        Args:
+            names (pd.Series): Franchise names or a categorical from names().
+
+        Returns:
+            np.ndarray: int16 franchise IDs (NO_TEAM where missing or not a label).
+        """
+        if isinstance(names.dtype, pd.CategoricalDtype) and list(names.cat.categories) == self.labels:
+            return names.cat.codes.to_numpy("int16")
+        return pd.Categorical(names.astype(object), categories=self.labels).codes.astype("int16")
+
+
+# Shared resolver built from config.TEAM_NAME_MAPPING and config.FRANCHISE_IDS
+TEAM_RESOLVER = TeamResolver()
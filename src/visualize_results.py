@@ -1,42 +1,251 @@
+import math
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
 import matplotlib.pyplot as plt
 import seaborn as sns
+from config import PLOT_WORKERS, PLOT_BACKEND
+from artifact_manifest import ARTIFACT_MANIFEST, fingerprint
+from instrumentation import INSTRUMENTATION
 
+# One figure to render: the plot kind (key of RENDERERS), output path, title,
+# figure size, the data to plot and keyword options for the plot call.
+FigureSpec = namedtuple("FigureSpec", ["kind", "path", "title", "figsize", "data", "options"])
 
-def visualize_correlation_matrices(correlation_by_year):
+PLAYOFF_METRICS = [
+    "Passing Yards",
+    "Passing TDs",
+    "Total Yards",
+    "Total TDs",
+    "4QC",
+    "GWD",
+    "Passing TD to INT Ratio",
+    "Rating",
+]
+
+# Figures kept open per worker, keyed by (kind, figsize), so each worker
+# creates one figure per shape and redraws it for every spec.
+_FIGURES = {}
+
+
+def _draw_heatmap(ax, data, options):
+    sns.heatmap(data, ax=ax, **options)
+
+
+def _draw_boxplot(ax, data, options):
+    sns.boxplot(data=data, ax=ax, **options)
+
+
+RENDERERS = {
+    "heatmap": _draw_heatmap,
+    "boxplot": _draw_boxplot,
+}
+
+
+def correlation_specs(correlation_by_year):
+    """
+    Builds one heatmap spec per year.
+
+    Args:
+        correlation_by_year (dict): Dictionary of correlation matrices by year.
+
+    Returns:
+        list: FigureSpec for each year, in dictionary order.
+    """
+    return [
+        FigureSpec(
+            "heatmap",
+            f"correlation_matrix_{year}.png",
+            f"Correlation Matrix for {year}",
+            (10, 8),
+            matrix,
+            {"annot": True, "fmt": ".2f", "cmap": "coolwarm", "cbar": True},
+        )
+        for year, matrix in correlation_by_year.items()
+    ]
+
+
+def playoff_comparison_specs(data, metrics=PLAYOFF_METRICS):
+    """
+    Builds one boxplot spec per metric, carrying only the two columns it plots.
+
+    Args:
+        data (pd.DataFrame): Dataset containing the metrics and playoff status.
+        metrics (list): Metrics to compare.
+
+    Returns:
+        list: FigureSpec for each metric.
+    """
+    return [
+        FigureSpec(
+            "boxplot",
+            f"{metric.lower().replace(' ', '_')}_comparison.png",
+            f"{metric} Comparison: Playoff vs Non-Playoff",
+            (8, 6),
+            data[["Playoff Status", metric]],
+            {"x": "Playoff Status", "y": metric},
+        )
+        for metric in metrics
+    ]
+
+
+def _init_worker(backend=PLOT_BACKEND):
+    plt.switch_backend(backend)
+
+
+def _render(spec):
+    """
+    Renders a spec onto this process's cached figure for its shape and saves it.
+    """
+    key = (spec.kind, spec.figsize)
+    fig = _FIGURES.get(key)
+    if fig is None or not plt.fignum_exists(fig.number):
+        fig = plt.figure(figsize=spec.figsize)
+        _FIGURES[key] = fig
+    if fig.axes and spec.kind != "heatmap":
+        ax = fig.axes[0]
+        ax.clear()
+    else:
+        # A heatmap's colorbar takes space from its axes, so start from a clean figure
+        fig.clf()
+        ax = fig.add_subplot()
+    RENDERERS[spec.kind](ax, spec.data, spec.options)
+    ax.set_title(spec.title)
+    fig.savefig(spec.path)
+    return spec.path
+
+
+def _render_batch(specs):
+    return [_render(spec) for spec in specs]
+
+
+def _render_faceted(specs, path, title=None):
+    """
+    Renders all specs as panels of a single figure saved to path.
+    """
+    columns = math.ceil(math.sqrt(len(specs)))
+    rows = math.ceil(len(specs) / columns)
+    width, height = specs[0].figsize
+    fig, axes = plt.subplots(rows, columns, figsize=(width * columns, height * rows), squeeze=False)
+    for ax, spec in zip(axes.flat, specs):
+        RENDERERS[spec.kind](ax, spec.data, spec.options)
+        ax.set_title(spec.title)
+    for ax in axes.flat[len(specs):]:
+        ax.set_visible(False)
+    if title:
+        fig.suptitle(title)
+    # Leave room at the top for the overall title
+    fig.tight_layout(rect=(0, 0, 1, 0.97) if title else None)
+    fig.savefig(path)
+    plt.close(fig)
+    return [path]
+
+
+def _spec_fingerprint(spec):
+    return fingerprint(spec.kind, spec.title, spec.figsize, spec.options, spec.data)
+
+
+@INSTRUMENTATION.timed()
+def render_figures(
+    specs, workers=PLOT_WORKERS, facet_path=None, facet_title=None, manifest=ARTIFACT_MANIFEST
+):
+    """
+    Renders figure specs to PNG files.
+
+    Figures whose data and plot parameters match the manifest entry of their
+    output file are skipped (unless the manifest is forced). The rest are
+    split into one batch per worker and rendered in a process pool on a
+    non-interactive backend; each worker reuses one figure per plot shape
+    instead of creating a new pyplot figure for every spec. With one worker (or
+    one spec) everything is rendered in this process.
+
+    Args:
+        specs (list): FigureSpec objects to render.
+        workers (int): Number of worker processes.
+        facet_path (str, optional): Render every spec as a panel of a single
+            figure saved to this path instead of one file per spec.
+        facet_title (str, optional): Overall title of the faceted figure.
+        manifest (artifact_manifest.ArtifactManifest, optional): Manifest used to
+            skip unchanged figures. Every figure is rendered when None.
+
+    Returns:
+        list: Paths of the written files, in spec order.
+    """
+    if not specs:
+        return []
+
+    if facet_path:
+        digest = fingerprint(facet_title, [_spec_fingerprint(spec) for spec in specs])
+        if manifest is not None and manifest.is_current(facet_path, digest):
+            print(f"{facet_path} is up to date, skipping")
+            return []
+        paths = _render_faceted(specs, facet_path, facet_title)
+        if manifest is not None:
+            manifest.record(facet_path, digest)
+        return paths
+
+    digests = {spec.path: _spec_fingerprint(spec) for spec in specs}
+    if manifest is not None:
+        stale = [spec for spec in specs if not manifest.is_current(spec.path, digests[spec.path])]
+        if len(stale) < len(specs):
+            print(f"Skipping {len(specs) - len(stale)} unchanged figures")
+        specs = stale
+        if not specs:
+            return []
+
+    workers = max(1, min(workers, len(specs)))
+    if workers == 1:
+        try:
+            paths = _render_batch(specs)
+        finally:
+            for fig in _FIGURES.values():
+                plt.close(fig)
+            _FIGURES.clear()
+    else:
+        # Contiguous batches keep each worker on the same figure shape where possible
+        size = math.ceil(len(specs) / workers)
+        batches = [specs[i:i + size] for i in range(0, len(specs), size)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            paths = [path for paths in executor.map(_render_batch, batches) for path in paths]
+
+    if manifest is not None:
+        for path in paths:
+            manifest.record(path, digests[path])
+    return paths
+
+
+def visualize_correlation_matrices(correlation_by_year, facet=False, workers=PLOT_WORKERS):
     """
     Visualizes correlation matrices as heatmaps.
 
     Args:
         correlation_by_year (dict): Dictionary of correlation matrices by year.
+        facet (bool): Draw every year into a single correlation_matrices.png instead of one file per year.
+        workers (int): Number of worker processes used for rendering.
+
+    Returns:
+        list: Paths of the written files.
     """
-    for year, matrix in correlation_by_year.items():
-        plt.figure(figsize=(10, 8))
-        sns.heatmap(matrix, annot=True, fmt=".2f", cmap="coolwarm", cbar=True)
-        plt.title(f"Correlation Matrix for {year}")
-        plt.savefig(f"correlation_matrix_{year}.png")
-        plt.close()
+    specs = correlation_specs(correlation_by_year)
+    if facet:
+        return render_figures(specs, facet_path="correlation_matrices.png", facet_title="Correlation Matrices")
+    return render_figures(specs, workers)
 
 
-def visualize_playoff_comparison(data):
+def visualize_playoff_comparison(data, facet=False, workers=PLOT_WORKERS):
     """
     Creates boxplots for metrics comparing playoff vs non-playoff teams.
 
     Args:
         data (pd.DataFrame): Dataset containing the metrics and playoff status.
+        facet (bool): Draw every metric into a single playoff_comparison.png instead of one file per metric.
+        workers (int): Number of worker processes used for rendering.
+
+    Returns:
+        list: Paths of the written files.
     """
-    metrics = [
-        "Passing Yards",
-        "Passing TDs",
-        "Total Yards",
-        "Total TDs",
-        "4QC",
-        "GWD",
-        "Passing TD to INT Ratio",
-        "Rating",
-    ]
-    for metric in metrics:
-        plt.figure(figsize=(8, 6))
-        sns.boxplot(x="Playoff Status", y=metric, data=data)
-        plt.title(f"{metric} Comparison: Playoff vs Non-Playoff")
-        plt.savefig(f"{metric.lower().replace(' ', '_')}_comparison.png")
-        plt.close()
+    specs = playoff_comparison_specs(data)
+    if facet:
+        return render_figures(
+            specs, facet_path="playoff_comparison.png", facet_title="Playoff vs Non-Playoff"
+        )
+    return render_figures(specs, workers)